@@ -2,6 +2,7 @@ import torch
 import comfy.model_management
 import numpy as np
 from .nodes.latents.flex_latent_base import FlexLatentBase
+from .nodes.latents.latent_utils import slerp
 from .tooltips import apply_tooltips, TooltipManager
 
 class AudioLatentBlend:
@@ -16,7 +17,7 @@ class AudioLatentBlend:
                 "max": 1.0,
                 "step": 0.01
             }),
-            "blend_mode": (["normal", "add", "subtract", "multiply", "overlay"], {"default": "normal"}),
+            "blend_mode": (["normal", "slerp", "add", "subtract", "multiply", "overlay"], {"default": "normal"}),
         }}
 
     RETURN_TYPES = ("LATENT",)
@@ -53,6 +54,9 @@ class AudioLatentBlend:
         # Apply blend mode
         if blend_mode == "normal":
             blended = s1 * blend_factor + s2 * (1 - blend_factor)
+        elif blend_mode == "slerp":
+            # Same weighting as normal, along the arc between the two latents
+            blended = slerp(s2, s1, blend_factor)
         elif blend_mode == "add":
             blended = s1 + s2 * blend_factor
         elif blend_mode == "subtract":
@@ -92,7 +96,7 @@ class FlexlatentAudioBlend:
                 "forceInput": True,
                 "display": "numberlist"
             }),
-            "blend_mode": (["normal", "add", "subtract", "multiply", "overlay"], {"default": "normal"}),
+            "blend_mode": (["normal", "slerp", "add", "subtract", "multiply", "overlay"], {"default": "normal"}),
             "interpolation": (["linear", "step"], {"default": "linear"}),
         }}
 
@@ -230,6 +234,14 @@ class FlexlatentAudioBlend:
             print(f"Blend factor expanded shape: {blend_factor_expanded.shape}")
             print(f"Blend factor expanded stats - min: {blend_factor_expanded.min().item()}, max: {blend_factor_expanded.max().item()}, mean: {blend_factor_expanded.mean().item()}")
             blended = s1 * blend_factor_expanded + s2 * (1 - blend_factor_expanded)
+        elif blend_mode == "slerp":
+            # Interpolate each time step's (channels, height) column with its own factor
+            _, _, height, _ = s1.shape
+            columns1 = s1.permute(0, 3, 1, 2).reshape(-1, num_channels, height)
+            columns2 = s2.permute(0, 3, 1, 2).reshape(-1, num_channels, height)
+            column_factors = blend_factor_tensor.flatten().repeat(batch_size)
+            blended = slerp(columns2, columns1, column_factors)
+            blended = blended.reshape(batch_size, temporal_length, num_channels, height).permute(0, 2, 3, 1)
         elif blend_mode == "add":
             blend_factor_expanded = blend_factor_tensor.expand(target_shape)
             blended = s1 + s2 * blend_factor_expanded
@@ -6,7 +6,7 @@ import comfy.sampler_helpers
 import comfy.model_sampling
 import comfy.model_patcher
 import math
-from .ace_step_utils import ACEStepLatentUtils
+from .ace_step_utils import ACEStepLatentUtils, DeviceTensorCache
 from . import logger
 
 
@@ -337,8 +337,9 @@ class ACEStep15NativeEditGuider(comfy.samplers.CFGGuider):
         if self._wrapper_applied:
             return
 
-        chunk_masks = self.chunk_masks
-        src_latents = self.src_latents
+        # Placed once per device/dtype/CFG batch instead of on every model call
+        chunk_masks = DeviceTensorCache(self.chunk_masks)
+        src_latents = DeviceTensorCache(self.src_latents)
         reference_latent = self.reference_latent
 
         # Clear any existing wrapper to avoid stale closure values
@@ -351,11 +352,8 @@ class ACEStep15NativeEditGuider(comfy.samplers.CFGGuider):
 
             # Handle CFG batching
             input_batch_size = args["input"].shape[0]
-            cm = chunk_masks.to(device=device, dtype=dtype)
-            sl = src_latents.to(device=device, dtype=dtype)
-            if cm.shape[0] < input_batch_size:
-                cm = cm.repeat(input_batch_size, 1, 1)
-                sl = sl.repeat(input_batch_size, 1, 1)
+            cm = chunk_masks.get(device, dtype, input_batch_size)
+            sl = src_latents.get(device, dtype, input_batch_size)
 
             c["chunk_masks"] = cm
             c["src_latents"] = sl
@@ -494,9 +492,10 @@ class ACEStep15NativeCoverGuider(comfy.samplers.CFGGuider):
         if self._wrapper_applied:
             return
 
-        chunk_masks = self.chunk_masks
-        src_latents = self.src_latents
-        semantic_hints = self.semantic_hints
+        # Placed once per device/dtype/CFG batch instead of on every model call
+        chunk_masks = DeviceTensorCache(self.chunk_masks)
+        src_latents = DeviceTensorCache(self.src_latents)
+        semantic_hints = DeviceTensorCache(self.semantic_hints) if self.semantic_hints is not None else None
         reference_latent = self.reference_latent
 
         self.model_patcher.set_model_unet_function_wrapper(None)
@@ -507,11 +506,8 @@ class ACEStep15NativeCoverGuider(comfy.samplers.CFGGuider):
             dtype = args["input"].dtype
 
             input_batch_size = args["input"].shape[0]
-            cm = chunk_masks.to(device=device, dtype=dtype)
-            sl = src_latents.to(device=device, dtype=dtype)
-            if cm.shape[0] < input_batch_size:
-                cm = cm.repeat(input_batch_size, 1, 1)
-                sl = sl.repeat(input_batch_size, 1, 1)
+            cm = chunk_masks.get(device, dtype, input_batch_size)
+            sl = src_latents.get(device, dtype, input_batch_size)
 
             c["chunk_masks"] = cm
             c["src_latents"] = sl
@@ -519,9 +515,7 @@ class ACEStep15NativeCoverGuider(comfy.samplers.CFGGuider):
             # Set is_covers based on whether we have semantic hints
             if semantic_hints is not None:
                 # Proper cover: use semantic hints via is_covers=1
-                sh = semantic_hints.to(device=device, dtype=dtype)
-                if sh.shape[0] < input_batch_size:
-                    sh = sh.repeat(input_batch_size, 1, 1)
+                sh = semantic_hints.get(device, dtype, input_batch_size)
                 c["precomputed_lm_hints_25Hz"] = sh
                 c["is_covers"] = torch.ones((input_batch_size,), device=device, dtype=torch.long)
             else:
@@ -649,9 +643,10 @@ class ACEStep15NativeExtractGuider(comfy.samplers.CFGGuider):
         if self._wrapper_applied:
             return
 
-        chunk_masks = self.chunk_masks
-        src_latents = self.src_latents
-        semantic_hints = self.semantic_hints
+        # Placed once per device/dtype/CFG batch instead of on every model call
+        chunk_masks = DeviceTensorCache(self.chunk_masks)
+        src_latents = DeviceTensorCache(self.src_latents)
+        semantic_hints = DeviceTensorCache(self.semantic_hints) if self.semantic_hints is not None else None
         reference_latent = self.reference_latent
 
         self.model_patcher.set_model_unet_function_wrapper(None)
@@ -662,11 +657,8 @@ class ACEStep15NativeExtractGuider(comfy.samplers.CFGGuider):
             dtype = args["input"].dtype
 
             input_batch_size = args["input"].shape[0]
-            cm = chunk_masks.to(device=device, dtype=dtype)
-            sl = src_latents.to(device=device, dtype=dtype)
-            if cm.shape[0] < input_batch_size:
-                cm = cm.repeat(input_batch_size, 1, 1)
-                sl = sl.repeat(input_batch_size, 1, 1)
+            cm = chunk_masks.get(device, dtype, input_batch_size)
+            sl = src_latents.get(device, dtype, input_batch_size)
 
             c["chunk_masks"] = cm
             c["src_latents"] = sl
@@ -676,9 +668,7 @@ class ACEStep15NativeExtractGuider(comfy.samplers.CFGGuider):
             # (hints are NOT used for context when is_covers=0, but providing them avoids
             # a wasteful tokenize/detokenize of the silence latent in prepare_condition)
             if semantic_hints is not None:
-                sh = semantic_hints.to(device=device, dtype=dtype)
-                if sh.shape[0] < input_batch_size:
-                    sh = sh.repeat(input_batch_size, 1, 1)
+                sh = semantic_hints.get(device, dtype, input_batch_size)
                 c["precomputed_lm_hints_25Hz"] = sh
 
             # Inject reference audio timbre if provided
@@ -821,8 +811,9 @@ class ACEStep15NativeLegoGuider(comfy.samplers.CFGGuider):
         if self._wrapper_applied:
             return
 
-        chunk_masks = self.chunk_masks
-        src_latents = self.src_latents
+        # Placed once per device/dtype/CFG batch instead of on every model call
+        chunk_masks = DeviceTensorCache(self.chunk_masks)
+        src_latents = DeviceTensorCache(self.src_latents)
         reference_latent = self.reference_latent
 
         self.model_patcher.set_model_unet_function_wrapper(None)
@@ -833,11 +824,8 @@ class ACEStep15NativeLegoGuider(comfy.samplers.CFGGuider):
             dtype = args["input"].dtype
 
             input_batch_size = args["input"].shape[0]
-            cm = chunk_masks.to(device=device, dtype=dtype)
-            sl = src_latents.to(device=device, dtype=dtype)
-            if cm.shape[0] < input_batch_size:
-                cm = cm.repeat(input_batch_size, 1, 1)
-                sl = sl.repeat(input_batch_size, 1, 1)
+            cm = chunk_masks.get(device, dtype, input_batch_size)
+            sl = src_latents.get(device, dtype, input_batch_size)
 
             c["chunk_masks"] = cm
             c["src_latents"] = sl
@@ -963,6 +951,11 @@ class ACEStepRepaintGuider(comfy.samplers.CFGGuider):
         
         # Convert sigmas to timesteps
         timesteps = (sigmas * 1000).long()
+
+        # Step callbacks read these on the sampling device every step
+        x0_cache = DeviceTensorCache(x0)
+        z0_cache = DeviceTensorCache(z0)
+        generated_cache = DeviceTensorCache(repaint_mask == 1.0)
         
         # Store original dtype for precision
         original_dtype = noise.dtype
@@ -986,8 +979,9 @@ class ACEStepRepaintGuider(comfy.samplers.CFGGuider):
                     return
                 elif i == n_min:
                     t_i = t.float() / 1000.0
-                    zt_src = (1 - t_i) * x0.to(device) + t_i * z0.to(device)
-                    target_latents = zt_edit.to(device) + zt_src - x0.to(device)
+                    x0_device = x0_cache.get(device)
+                    zt_src = (1 - t_i) * x0_device + t_i * z0_cache.get(device)
+                    target_latents = zt_edit.to(device) + zt_src - x0_device
                     
                     # Replace x with our initialized target_latents
                     x[:] = target_latents
@@ -1014,9 +1008,8 @@ class ACEStepRepaintGuider(comfy.samplers.CFGGuider):
                 prev_sample = prev_sample.to(original_dtype)
                 target_latents = prev_sample
 
-                zt_src = (1 - t_im1) * x0.to(device) + t_im1 * z0.to(device)
-                repaint_mask_device = repaint_mask.to(device)
-                target_latents = torch.where(repaint_mask_device == 1.0, target_latents, zt_src)
+                zt_src = (1 - t_im1) * x0_cache.get(device) + t_im1 * z0_cache.get(device)
+                target_latents = torch.where(generated_cache.get(device), target_latents, zt_src)
                 
                 # Replace x with our custom ODE result
                 x[:] = target_latents
@@ -1234,6 +1227,11 @@ class ACEStepExtendGuider(comfy.samplers.CFGGuider):
         
         # Convert sigmas to timesteps
         timesteps = (sigmas * 1000).long()
+
+        # Step callbacks read these on the sampling device every step
+        x0_cache = DeviceTensorCache(x0)
+        z0_cache = DeviceTensorCache(z0)
+        generated_cache = DeviceTensorCache(repaint_mask == 1.0)
         
         # Store original dtype for precision
         original_dtype = target_latents.dtype
@@ -1255,8 +1253,9 @@ class ACEStepExtendGuider(comfy.samplers.CFGGuider):
                 elif i == n_min:
                     # Community initialization at n_min
                     t_i = t.float() / 1000.0
-                    zt_src = (1 - t_i) * x0.to(device) + t_i * z0.to(device)
-                    target_latents = zt_edit.to(device) + zt_src - x0.to(device)
+                    x0_device = x0_cache.get(device)
+                    zt_src = (1 - t_i) * x0_device + t_i * z0_cache.get(device)
+                    target_latents = zt_edit.to(device) + zt_src - x0_device
                     
                     # Replace x with our initialized target_latents
                     x[:] = target_latents
@@ -1281,9 +1280,8 @@ class ACEStepExtendGuider(comfy.samplers.CFGGuider):
                 target_latents = prev_sample
                 
                 # Community masking step: preserve source regions, keep generated in extended regions
-                zt_src = (1 - t_im1) * x0.to(device) + t_im1 * z0.to(device)
-                repaint_mask_device = repaint_mask.to(device)
-                target_latents = torch.where(repaint_mask_device == 1.0, target_latents, zt_src)
+                zt_src = (1 - t_im1) * x0_cache.get(device) + t_im1 * z0_cache.get(device)
+                target_latents = torch.where(generated_cache.get(device), target_latents, zt_src)
                 
                 # Replace x with our result
                 x[:] = target_latents
@@ -1543,6 +1541,11 @@ class ACEStepHybridGuider(comfy.samplers.CFGGuider):
         timesteps = (sigmas * 1000).long()
         original_dtype = working_noise.dtype
         target_latents = working_noise.clone()
+
+        # Step callbacks read these on the sampling device every step
+        x0_cache = DeviceTensorCache(x0)
+        z0_cache = DeviceTensorCache(z0)
+        generated_cache = DeviceTensorCache(self.combined_mask == 1.0)
         
         def hybrid_callback(step, x0_unused, x, total_steps):
             """Apply hybrid extend+repaint logic"""
@@ -1560,8 +1563,9 @@ class ACEStepHybridGuider(comfy.samplers.CFGGuider):
                     return
                 elif i == n_min:
                     t_i = t.float() / 1000.0
-                    zt_src = (1 - t_i) * x0.to(device) + t_i * z0.to(device)
-                    target_latents = zt_edit.to(device) + zt_src - x0.to(device)
+                    x0_device = x0_cache.get(device)
+                    zt_src = (1 - t_i) * x0_device + t_i * z0_cache.get(device)
+                    target_latents = zt_edit.to(device) + zt_src - x0_device
                     x[:] = target_latents
                     return
                 
@@ -1580,27 +1584,25 @@ class ACEStepHybridGuider(comfy.samplers.CFGGuider):
                     target_latents = prev_sample
                     
                     # Apply masking: CRITICAL - use SAME z0 noise, not random!
-                    zt_src = (1 - t_im1) * x0.to(device) + t_im1 * z0.to(device)
-                    combined_mask_device = self.combined_mask.to(device)
-                    target_latents = torch.where(combined_mask_device == 1.0, target_latents, zt_src)
+                    zt_src = (1 - t_im1) * x0_cache.get(device) + t_im1 * z0_cache.get(device)
+                    target_latents = torch.where(generated_cache.get(device), target_latents, zt_src)
                     
                     x[:] = target_latents
             else:
                 # No repaint, just simple extend logic (if any)
                 if step > 0:  # Skip initial step
                     device = x.device
-                    working_latent_device = working_latent.to(device)
-                    combined_mask_device = self.combined_mask.to(device)
+                    working_latent_device = x0_cache.get(device)
                     
                     # Get current timestep and calculate noisy source
                     current_sigma = sigmas[step] if step < len(sigmas) else 0.0
                     sigma_ratio = current_sigma / sigmas[0] if sigmas[0] > 0 else 0.0
                     
                     # Use FIXED noise z0, not random noise!
-                    zt_src = (1.0 - sigma_ratio) * working_latent_device + sigma_ratio * z0.to(device)
+                    zt_src = (1.0 - sigma_ratio) * working_latent_device + sigma_ratio * z0_cache.get(device)
                     
                     # Apply combined mask: generate new where mask=1.0, preserve original where mask=0.0
-                    x[:] = torch.where(combined_mask_device == 1.0, x, zt_src)
+                    x[:] = torch.where(generated_cache.get(device), x, zt_src)
             
             # Call original callback if provided
             if callback is not None:
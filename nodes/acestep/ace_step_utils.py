@@ -1,7 +1,10 @@
 import torch
 import torch.nn.functional as F
+import hashlib
 import math
 import os
+import weakref
+from collections import OrderedDict
 import comfy.model_management
 import folder_paths
 from . import logger
@@ -93,25 +96,197 @@ def load_silence_latent(verbose=True):
     return silence_latent
 
 
-def extract_semantic_hints(model, source_latent, verbose=True):
+# Semantic hint cache: in-memory LRU in front of .pt files on disk
+SEMANTIC_HINT_MEMORY_ENTRIES = 8
+SEMANTIC_HINT_DISK_BYTES = 1 << 30
+_semantic_hint_cache = OrderedDict()
+_weight_fingerprints = weakref.WeakKeyDictionary()
+_patch_fingerprints = OrderedDict()  # by ModelPatcher.patches_uuid, which changes whenever patches do
+_PATCH_FINGERPRINT_ENTRIES = 16
+_HINT_MODULES = ("tokenizer", "detokenizer")
+
+
+def get_semantic_hint_cache_dir():
+    """Get the directory where extracted semantic hints are persisted."""
+    return os.path.join(folder_paths.models_dir, "ace_step", "semantic_hints")
+
+
+def prune_semantic_hint_cache_dir(budget_bytes=None, keep=""):
+    """Delete the least recently used .pt files until the disk tier fits the budget."""
+    cache_dir = get_semantic_hint_cache_dir()
+    if not os.path.isdir(cache_dir):
+        return
+    budget = SEMANTIC_HINT_DISK_BYTES if budget_bytes is None else int(budget_bytes)
+    entries = []
+    for name in os.listdir(cache_dir):
+        if not name.endswith(".pt"):
+            continue
+        path = os.path.join(cache_dir, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= budget:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+
+def clear_semantic_hint_cache(disk=False):
+    """Drop cached semantic hints from memory, and optionally from disk."""
+    _semantic_hint_cache.clear()
+    if disk:
+        prune_semantic_hint_cache_dir(budget_bytes=0)
+
+
+def _update_with_tensor(digest, tensor):
+    """Hash a tensor's shape, dtype and every byte of its values."""
+    flat = tensor.detach().reshape(-1).contiguous().cpu()
+    digest.update(f"{tuple(tensor.shape)}:{tensor.dtype}".encode())
+    digest.update(flat.view(torch.uint8).numpy().tobytes())
+
+
+def _weight_fingerprint(model, diffusion_model):
+    """
+    Identify the unpatched tokenizer/detokenizer weights across sessions.
+
+    Hashes parameter names, shapes and the full parameter values, so the same
+    checkpoint maps to the same key and fine-tunes that differ anywhere don't
+    collide; this runs once per module and is memoized. Parameters that
+    currently carry a weight patch are read from the patcher's backup, so the
+    result doesn't depend on which clone loaded the module last. Returns None when the weights can't be
+    read (e.g. not materialized).
+    """
+    fingerprint = _weight_fingerprints.get(diffusion_model)
+    if fingerprint is not None:
+        return fingerprint
+
+    backup = getattr(model, "backup", None) or {}
+    digest = hashlib.sha1()
+    try:
+        for module_name in _HINT_MODULES:
+            for name, param in getattr(diffusion_model, module_name).named_parameters():
+                original = backup.get(f"diffusion_model.{module_name}.{name}")
+                if original is not None:
+                    param = getattr(original, "weight", original)
+                digest.update(f"{module_name}.{name}".encode())
+                _update_with_tensor(digest, param)
+    except (RuntimeError, NotImplementedError):
+        return None
+
+    fingerprint = digest.hexdigest()
+    _weight_fingerprints[diffusion_model] = fingerprint
+    return fingerprint
+
+
+def _iter_patch_tensors(value):
+    """Yield the tensors held by a weight patch (LoRA adapters, tuples of factors, diffs)."""
+    if isinstance(value, torch.Tensor):
+        yield value
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            yield from _iter_patch_tensors(item)
+    elif hasattr(value, "weights"):
+        yield from _iter_patch_tensors(value.weights)
+
+
+def _patch_fingerprint(model):
+    """
+    Identify the weight patches a ModelPatcher applies to the tokenizer/detokenizer.
+
+    Clones (e.g. after a LoRA loader) share the diffusion model module but not
+    their patches, so these have to be part of the cache key. Returns "" when no
+    patch touches the hint modules.
+    """
+    patches = getattr(model, "patches", None) or {}
+    prefixes = tuple(f"diffusion_model.{module_name}." for module_name in _HINT_MODULES)
+    keys = sorted(key for key in patches if isinstance(key, str) and key.startswith(prefixes))
+    if not keys:
+        return ""
+
+    patches_uuid = getattr(model, "patches_uuid", None)
+    fingerprint = _patch_fingerprints.get(patches_uuid) if patches_uuid is not None else None
+    if fingerprint is not None:
+        _patch_fingerprints.move_to_end(patches_uuid)
+        return fingerprint
+
+    digest = hashlib.sha1()
+    for key in keys:
+        digest.update(key.encode())
+        for patch in patches[key]:
+            strength_patch, value, strength_model = patch[0], patch[1], patch[2]
+            extra = tuple(patch[3:])
+            digest.update(f"{strength_patch}:{strength_model}:{type(value).__name__}:{extra!r}".encode())
+            for tensor in _iter_patch_tensors(value):
+                _update_with_tensor(digest, tensor)
+    fingerprint = digest.hexdigest()
+    if patches_uuid is not None:
+        _patch_fingerprints[patches_uuid] = fingerprint
+        while len(_patch_fingerprints) > _PATCH_FINGERPRINT_ENTRIES:
+            _patch_fingerprints.popitem(last=False)
+    return fingerprint
+
+
+def _model_fingerprint(model):
+    """Identify a ModelPatcher's effective tokenizer/detokenizer weights, or None if unreadable."""
+    weights = _weight_fingerprint(model, model.model.diffusion_model)
+    if weights is None:
+        return None
+    try:
+        patches = _patch_fingerprint(model)
+    except (RuntimeError, NotImplementedError):
+        return None
+    return f"{weights}:{patches}" if patches else weights
+
+
+def _semantic_hint_key(model, source_latent, dtype):
+    """Content-addressed cache key for a source latent and model, or None if uncacheable."""
+    fingerprint = _model_fingerprint(model)
+    if fingerprint is None:
+        return None
+    latent = source_latent.detach().cpu().contiguous()
+    digest = hashlib.sha1()
+    digest.update(f"{fingerprint}:{tuple(latent.shape)}:{latent.dtype}:{dtype}".encode())
+    digest.update(latent.float().numpy().tobytes())
+    return digest.hexdigest()
+
+
+def extract_semantic_hints(model, source_latent, verbose=True, diagnostics=False, use_cache=True):
     """
     Extract semantic hints from source audio latents for Cover/Extract tasks.
 
     This extracts the semantic structure of the audio (rhythm, melody, harmony)
     while abstracting away the timbre. Used by Cover and Extract guiders.
 
+    Results are cached by source latent content, model weights and any weight
+    patches (e.g. LoRA) on the tokenizer/detokenizer, in memory and under
+    get_semantic_hint_cache_dir(), so re-running against the same source skips
+    loading the model and the tokenize/detokenize pass. The disk tier keeps the
+    most recently used files within SEMANTIC_HINT_DISK_BYTES.
+
     Args:
         model: ComfyUI ModelPatcher wrapping the ACE-Step 1.5 model
         source_latent: Source audio latent in ComfyUI format [B, 64, T]
         verbose: Whether to print diagnostic information
+        diagnostics: Whether to compute full-tensor mean/std statistics for the logs
+        use_cache: Whether to read and write the semantic hint cache
 
     Returns:
         torch.Tensor: Semantic hints in ComfyUI format [B, 64, T]
     """
-    print(f"[DIAG_SEMANTIC_EXTRACT] input latent shape={source_latent.shape}, mean={source_latent.mean():.4f}, std={source_latent.std():.4f}")
-
     prefix = "[SEMANTIC_EXTRACT]"
 
+    if diagnostics:
+        logger.debug(f"{prefix} input latent shape={source_latent.shape}, mean={source_latent.mean():.4f}, std={source_latent.std():.4f}")
+
     # Validate v1.5 shape: (batch, 64, length)
     if len(source_latent.shape) != 3 or source_latent.shape[1] != 64:
         raise ValueError(f"ACE-Step 1.5 requires latent shape (batch, 64, length), got {source_latent.shape}")
@@ -125,12 +300,37 @@ def extract_semantic_hints(model, source_latent, verbose=True):
             "Make sure you're using an ACE-Step 1.5 model."
         )
 
-    # Load model to GPU
-    comfy.model_management.load_model_gpu(model)
-
     device = comfy.model_management.get_torch_device()
     dtype = model.model.get_dtype()
 
+    cache_key = _semantic_hint_key(model, source_latent, dtype) if use_cache else None
+    if cache_key is not None:
+        semantic_hints = _semantic_hint_cache.get(cache_key)
+        if semantic_hints is not None:
+            _semantic_hint_cache.move_to_end(cache_key)
+            if verbose:
+                logger.debug(f"{prefix} Using cached semantic hints {cache_key[:12]} (memory)")
+            return semantic_hints.to(device=device)
+
+        cache_path = os.path.join(get_semantic_hint_cache_dir(), f"{cache_key}.pt")
+        if os.path.exists(cache_path):
+            try:
+                semantic_hints = torch.load(cache_path, map_location="cpu", weights_only=True)
+            except Exception as e:
+                logger.warning(f"{prefix} Ignoring unreadable cache file {cache_path}: {e}")
+            else:
+                _store_semantic_hints(cache_key, semantic_hints)
+                try:
+                    os.utime(cache_path)
+                except OSError:
+                    pass
+                if verbose:
+                    logger.debug(f"{prefix} Using cached semantic hints {cache_key[:12]} (disk)")
+                return semantic_hints.to(device=device)
+
+    # Load model to GPU
+    comfy.model_management.load_model_gpu(model)
+
     # Move source tensor to model device/dtype
     # Source is in ComfyUI format: [B, D, T] = [B, 64, length]
     # Tokenizer expects: [B, T, D] = [B, length, 64]
@@ -139,11 +339,12 @@ def extract_semantic_hints(model, source_latent, verbose=True):
 
     if verbose:
         logger.debug(f"{prefix} Extracting from source shape: {source_latent.shape}")
+    if diagnostics:
         logger.debug(f"{prefix}   source stats: mean={source_transposed.mean():.4f}, std={source_transposed.std():.4f}")
 
     # Verify weights are on GPU
-    tokenizer_device = next(diffusion_model.tokenizer.parameters()).device
     if verbose:
+        tokenizer_device = next(diffusion_model.tokenizer.parameters()).device
         logger.debug(f"{prefix}   tokenizer on: {tokenizer_device}, target: {device}")
 
     # Step 1: Tokenize - get quantized embeddings at 5Hz
@@ -152,6 +353,7 @@ def extract_semantic_hints(model, source_latent, verbose=True):
 
     if verbose:
         logger.debug(f"{prefix}   quantized shape: {quantized.shape}")
+    if diagnostics:
         logger.debug(f"{prefix}   quantized stats: mean={quantized.mean():.4f}, std={quantized.std():.4f}")
 
     # Step 2: Detokenize - upsample from 5Hz to 25Hz
@@ -161,6 +363,7 @@ def extract_semantic_hints(model, source_latent, verbose=True):
 
     if verbose:
         logger.debug(f"{prefix}   lm_hints shape: {lm_hints.shape}")
+    if diagnostics:
         logger.debug(f"{prefix}   lm_hints stats: mean={lm_hints.mean():.4f}, std={lm_hints.std():.4f}")
         if lm_hints.std() < 0.01:
             logger.warning(f"{prefix}   Very low variance in semantic hints!")
@@ -168,11 +371,59 @@ def extract_semantic_hints(model, source_latent, verbose=True):
     # Transpose back to ComfyUI format: [B, T, D] → [B, D, T]
     semantic_hints = lm_hints.movedim(-1, -2)
 
-    print(f"[DIAG_SEMANTIC_EXTRACT] output hints shape={semantic_hints.shape}, mean={semantic_hints.mean():.4f}, std={semantic_hints.std():.4f}")
+    if diagnostics:
+        logger.debug(f"{prefix} output hints shape={semantic_hints.shape}, mean={semantic_hints.mean():.4f}, std={semantic_hints.std():.4f}")
+
+    if cache_key is not None:
+        cpu_hints = semantic_hints.detach().cpu().contiguous()
+        _store_semantic_hints(cache_key, cpu_hints)
+        try:
+            cache_dir = get_semantic_hint_cache_dir()
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write then rename so a concurrent reader never sees a partial file
+            tmp_path = os.path.join(cache_dir, f"{cache_key}.pt.tmp")
+            torch.save(cpu_hints, tmp_path)
+            cache_path = os.path.join(cache_dir, f"{cache_key}.pt")
+            os.replace(tmp_path, cache_path)
+            prune_semantic_hint_cache_dir(keep=cache_path)
+        except OSError as e:
+            logger.warning(f"{prefix} Could not write semantic hint cache: {e}")
 
     return semantic_hints
 
 
+def _store_semantic_hints(cache_key, semantic_hints):
+    """Insert CPU semantic hints into the memory tier, evicting the least recently used."""
+    _semantic_hint_cache[cache_key] = semantic_hints
+    _semantic_hint_cache.move_to_end(cache_key)
+    while len(_semantic_hint_cache) > SEMANTIC_HINT_MEMORY_ENTRIES:
+        _semantic_hint_cache.popitem(last=False)
+
+
+class DeviceTensorCache:
+    """Copies of a tensor per device, dtype and CFG batch size
+
+    Model wrappers and step callbacks read the same masks and latents on every call; the
+    first read for a placement pays for the transfer and batch repeat, later reads reuse it.
+    """
+
+    def __init__(self, tensor):
+        self.tensor = tensor
+        self._copies = {}
+
+    def get(self, device, dtype=None, batch_size=None):
+        dtype = self.tensor.dtype if dtype is None else dtype
+        repeats = batch_size if batch_size is not None and self.tensor.shape[0] < batch_size else 1
+        key = (torch.device(device), dtype, repeats)
+        copy = self._copies.get(key)
+        if copy is None:
+            copy = self.tensor.to(device=device, dtype=dtype)
+            if repeats > 1:
+                copy = copy.repeat(repeats, *([1] * (copy.ndim - 1)))
+            self._copies[key] = copy
+        return copy
+
+
 class ACEStepLatentUtils:
     """Utility functions for ACEStep audio latent manipulation"""
 
@@ -390,38 +641,49 @@ class ACEStepLatentUtils:
         kernel_size = feather_frames * 2 + 1
         sigma = feather_frames / 3.0
 
-        x = torch.arange(kernel_size, dtype=torch.float32) - feather_frames
+        x = torch.arange(kernel_size, dtype=torch.float32, device=mask.device) - feather_frames
         gaussian_kernel = torch.exp(-0.5 * (x / sigma) ** 2)
         gaussian_kernel = gaussian_kernel / gaussian_kernel.sum()
 
-        result = torch.zeros_like(mask)
-        is_v1_5 = len(mask.shape) == 3
+        # Every row of a v1.5 (batch, channels, length) or v1.0 (batch, channels, height, length)
+        # mask is smoothed along time, so flatten the rows into one conv1d batch
+        signal = mask.reshape(-1, 1, mask.shape[-1]).float()
+        padded_signal = F.pad(signal, (feather_frames, feather_frames), 'constant', 0.0)
+        smoothed = F.conv1d(padded_signal, gaussian_kernel.view(1, 1, -1))
 
-        if is_v1_5:
-            # v1.5: (batch, channels, length)
-            batch_size, channels, length = mask.shape
-            kernel = gaussian_kernel.view(1, 1, -1)
+        return torch.clamp(smoothed.reshape(mask.shape), 0.0, 1.0).to(mask.dtype)
 
-            for b in range(batch_size):
-                for c in range(channels):
-                    signal = mask[b:b+1, c:c+1, :]
-                    padded_signal = F.pad(signal, (feather_frames, feather_frames), 'constant', 0.0)
-                    smoothed = F.conv1d(padded_signal, kernel, padding=0)
-                    result[b, c, :] = smoothed[0, 0, :]
-        else:
-            # v1.0: (batch, channels, height, length)
-            batch_size, channels, height, length = mask.shape
-            kernel = gaussian_kernel.view(1, 1, 1, -1)
-
-            for b in range(batch_size):
-                for c in range(channels):
-                    for h in range(height):
-                        signal = mask[b:b+1, c:c+1, h:h+1, :]
-                        padded_signal = F.pad(signal, (feather_frames, feather_frames), 'constant', 0.0)
-                        smoothed = F.conv2d(padded_signal, kernel, padding=0)
-                        result[b, c, h, :] = smoothed[0, 0, 0, :]
-
-        return torch.clamp(result, 0.0, 1.0)
+    @staticmethod
+    def create_region_mask(length, boundaries, feather_frames=0, value=1.0, device=None):
+        """Create a temporal mask from region boundaries with linear feathering
+
+        The regions are rasterized into one boundary tensor and feathered with a single
+        box-filter conv1d, giving a ramp of feather_frames frames on each side of every region.
+
+        Args:
+            length: Number of latent frames
+            boundaries: (start_frame, end_frame) pairs, or an (R, 2) tensor of them
+            feather_frames: Number of frames to feather on each side
+            value: Mask value inside the regions
+            device: Device to build the mask on
+
+        Returns:
+            torch.Tensor: (length,) float32 mask
+        """
+        boundaries = torch.as_tensor(boundaries, dtype=torch.long, device=device).reshape(-1, 2)
+        boundaries = boundaries[boundaries[:, 0] < boundaries[:, 1]]
+        feather_frames = max(int(feather_frames), 0)
+        kernel_size = max(feather_frames, 1)
+
+        # A causal box over [start - feather + 1, end + 1) rises before start and falls from end
+        starts = boundaries[:, :1] - kernel_size + 1
+        ends = boundaries[:, 1:] + (1 if feather_frames > 0 else 0)
+        positions = torch.arange(1 - kernel_size, length, device=device)
+        inside = ((positions >= starts) & (positions < ends)).any(dim=0).float()
+
+        kernel = torch.full((1, 1, kernel_size), 1.0 / kernel_size, device=device)
+        mask = F.conv1d(inside.view(1, 1, -1), kernel).view(-1)
+        return torch.clamp(mask * value, 0.0, 1.0)
     
     @staticmethod
     def apply_repaint_with_timestep_blending(noise_pred, source_latent, repaint_mask, timestep, repaint_strength):
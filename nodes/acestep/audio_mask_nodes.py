@@ -129,33 +129,9 @@ class AudioRegionMask(AudioMaskBase):
         end_frame = ACEStepLatentUtils.time_to_frame_index(end_time, version)
         feather_frames = ACEStepLatentUtils.time_to_frame_index(feather_seconds, version)
         
-        # Set region value - v1.5 is 2D (batch, length), v1.0 is 3D (batch, height, length)
-        is_2d = len(mask.shape) == 2
-        if start_frame < end_frame:
-            if is_2d:
-                mask[:, start_frame:end_frame] = mask_value
-            else:
-                mask[:, :, start_frame:end_frame] = mask_value
-
-        # Apply feathering if requested
-        if feather_frames > 0:
-            # Feather start
-            for i in range(max(0, start_frame - feather_frames), start_frame):
-                if i >= 0 and i < length:
-                    progress = (i - (start_frame - feather_frames)) / feather_frames
-                    if is_2d:
-                        mask[:, i] = mask_value * progress
-                    else:
-                        mask[:, :, i] = mask_value * progress
-
-            # Feather end
-            for i in range(end_frame, min(length, end_frame + feather_frames)):
-                if i >= 0 and i < length:
-                    progress = 1.0 - (i - end_frame) / feather_frames
-                    if is_2d:
-                        mask[:, i] = mask_value * progress
-                    else:
-                        mask[:, :, i] = mask_value * progress
+        # Region and feather ramps along time, broadcast over batch (and height for v1.0)
+        mask[...] = ACEStepLatentUtils.create_region_mask(
+            length, [(start_frame, end_frame)], feather_frames, mask_value)
 
         return (self._finalize_mask(mask),)
 
@@ -395,18 +371,8 @@ class AudioRegionMask15(AudioMaskBase):
         end_frame = ACEStepLatentUtils.time_to_frame_index(end_time, version)
         feather_frames = ACEStepLatentUtils.time_to_frame_index(feather_seconds, version)
 
-        if start_frame < end_frame:
-            mask[:, start_frame:end_frame] = mask_value
-
-        if feather_frames > 0:
-            for i in range(max(0, start_frame - feather_frames), start_frame):
-                if i >= 0 and i < length:
-                    progress = (i - (start_frame - feather_frames)) / feather_frames
-                    mask[:, i] = mask_value * progress
-            for i in range(end_frame, min(length, end_frame + feather_frames)):
-                if i >= 0 and i < length:
-                    progress = 1.0 - (i - end_frame) / feather_frames
-                    mask[:, i] = mask_value * progress
+        mask[...] = ACEStepLatentUtils.create_region_mask(
+            length, [(start_frame, end_frame)], feather_frames, mask_value)
 
         return (self._finalize_mask(mask),)
 
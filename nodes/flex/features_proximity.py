@@ -6,32 +6,45 @@ import numpy as np
 from .features import BaseFeature
 
 class ProximityFeature(BaseFeature):
-    def __init__(self, name, anchor_locations, query_locations, frame_rate, frame_count, frame_dimensions, width, height, normalization_method='frame'):
+    def __init__(self, name, anchor_locations, query_locations, frame_rate, frame_count, frame_dimensions, width, height, normalization_method='frame', keep_point_distances=False):
         super().__init__(name, "proximity", frame_rate, frame_count, width, height)
         self.anchor_locations = anchor_locations
         self.query_locations = query_locations
         self.frame_diagonal = np.sqrt(frame_dimensions[0]**2 + frame_dimensions[1]**2)
         self.proximity_values = None
         self.normalization_method = normalization_method
+        self.keep_point_distances = keep_point_distances
+        self.point_distances = None
+        self.nearest_anchor_indices = None
 
     @classmethod
     def get_extraction_methods(self):
         return ["normalization_method"]
     
     def extract(self):
-        from scipy.spatial.distance import cdist
+        from scipy.spatial import cKDTree
         
         proximities = []
+        keep = self.keep_point_distances
+        point_distances = [] if keep else None
+        nearest_anchor_indices = [] if keep else None
         for anchor, query in zip(self.anchor_locations, self.query_locations):
             if len(anchor) == 0 or len(query) == 0:
                 proximities.append(self.frame_diagonal if self.normalization_method == 'frame' else float('inf'))
+                if keep:
+                    point_distances.append(np.full(len(query), np.inf))
+                    nearest_anchor_indices.append(np.full(len(query), -1, dtype=int))
             else:
-                # Ensure points are treated as floats
-                anchor_points = anchor.points.astype(float)
-                query_points = query.points.astype(float)
-                distances = cdist(anchor_points, query_points)
-                min_distance = np.min(distances)
-                proximities.append(min_distance)
+                # Nearest anchor for every query point, without the full anchor x query matrix
+                tree = cKDTree(anchor.points.astype(float))
+                distances, indices = tree.query(query.points.astype(float), k=1)
+                proximities.append(np.min(distances))
+                if keep:
+                    point_distances.append(distances)
+                    nearest_anchor_indices.append(indices)
+
+        self.point_distances = point_distances
+        self.nearest_anchor_indices = nearest_anchor_indices
         
         proximities = np.array(proximities, dtype=float)
         
@@ -57,6 +70,12 @@ class ProximityFeature(BaseFeature):
     def get_value_at_frame(self, frame_index):
         return self.proximity_values[frame_index]
 
+    def get_point_distances_at_frame(self, frame_index):
+        """Distance from each query point to its nearest anchor, inf where the frame has no anchors."""
+        if self.point_distances is None:
+            raise ValueError("Point distances were not kept; create the feature with keep_point_distances=True")
+        return self.point_distances[frame_index]
+
 class Location:
     def __init__(self, x, y, z=None):
         x = np.asarray(x, dtype=float).reshape(-1)
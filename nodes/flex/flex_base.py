@@ -30,6 +30,37 @@ class FlexBase(ProgressMixin, ABC):
         self.frame_count = None
 
 
+    def stack_frame_parameters(self, frame_params, device=None, dtype=torch.float32) -> dict:
+        """Stack per-frame process_parameters results into batch kwargs.
+
+        Numeric values become (N,) tensors, frame_index becomes a long tensor, and
+        passthrough values (strings, latents, masks) are taken from the first frame.
+        """
+        batch = {
+            'frame_index': torch.tensor([params['frame_index'] for params in frame_params], dtype=torch.long, device=device),
+        }
+        for key, value in frame_params[0].items():
+            if key in batch:
+                continue
+            values = [params.get(key, value) for params in frame_params]
+            if all(isinstance(v, (int, float, np.number)) and not isinstance(v, bool) for v in values):
+                batch[key] = torch.tensor(values, dtype=dtype, device=device)
+            else:
+                batch[key] = value
+        return batch
+
+    def batch_parameters(self, frame_params, frames) -> dict:
+        """Batch kwargs for apply_effect_batch from per-frame process_parameters results."""
+        return self.stack_frame_parameters(frame_params, device=frames.device)
+
+    def apply_effect_batch_to_frame(self, frame, **kwargs) -> np.ndarray:
+        """Run apply_effect_batch on a single numpy frame.
+
+        Effects with a batched path implement apply_effect_internal by returning this.
+        """
+        frames = torch.from_numpy(np.asarray(frame, dtype=np.float32))[None]
+        return self.apply_effect_batch(frames, **self.batch_parameters([kwargs], frames))[0].cpu().numpy()
+
     def initialize_scheduler(self, frame_count: int, **kwargs):
         """Initialize parameter scheduler with all numeric parameters"""
         self.frame_count = frame_count
@@ -2,7 +2,7 @@ from ... import RyanOnTheInside
 import cv2
 import numpy as np
 import  torch
-from scipy.spatial.distance import cdist
+from scipy.spatial import cKDTree
 import math
 import matplotlib.pyplot as plt
 from PIL import Image
@@ -110,10 +110,11 @@ class ProximityVisualizer(EffectVisualizer):
 
             # Find the closest pair of points
             if len(anchor) > 0 and len(query) > 0:
-                distances = cdist(anchor.points[:, :2], query.points[:, :2])  # Use only x and y for distance calculation
-                min_idx = np.unravel_index(distances.argmin(), distances.shape)
-                closest_anchor = anchor[min_idx[0]]
-                closest_query = query[min_idx[1]]
+                # Use only x and y for distance calculation
+                distances, anchor_indices = cKDTree(anchor.points[:, :2]).query(query.points[:, :2], k=1)
+                query_idx = int(np.argmin(distances))
+                closest_anchor = anchor[anchor_indices[query_idx]]
+                closest_query = query[query_idx]
 
                 # Draw line between closest points (using only x and y coordinates)
                 cv2.line(frame, 
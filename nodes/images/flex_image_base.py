@@ -21,6 +21,10 @@ class FlexImageBase(RyanOnTheInside, FlexBase):
     RETURN_TYPES = ("IMAGE",)
     FUNCTION = "apply_effect"
 
+    # Effects that set this implement apply_effect_batch(images, **kwargs), which runs once
+    # over the whole (N, H, W, C) batch with per-frame numeric parameters as (N,) tensors
+    SUPPORTS_BATCH = False
+
     def __init__(self):
         super().__init__()  # Initialize FlexBase
 
@@ -40,15 +44,12 @@ class FlexImageBase(RyanOnTheInside, FlexBase):
         opt_feature=None, 
         **kwargs
     ):
-        # Convert images to numpy for processing
-        images_np = images.cpu().numpy()
-
         # Determine frame count from either feature or longest parameter list
         if opt_feature is not None:
             num_frames = opt_feature.frame_count
         else:
             # Start with number of input frames
-            num_frames = images_np.shape[0]
+            num_frames = images.shape[0]
             # Check all parameters for lists/arrays that might be longer
             for value in kwargs.values():
                 if isinstance(value, (list, tuple, np.ndarray)):
@@ -56,6 +57,35 @@ class FlexImageBase(RyanOnTheInside, FlexBase):
 
         self.start_progress(num_frames, desc=f"Applying {self.__class__.__name__}")
 
+        if self.SUPPORTS_BATCH:
+            # Resolve parameters per frame, then run the effect once over the whole batch
+            frame_params = []
+            for i in range(num_frames):
+                processed_kwargs = self.process_parameters(
+                    frame_index=i,
+                    feature_value=self.get_feature_value(i, opt_feature) if opt_feature is not None else None,
+                    feature_param=feature_param if opt_feature is not None else None,
+                    feature_mode=feature_mode if opt_feature is not None else None,
+                    strength=strength,
+                    feature_threshold=feature_threshold,
+                    **kwargs
+                )
+                processed_kwargs["frame_index"] = i
+                frame_params.append(processed_kwargs)
+
+            frame_indices = torch.arange(num_frames, device=images.device) % images.shape[0]
+            result_tensor = self.apply_effect_batch(
+                images[frame_indices],
+                **self.batch_parameters(frame_params, images)
+            )
+            self.update_progress(num_frames)
+            self.end_progress()
+
+            return (result_tensor.float(),)
+
+        # Convert images to numpy for processing
+        images_np = images.cpu().numpy()
+
         result = []
         for i in range(num_frames):
             # Get the appropriate image frame, handling possible shorter image sequences
@@ -1,10 +1,11 @@
 import cv2
 import torch
 import numpy as np
+from collections import OrderedDict
 from .flex_image_base import FlexImageBase
 from scipy.ndimage import gaussian_filter
 import torch.nn.functional as F
-from .image_utils import transform_image, apply_gaussian_blur_gpu
+from .image_utils import transform_image, apply_gaussian_blur_gpu, load_lut, apply_lut_batch, remap_grids
 from ...tooltips import apply_tooltips
 from ..node_utilities import string_to_rgb
 
@@ -131,6 +132,41 @@ class FlexImageKaleidoscope(FlexImageBase):
     def get_modifiable_params(cls):
         return ["segments", "zoom", "rotation", "precession", "speed", "None"]
 
+    GRID_CACHE_SIZE = 16
+
+    def __init__(self):
+        super().__init__()
+        self.grid_cache = OrderedDict()  # LRU of polar layouts by (h, w, segments, center)
+
+    def get_polar_grid(self, h, w, segments, center):
+        """Radius, folded wedge angle and wedge position for every output pixel, cached per layout.
+
+        Zoom, precession and rotation vary per frame and are applied on top of the cached grid.
+        """
+        key = (h, w, segments, center)
+        grid = self.grid_cache.get(key)
+        if grid is not None:
+            self.grid_cache.move_to_end(key)
+            return grid
+
+        ys, xs = np.mgrid[0:h, 0:w].astype(np.float32)
+        dx = xs - center[0]
+        dy = ys - center[1]
+        radius = np.sqrt(dx * dx + dy * dy)
+        theta = np.mod(np.arctan2(dy, dx), 2 * np.pi)
+
+        # Fold every angle into the first wedge, mirroring alternate halves so edges meet seamlessly
+        segment_angle = 2 * np.pi / segments
+        segment_index = np.floor(theta / segment_angle)
+        folded = theta - segment_index * segment_angle
+        folded = np.where(folded > segment_angle / 2, segment_angle - folded, folded)
+
+        grid = (radius.astype(np.float32), folded.astype(np.float32), (segment_index / segments).astype(np.float32))
+        self.grid_cache[key] = grid
+        while len(self.grid_cache) > self.GRID_CACHE_SIZE:
+            self.grid_cache.popitem(last=False)
+        return grid
+
     def apply_effect_internal(self, image: np.ndarray, segments: int, center_x: float, center_y: float, 
                               zoom: float, rotation: float, precession: float, speed: float, **kwargs) -> np.ndarray:
         h, w = image.shape[:2]
@@ -139,23 +175,16 @@ class FlexImageKaleidoscope(FlexImageBase):
         # Ensure segments is an integer
         segments = max(2, int(segments))
         
-        # Create the kaleidoscope effect
-        segment_angle = 360 / segments
-        result = np.zeros_like(image)
-        
-        for i in range(segments):
-            angle = i * segment_angle + rotation * speed
-            # Apply precession effect
-            precession_factor = 1 + precession * (i / segments) * speed
-            matrix = cv2.getRotationMatrix2D(center, angle, zoom * precession_factor)
-            rotated = cv2.warpAffine(image, matrix, (w, h), borderMode=cv2.BORDER_REFLECT)
-            
-            mask = np.zeros((h, w), dtype=np.float32)
-            pts = np.array([center, (0, 0), (w, 0), (w, h), (0, h)], dtype=np.int32)
-            cv2.fillPoly(mask, [pts], 1.0)
-            
-            segment_mask = cv2.warpAffine(mask, matrix, (w, h))
-            result = np.maximum(result, rotated * segment_mask[:,:,None])
+        # Create the kaleidoscope effect with a single remap
+        radius, folded, segment_position = self.get_polar_grid(h, w, segments, center)
+
+        # Apply precession effect as a per-segment zoom
+        scale = np.float32(zoom) * (1 + np.float32(precession * speed) * segment_position)
+        source_radius = radius / np.maximum(scale, np.float32(1e-6))
+        angle = folded + np.float32(np.deg2rad(rotation * speed))
+        map_x = center[0] + source_radius * np.cos(angle)
+        map_y = center[1] + source_radius * np.sin(angle)
+        result = cv2.remap(image, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REFLECT)
         
         # Ensure the result is not all black
         if np.max(result) == 0:
@@ -166,6 +195,8 @@ class FlexImageKaleidoscope(FlexImageBase):
     
 @apply_tooltips
 class FlexImageColorGrade(FlexImageBase):
+    SUPPORTS_BATCH = True
+
     @classmethod
     def INPUT_TYPES(cls):
         base_inputs = super().INPUT_TYPES()
@@ -181,39 +212,31 @@ class FlexImageColorGrade(FlexImageBase):
     def get_modifiable_params(cls):
         return ["intensity", "mix"]
 
-    def __init__(self):
-        super().__init__()
-        self.lut_cache = {}
-
     def load_lut(self, lut_file):
-        if lut_file is None or lut_file == "":
-            return None
-        if lut_file not in self.lut_cache:
-            lut = cv2.imread(lut_file, cv2.IMREAD_UNCHANGED)
-            if lut is None:
-                print(f"Warning: Failed to load LUT file: {lut_file}")
-                return None
-            self.lut_cache[lut_file] = lut
-        return self.lut_cache[lut_file]
-
-    def apply_effect_internal(self, image: np.ndarray, intensity: float, mix: float, 
-                              lut_file: str = None, **kwargs) -> np.ndarray:
+        return load_lut(lut_file)
+
+    def apply_effect_internal(self, image: np.ndarray, **kwargs) -> np.ndarray:
+        return self.apply_effect_batch_to_frame(image, **kwargs)
+
+    def apply_effect_batch(self, images: torch.Tensor, intensity: torch.Tensor, mix: torch.Tensor,
+                           lut_file: str = None, **kwargs) -> torch.Tensor:
         # Load the LUT
         lut = self.load_lut(lut_file)
 
-        # Apply color grading if LUT is available
-        if lut is not None:
-            graded = cv2.LUT(image, lut)
-            
-            # Apply intensity
-            graded = cv2.addWeighted(image, 1 - intensity, graded, intensity, 0)
-            
-            # Mix with original
-            result = cv2.addWeighted(image, 1 - mix, graded, mix, 0)
-        else:
-            result = image  # If no LUT is available, return the original image
+        # If no LUT is available, return the original images
+        if lut is None:
+            return images.clamp(0, 1)
 
-        return np.clip(result, 0, 1)
+        # Apply color grading to the whole batch at once
+        rgb = images[..., :3]
+        graded = apply_lut_batch(rgb, lut)
+
+        # Apply intensity, then mix with original, as per-frame weights
+        weight = (intensity * mix).to(images.dtype).view(-1, 1, 1, 1)
+        result = images.clone()
+        result[..., :3] = rgb + (graded - rgb) * weight
+
+        return result.clamp(0, 1)
 
 @apply_tooltips
 class FlexImageGlitch(FlexImageBase):
@@ -236,6 +259,30 @@ class FlexImageGlitch(FlexImageBase):
     def get_modifiable_params(cls):
         return ["intensity", "block_size", "wave_amplitude", "wave_frequency", "corruption_amount", "time_seed", "None"]
 
+    def _digital_source_map(self, rng, ph, pw, intensity, block_size):
+        """Source pixel coordinates for the displaced-block glitch.
+
+        Block moves are applied in order to the coordinate map instead of the pixels, so
+        overlapping moves compose exactly and the image is read with a single gather.
+        """
+        source_y, source_x = np.mgrid[0:ph, 0:pw]
+        
+        num_blocks = int(intensity * 10)
+        xs = rng.integers(0, pw - block_size, num_blocks)
+        ys = rng.integers(0, ph - block_size, num_blocks)
+        shifts_x = (block_size * rng.uniform(-1, 1, num_blocks)).astype(int)
+        shifts_y = (block_size * rng.uniform(-1, 1, num_blocks)).astype(int)
+        new_xs = np.clip(xs + shifts_x, 0, pw - block_size)
+        new_ys = np.clip(ys + shifts_y, 0, ph - block_size)
+        
+        for x, y, new_x, new_y in zip(xs, ys, new_xs, new_ys):
+            block = (slice(y, y + block_size), slice(x, x + block_size))
+            target = (slice(new_y, new_y + block_size), slice(new_x, new_x + block_size))
+            source_y[target] = source_y[block].copy()
+            source_x[target] = source_x[block].copy()
+        
+        return source_y, source_x
+
     def apply_effect_internal(self, image: np.ndarray, glitch_type: str, intensity: float, 
                             block_size: int, wave_amplitude: float, wave_frequency: float,
                             corruption_amount: float, time_seed: int, **kwargs) -> np.ndarray:
@@ -249,50 +296,42 @@ class FlexImageGlitch(FlexImageBase):
         ph, pw = padded.shape[:2]
         result = padded.copy()
         
-        # Set random seed for reproducibility
-        np.random.seed(time_seed)
+        # Seeded per frame for reproducibility, without touching the global numpy state
+        rng = np.random.default_rng([int(time_seed), int(kwargs.get("frame_index", 0))])
         
         # Apply effects as before, but now working with padded image
         if glitch_type == "digital":
-            for c in range(3):
-                shift_x = int(pw * intensity * np.random.uniform(-0.1, 0.1))
-                shift_y = int(ph * intensity * np.random.uniform(-0.1, 0.1))
-                result[..., c] = np.roll(np.roll(padded[..., c], shift_x, axis=1), shift_y, axis=0)
+            source_y, source_x = self._digital_source_map(rng, ph, pw, intensity, block_size)
             
-            num_blocks = int(intensity * 10)
-            for _ in range(num_blocks):
-                x = np.random.randint(0, pw - block_size)
-                y = np.random.randint(0, ph - block_size)
-                block = result[y:y+block_size, x:x+block_size].copy()
-                
-                shift_x = int(block_size * np.random.uniform(-1, 1))
-                shift_y = int(block_size * np.random.uniform(-1, 1))
-                
-                new_x = np.clip(x + shift_x, 0, pw - block_size)
-                new_y = np.clip(y + shift_y, 0, ph - block_size)
-                
-                result[new_y:new_y+block_size, new_x:new_x+block_size] = block
+            # Per-channel wrap-around shift folded into the same gather
+            channels = padded.shape[2]
+            shift_x = np.zeros(channels, dtype=np.int64)
+            shift_y = np.zeros(channels, dtype=np.int64)
+            for c in range(3):
+                shift_x[c] = int(pw * intensity * rng.uniform(-0.1, 0.1))
+                shift_y[c] = int(ph * intensity * rng.uniform(-0.1, 0.1))
+            gather_y = (source_y[..., None] - shift_y) % ph
+            gather_x = (source_x[..., None] - shift_x) % pw
+            result = padded[gather_y, gather_x, np.arange(channels)]
                 
         elif glitch_type == "compression":
             # Simulate JPEG compression artifacts
             num_blocks_y = ph // block_size
             num_blocks_x = pw // block_size
             
-            for by in range(num_blocks_y):
-                for bx in range(num_blocks_x):
-                    y1, y2 = by * block_size, (by + 1) * block_size
-                    x1, x2 = bx * block_size, (bx + 1) * block_size
-                    
-                    # Random block corruption
-                    if np.random.random() < corruption_amount:
-                        # Quantization effect
-                        block = result[y1:y2, x1:x2]
-                        # Simulate DCT quantization
-                        quant_level = int(8 * intensity)
-                        block = (block * quant_level).astype(int) / quant_level
-                        # Add blocking artifacts
-                        block += np.random.uniform(-0.1, 0.1, block.shape) * intensity
-                        result[y1:y2, x1:x2] = block
+            # Random block corruption, expanded from a block grid to a pixel mask
+            block_mask = rng.random((num_blocks_y, num_blocks_x)) < corruption_amount
+            pixel_mask = np.zeros((ph, pw), dtype=bool)
+            pixel_mask[:num_blocks_y * block_size, :num_blocks_x * block_size] = np.repeat(
+                np.repeat(block_mask, block_size, axis=0), block_size, axis=1)
+            
+            # Quantization effect simulating DCT quantization
+            quant_level = max(1, int(8 * intensity))
+            blocks = result[pixel_mask]
+            blocks = np.trunc(blocks * quant_level) / quant_level
+            # Add blocking artifacts
+            blocks += rng.uniform(-0.1, 0.1, blocks.shape) * intensity
+            result[pixel_mask] = blocks
                 
         elif glitch_type == "wave":
             y_coords, x_coords = np.mgrid[0:ph, 0:pw]
@@ -313,35 +352,36 @@ class FlexImageGlitch(FlexImageBase):
                 result = cv2.remap(result, x_map, y_map, cv2.INTER_LINEAR)
         
         elif glitch_type == "corrupt":
-            # Data corruption simulation
-            for _ in range(int(corruption_amount * 20)):
-                # Random line corruption
-                if np.random.random() < 0.5:
-                    y = np.random.randint(0, ph)
-                    length = int(pw * np.random.uniform(0.1, 0.5))
-                    start = np.random.randint(0, pw - length)
-                    
+            # Data corruption simulation, all events drawn up front
+            num_events = int(corruption_amount * 20)
+            is_line = rng.random(num_events) < 0.5
+            line_y = rng.integers(0, ph, num_events)
+            line_length = (pw * rng.uniform(0.1, 0.5, num_events)).astype(int)
+            line_start = rng.integers(0, pw - line_length)
+            line_shift = rng.integers(-50, 50, num_events)
+            block_y = rng.integers(0, ph - block_size, num_events)
+            block_x = rng.integers(0, pw - block_size, num_events)
+            pattern = rng.integers(0, 3, num_events)
+            
+            # Events overlap, so they are applied in order as slice writes
+            for k in range(num_events):
+                if is_line[k]:
                     # Corrupt line with various effects
-                    corrupt_type = np.random.choice(['repeat', 'shift', 'noise'])
-                    if corrupt_type == 'repeat':
+                    y, start, length = line_y[k], line_start[k], line_length[k]
+                    segment = result[y, start:start+length]
+                    if pattern[k] == 0:  # repeat
                         result[y, start:start+length] = result[y, start]
-                    elif corrupt_type == 'shift':
-                        shift = np.random.randint(-50, 50)
-                        result[y, start:start+length] = np.roll(result[y, start:start+length], shift, axis=0)
+                    elif pattern[k] == 1:  # shift
+                        result[y, start:start+length] = np.roll(segment, line_shift[k], axis=0)
                     else:  # noise
-                        result[y, start:start+length] = np.random.random((length, 3))
-                
-                # Block corruption
+                        result[y, start:start+length] = rng.random((length, result.shape[2]))
                 else:
-                    y = np.random.randint(0, ph - block_size)
-                    x = np.random.randint(0, pw - block_size)
-                    
-                    # Different corruption patterns
-                    pattern = np.random.choice(['solid', 'noise', 'repeat'])
-                    if pattern == 'solid':
-                        result[y:y+block_size, x:x+block_size] = np.random.random(3)
-                    elif pattern == 'noise':
-                        result[y:y+block_size, x:x+block_size] = np.random.random((block_size, block_size, 3))
+                    # Block corruption with different patterns
+                    y, x = block_y[k], block_x[k]
+                    if pattern[k] == 0:  # solid
+                        result[y:y+block_size, x:x+block_size] = rng.random(result.shape[2])
+                    elif pattern[k] == 1:  # noise
+                        result[y:y+block_size, x:x+block_size] = rng.random((block_size, block_size, result.shape[2]))
                     else:  # repeat
                         result[y:y+block_size, x:x+block_size] = result[y, x]
         
@@ -353,7 +393,7 @@ class FlexImageGlitch(FlexImageBase):
             result *= scan_lines
             
             # Add noise
-            noise = np.random.normal(0, 0.1 * intensity, (ph, pw, 3))
+            noise = rng.normal(0, 0.1 * intensity, (ph, pw, 3))
             result += noise
             
             # Add vertical hold distortion
@@ -437,6 +477,8 @@ class FlexImagePixelate(FlexImageBase):
     
 @apply_tooltips
 class FlexImageBloom(FlexImageBase):
+    SUPPORTS_BATCH = True
+
     @classmethod
     def INPUT_TYPES(cls):
         base_inputs = super().INPUT_TYPES()
@@ -480,8 +522,17 @@ class FlexImageBloom(FlexImageBase):
             self.weights_cache[key] = weights / weights.sum()
         return self.weights_cache[key]
 
-    def _prepare_mask(self, opt_mask, bright_mask_shape, frame_index):
-        """Prepare and transform mask for bloom effect"""
+    def _get_pass_weight_matrix(self, num_passes):
+        """Per-frame pass weights as an (N, max_passes) matrix, zero past each frame's pass count"""
+        device = self._get_device()
+        num_passes = num_passes.long()
+        matrix = torch.zeros(len(num_passes), int(num_passes.max()), device=device)
+        for passes in torch.unique(num_passes).tolist():
+            matrix[num_passes == passes, :passes] = self._get_pass_weights(passes)
+        return matrix
+
+    def _prepare_mask(self, opt_mask, bright_mask_shape, frame_indices):
+        """Upload the mask batch once and resize it to (N, H, W) for the given frames"""
         device = self._get_device()
         
         # Skip if no mask provided
@@ -493,27 +544,26 @@ class FlexImageBloom(FlexImageBase):
             mask_tensor = torch.from_numpy(opt_mask).to(device)
         else:
             mask_tensor = opt_mask.to(device)
+        mask_tensor = mask_tensor.float()
         
-        # Extract the correct frame from batched masks
-        if len(mask_tensor.shape) > 2:
-            mask_tensor = mask_tensor[frame_index]
-        
-        # Ensure mask is 2D
-        if len(mask_tensor.shape) > 2:
-            mask_tensor = mask_tensor.squeeze()
+        # A single 2D mask applies to every frame
+        if len(mask_tensor.shape) == 2:
+            mask_tensor = mask_tensor.unsqueeze(0)
+        mask_tensor = mask_tensor.reshape(-1, *mask_tensor.shape[-2:])
+        mask_tensor = mask_tensor[frame_indices % mask_tensor.shape[0]]
         
         # Only resize if necessary
-        if mask_tensor.shape != bright_mask_shape:
+        if tuple(mask_tensor.shape[-2:]) != tuple(bright_mask_shape):
             mask_tensor = torch.nn.functional.interpolate(
-                mask_tensor.unsqueeze(0).unsqueeze(0),
+                mask_tensor.unsqueeze(1),
                 size=bright_mask_shape,
                 mode='bilinear'
-            ).squeeze()
+            ).squeeze(1)
             
         return mask_tensor
 
-    def _prepare_normal_map(self, opt_normal_map, frame_index):
-        """Prepare normal map for directional bloom"""
+    def _prepare_normal_map(self, opt_normal_map, frame_indices):
+        """Upload the normal map batch once and compute (N, H, W) surface alignment"""
         device = self._get_device()
         
         # Skip if no normal map provided
@@ -525,110 +575,123 @@ class FlexImageBloom(FlexImageBase):
             normal_tensor = torch.from_numpy(opt_normal_map).to(device)
         else:
             normal_tensor = opt_normal_map.to(device)
+        normal_tensor = normal_tensor.float()
         
-        # Extract the correct frame
-        if len(normal_tensor.shape) > 3:
-            normal_tensor = normal_tensor[frame_index]
+        # Select the frames, a single normal map applies to every frame
+        if len(normal_tensor.shape) == 3:
+            normal_tensor = normal_tensor.unsqueeze(0)
+        normal_tensor = normal_tensor[frame_indices % normal_tensor.shape[0]]
         
         # Convert normal map to [-1,1] range
         normals = normal_tensor * 2.0 - 1.0
         
         # Calculate surface alignment
-        view_vector = torch.tensor([0, 0, 1], device=device)
-        surface_alignment = torch.sum(normals * view_vector, dim=2)
+        view_vector = torch.tensor([0, 0, 1], device=device, dtype=normals.dtype)
+        surface_alignment = torch.sum(normals[..., :3] * view_vector, dim=-1)
         surface_alignment = (surface_alignment + 1) * 0.5
         
         return surface_alignment
 
-    def apply_effect_internal(self, image: np.ndarray, threshold: float, blur_amount: float, 
-                              intensity: float, num_passes: int, color_bleeding: float,
-                              falloff: float, opt_normal_map: np.ndarray = None, 
-                              opt_mask: np.ndarray = None, **kwargs) -> np.ndarray:
-        # Skip processing if intensity is 0
-        if intensity <= 0.001:
-            return image
-            
-        # Skip processing if blur amount is 0
-        if blur_amount <= 0.001:
-            return image
-        
-        # Get device and convert input to tensor
+    def apply_effect_internal(self, image: np.ndarray, **kwargs) -> np.ndarray:
+        return self.apply_effect_batch_to_frame(image, **kwargs)
+
+    # Frames processed together per device round trip
+    BATCH_SIZE = 16
+
+    def apply_effect_batch(self, images: torch.Tensor, threshold: torch.Tensor, blur_amount: torch.Tensor,
+                           intensity: torch.Tensor, num_passes: torch.Tensor, color_bleeding: torch.Tensor,
+                           falloff: torch.Tensor, opt_normal_map=None, opt_mask=None, frame_index=None,
+                           **kwargs) -> torch.Tensor:
         device = self._get_device()
-        frame_index = kwargs.get('frame_index', 0)
-        
-        # Convert image to tensor efficiently
-        image_tensor = torch.from_numpy(image).to(device)
-        
+        num_frames, h, w = images.shape[:3]
+        if frame_index is None:
+            frame_index = torch.arange(num_frames)
+        frame_index = frame_index.to(device)
+
+        # Optional inputs are uploaded and resized once for the whole batch
+        masks = self._prepare_mask(opt_mask, (h, w), frame_index)
+        alignments = self._prepare_normal_map(opt_normal_map, frame_index)
+
+        result = torch.empty_like(images)
+        for start in range(0, num_frames, self.BATCH_SIZE):
+            end = min(start + self.BATCH_SIZE, num_frames)
+            result[start:end] = self._apply_bloom(
+                images[start:end].to(device),
+                threshold[start:end].to(device),
+                blur_amount[start:end].to(device),
+                intensity[start:end].to(device),
+                num_passes[start:end].to(device),
+                color_bleeding[start:end].to(device),
+                falloff[start:end].to(device),
+                masks[start:end] if masks is not None else None,
+                alignments[start:end] if alignments is not None else None,
+            ).to(images.device)
+        return result
+
+    def _apply_bloom(self, image_tensor, threshold, blur_amount, intensity, num_passes, color_bleeding,
+                     falloff, mask_tensor, surface_alignment):
+        """Bloom for a (B, H, W, C) chunk with (B,) parameters, all on the bloom device"""
+        h, w = image_tensor.shape[1:3]
+
+        def per_pixel(values):
+            return values.view(-1, 1, 1)
+
         # Extract bright areas with smooth threshold - vectorized operation
-        brightness = torch.max(image_tensor, dim=2)[0]
-        # Only process if brightness exceeds threshold
-        if torch.max(brightness) <= threshold:
-            return image
+        brightness = torch.max(image_tensor, dim=3)[0]
+
+        # Only process frames with visible intensity and blur whose brightness exceeds threshold
+        active = (intensity > 0.001) & (blur_amount > 0.001)
+        active &= brightness.flatten(1).max(dim=1)[0] > threshold
             
         # Calculate bright mask with threshold
-        bright_mask = torch.clamp((brightness - threshold) / max(1e-6, 1 - threshold), 0, 1)
-        bright_mask = torch.pow(bright_mask, falloff)
+        bright_mask = torch.clamp((brightness - per_pixel(threshold)) / per_pixel(torch.clamp(1 - threshold, min=1e-6)), 0, 1)
+        bright_mask = torch.pow(bright_mask, per_pixel(falloff))
         
         # Process mask if provided
-        mask_tensor = self._prepare_mask(opt_mask, bright_mask.shape, frame_index)
         if mask_tensor is not None:
             bright_mask = bright_mask * mask_tensor
             
-        # Skip if bright mask is empty after masking
-        if torch.max(bright_mask) <= 0.001:
-            return image
+        # Skip frames whose bright mask is empty after masking
+        active &= bright_mask.flatten(1).max(dim=1)[0] > 0.001
+        if not active.any():
+            return image_tensor
         
         # Calculate color bleeding contribution
-        if color_bleeding > 0:
-            mean_color = torch.mean(image_tensor, dim=2, keepdim=True)
-            color_contribution = image_tensor * (1 - color_bleeding) + mean_color * color_bleeding
-        else:
-            color_contribution = image_tensor
+        mean_color = torch.mean(image_tensor, dim=3, keepdim=True)
+        bleeding = color_bleeding.view(-1, 1, 1, 1)
+        color_contribution = image_tensor * (1 - bleeding) + mean_color * bleeding
+        
+        # Apply bright mask with color contribution, in NCHW for the blur
+        contribution = (color_contribution * bright_mask.unsqueeze(-1)).permute(0, 3, 1, 2)
         
         # Initialize bloom accumulator
-        bloom_accumulator = torch.zeros_like(image_tensor)
+        bloom_accumulator = torch.zeros_like(contribution)
         
         # Get pass weights
-        pass_weights = self._get_pass_weights(num_passes)
+        pass_weights = self._get_pass_weight_matrix(num_passes)
         
-        # Process normal map if provided
-        surface_alignment = self._prepare_normal_map(opt_normal_map, frame_index)
-        
-        # Multi-pass gaussian blur
-        for i in range(num_passes):
+        # Multi-pass gaussian blur, one convolution per distinct kernel size in each pass
+        for i in range(pass_weights.shape[1]):
             # Calculate adaptive kernel size for this pass
-            kernel_size = int(blur_amount * (1 + i)) | 1  # Ensure odd
-            kernel_size = max(3, min(kernel_size, min(image.shape[:2])))
-            sigma = kernel_size / 6.0
-            
-            # Skip if the weight contribution would be negligible
-            if pass_weights[i] < 0.01:
-                continue
-                
-            # Apply bright mask with color contribution
-            bright_mask_expanded = bright_mask.unsqueeze(-1)
-            pass_contribution = color_contribution * bright_mask_expanded
-            
-            # Apply gaussian blur efficiently
-            pass_contribution = apply_gaussian_blur_gpu(
-                pass_contribution.permute(2, 0, 1),
-                kernel_size,
-                sigma
-            ).permute(1, 2, 0)
+            kernel_sizes = (blur_amount * (1 + i)).long() | 1  # Ensure odd
+            kernel_sizes = torch.clamp(kernel_sizes, max=min(h, w)).clamp(min=3)
             
-            # Modulate by surface alignment if normal map is provided
-            if surface_alignment is not None:
-                pass_contribution = pass_contribution * (1 - surface_alignment.unsqueeze(-1))
-            
-            # Add weighted contribution to accumulator
-            bloom_accumulator.add_(pass_contribution * pass_weights[i])
+            # Skip frames where the weight contribution would be negligible
+            contributing = active & (pass_weights[:, i] >= 0.01)
+            for kernel_size in torch.unique(kernel_sizes[contributing]).tolist():
+                selected = torch.nonzero(contributing & (kernel_sizes == kernel_size)).squeeze(1)
+                blurred = apply_gaussian_blur_gpu(contribution[selected], kernel_size, kernel_size / 6.0)
+                bloom_accumulator[selected] += blurred * pass_weights[selected, i].view(-1, 1, 1, 1)
         
-        # Combine with original image using intensity
-        result = image_tensor + bloom_accumulator * intensity
+        bloom_accumulator = bloom_accumulator.permute(0, 2, 3, 1)
         
-        # Convert back to numpy and ensure range
-        result = result.cpu().numpy()
-        return np.clip(result, 0, 1)
+        # Modulate by surface alignment if normal map is provided
+        if surface_alignment is not None:
+            bloom_accumulator = bloom_accumulator * (1 - surface_alignment.unsqueeze(-1))
+        
+        # Combine with original image using intensity
+        result = torch.clamp(image_tensor + bloom_accumulator * intensity.view(-1, 1, 1, 1), 0, 1)
+        return torch.where(active.view(-1, 1, 1, 1), result, image_tensor)
     
 @apply_tooltips
 class FlexImageTiltShift(FlexImageBase):
@@ -655,42 +718,63 @@ class FlexImageTiltShift(FlexImageBase):
         return ["blur_amount", "focus_position_x", "focus_position_y", "focus_width", "focus_height", 
                 "bokeh_size", "bokeh_brightness", "chromatic_aberration", "None"]
 
-    def _create_bokeh_kernel(self, size, shape, brightness):
+    # Working kernel width the blur pyramid aims for at reduced resolution
+    PYRAMID_KERNEL_SIZE = 9
+    MAX_PYRAMID_FACTOR = 4
+    MAX_CACHED_KERNELS = 32
+
+    def __init__(self):
+        super().__init__()
+        self._kernel_cache = OrderedDict()  # LRU of unit-sum bokeh kernels by (shape, kernel_size)
+
+    def _create_bokeh_kernel(self, kernel_size, shape):
+        """Get cached unit-sum bokeh kernel or create a new one"""
+        key = (shape, kernel_size)
+        kernel = self._kernel_cache.get(key)
+        if kernel is not None:
+            self._kernel_cache.move_to_end(key)
+            return kernel
+
         # Create bokeh kernel based on shape
-        kernel_size = int(size * 20) | 1  # Ensure odd size
         center = kernel_size // 2
-        kernel = np.zeros((kernel_size, kernel_size), dtype=np.float32)
+        y, x = np.ogrid[-center:center+1, -center:center+1]
         
         if shape == "circular":
-            y, x = np.ogrid[-center:center+1, -center:center+1]
             mask = x*x + y*y <= center*center
-            kernel[mask] = 1.0
-            
         elif shape == "hexagonal":
-            for y in range(kernel_size):
-                for x in range(kernel_size):
-                    # Hexagonal distance calculation
-                    dx = abs(x - center)
-                    dy = abs(y - center)
-                    if dx * 0.866025 + dy * 0.5 <= center:
-                        kernel[y, x] = 1.0
-                        
+            # Hexagonal distance calculation
+            mask = np.abs(x) * 0.866025 + np.abs(y) * 0.5 <= center
         elif shape == "star":
-            for y in range(kernel_size):
-                for x in range(kernel_size):
-                    dx = x - center
-                    dy = y - center
-                    angle = np.arctan2(dy, dx)
-                    dist = np.sqrt(dx*dx + dy*dy)
-                    # Create 6-point star shape
-                    star_factor = np.abs(np.sin(3 * angle))
-                    if dist <= center * (0.8 + 0.2 * star_factor):
-                        kernel[y, x] = 1.0
-        
-        # Normalize and apply brightness
-        kernel = kernel / np.sum(kernel) * brightness
+            angle = np.arctan2(y, x)
+            dist = np.sqrt(x*x + y*y)
+            # Create 6-point star shape
+            star_factor = np.abs(np.sin(3 * angle))
+            mask = dist <= center * (0.8 + 0.2 * star_factor)
+        else:
+            mask = np.zeros((kernel_size, kernel_size), dtype=bool)
+        kernel = mask.astype(np.float32)
+        
+        # Normalize; brightness is applied as a gain on the blurred image
+        kernel = kernel / np.sum(kernel)
+        self._kernel_cache[key] = kernel
+        if len(self._kernel_cache) > self.MAX_CACHED_KERNELS:
+            self._kernel_cache.popitem(last=False)
         return kernel
 
+    def _bokeh_blur(self, image, size, shape):
+        """Unit-gain bokeh blur of all channels at once, run at reduced resolution for large kernels."""
+        h, w = image.shape[:2]
+        kernel_size = int(size * 20) | 1
+        factor = 1
+        while factor < self.MAX_PYRAMID_FACTOR and kernel_size // (factor * 2) >= self.PYRAMID_KERNEL_SIZE:
+            factor *= 2
+        if factor == 1:
+            return cv2.filter2D(image, -1, self._create_bokeh_kernel(kernel_size, shape))
+
+        small = cv2.resize(image, (max(1, w // factor), max(1, h // factor)), interpolation=cv2.INTER_AREA)
+        blurred = cv2.filter2D(small, -1, self._create_bokeh_kernel(int(size / factor * 20) | 1, shape))
+        return cv2.resize(blurred, (w, h), interpolation=cv2.INTER_LINEAR)
+
     def apply_effect_internal(self, image: np.ndarray, blur_amount: float, focus_position_x: float, 
                               focus_position_y: float, focus_width: float, focus_height: float, 
                               focus_shape: str, bokeh_shape: str, bokeh_size: float,
@@ -722,16 +806,15 @@ class FlexImageTiltShift(FlexImageBase):
         # Apply gaussian blur to mask for smooth transition
         mask = cv2.GaussianBlur(mask, (0, 0), sigmaX=min(width, height) / 6)
 
-        # Create bokeh kernel
-        bokeh_kernel = self._create_bokeh_kernel(bokeh_size, bokeh_shape, bokeh_brightness)
-        
-        # Process each channel separately for chromatic aberration
+        color = np.ascontiguousarray(image[..., :3])
+        blurred = self._bokeh_blur(color, bokeh_size, bokeh_shape)
+
+        # Channel-specific blur gain for chromatic aberration; blur is linear, so the
+        # kernel brightness and gain are applied after a single multichannel filter
+        gains = (blur_amount + (np.arange(3, dtype=np.float32) - 1) * chromatic_aberration * blur_amount) * bokeh_brightness
+        mask = mask[..., None]
         result = np.zeros_like(image)
-        for c in range(3):
-            # Apply channel-specific blur offset for chromatic aberration
-            offset = (c - 1) * chromatic_aberration * blur_amount
-            channel_blur = cv2.filter2D(image[..., c], -1, bokeh_kernel * (blur_amount + offset))
-            result[..., c] = image[..., c] * mask + channel_blur * (1 - mask)
+        result[..., :3] = color * mask + blurred * gains * (1 - mask)
 
         return np.clip(result, 0, 1)
     
@@ -755,18 +838,6 @@ class FlexImageParallax(FlexImageBase):
     def get_modifiable_params(cls):
         return ["shift_x", "shift_y", "shift_z"]
 
-    def __init__(self):
-        super().__init__()
-        self._cached_coords = {}  # Cache for coordinate grids
-
-    def _get_coordinate_grid(self, h, w):
-        """Get cached coordinate grid or create a new one"""
-        key = (h, w)
-        if key not in self._cached_coords:
-            y, x = np.mgrid[0:h, 0:w].astype(np.float32)
-            self._cached_coords[key] = (x, y)
-        return self._cached_coords[key]
-
     def apply_effect_internal(
         self,
         image: np.ndarray,
@@ -779,52 +850,36 @@ class FlexImageParallax(FlexImageBase):
     ) -> np.ndarray:
         h, w, _ = image.shape
 
-        # Get cached coordinate grid
-        x, y = self._get_coordinate_grid(h, w)
-        
-        # Define center once
+        # Coordinates relative to the center, shared by every frame at this resolution
         cx, cy = w / 2, h / 2
+        x_centered, y_centered = remap_grids.field(("centered", h, w), lambda: self._centered_grid(h, w))
 
         if depth_map is not None:
-            # Get the depth map for this frame
-            depth_frame = depth_map[frame_index].cpu().numpy()
-            
-            # Convert to grayscale by averaging channels
-            depth_gray = np.mean(depth_frame, axis=-1)
-            
-            # Normalize safely
-            max_depth = np.max(depth_gray)
-            if max_depth > 0:
-                depth_normalized = depth_gray / max_depth
-            else:
-                depth_normalized = depth_gray
-
-            # Calculate displacements based on depth
-            dx = w * shift_x * depth_normalized
-            dy = h * shift_y * depth_normalized
-            scale_factor = 1 + shift_z * depth_normalized
+            # Normalized depth is computed once per depth batch and reused across frames and runs
+            depth_normalized = remap_grids.depth_field(depth_map, frame_index)
+
+            # Shift by depth, then scale around the center by depth
+            scale_factor = depth_normalized * shift_z + 1
+            map_x = cv2.scaleAdd(depth_normalized, w * shift_x, x_centered) * scale_factor + cx
+            map_y = cv2.scaleAdd(depth_normalized, h * shift_y, y_centered) * scale_factor + cy
         else:
             # Uniform displacement when no depth map
-            dx = np.full((h, w), shift_x * w, dtype=np.float32)
-            dy = np.full((h, w), shift_y * h, dtype=np.float32)
-            scale_factor = np.full((h, w), 1 + shift_z, dtype=np.float32)
+            scale_factor = 1 + shift_z
+            map_x = (x_centered + shift_x * w) * scale_factor + cx
+            map_y = (y_centered + shift_y * h) * scale_factor + cy
 
-        # Apply shifts
-        x_shifted = x + dx
-        y_shifted = y + dy
-
-        # Vectorized scaling around center
-        x_scaled = cx + (x_shifted - cx) * scale_factor
-        y_scaled = cy + (y_shifted - cy) * scale_factor
-
-        # Create maps for cv2.remap - more efficient than simple indexing
-        map_x = np.clip(x_scaled, 0, w - 1).astype(np.float32)
-        map_y = np.clip(y_scaled, 0, h - 1).astype(np.float32)
+        np.clip(map_x, 0, w - 1, out=map_x)
+        np.clip(map_y, 0, h - 1, out=map_y)
 
         # Use cv2.remap for better interpolation
         result = cv2.remap(image, map_x, map_y, interpolation=cv2.INTER_LINEAR, borderMode=cv2.BORDER_REFLECT)
 
         return result
+
+    @staticmethod
+    def _centered_grid(h, w):
+        x, y = remap_grids.coordinate_grid(h, w)
+        return x - np.float32(w / 2), y - np.float32(h / 2)
     
 @apply_tooltips
 class FlexImageContrast(FlexImageBase):
@@ -897,58 +952,86 @@ class FlexImageWarp(FlexImageBase):
                               warp_seed: int = 0, **kwargs) -> np.ndarray:
         h, w = image.shape[:2]
         center = (int(w * center_x), int(h * center_y))
-        
-        # Create meshgrid
-        y, x = np.mgrid[0:h, 0:w].astype(np.float32)
-        
-        # Calculate distance from center
-        dx = x - center[0]
-        dy = y - center[1]
-        dist = np.sqrt(dx**2 + dy**2)
-        
-        # Create a mask based on the radius
-        max_dist = np.sqrt(w**2 + h**2)
-        mask = np.clip(1 - dist / (radius * max_dist), 0, 1)
-        
+        x, y = remap_grids.coordinate_grid(h, w)
+
+        # Each warp type keeps a unit-strength field, so a frame only scales it by warp_strength
         if warp_type == "noise":
-            # Generate noise for warping
-            np.random.seed(warp_seed)
-            noise = np.zeros((h, w, 2))
-            for _ in range(warp_octaves):
-                freq = warp_frequency * (2 ** _)
-                amp = warp_strength / (2 ** _)
-                # Calculate phase grid
-                phase_x = freq * x / w
-                phase_y = freq * y / h
-                # Generate random noise and modulate with sine waves
-                rand_noise = np.random.rand(h, w, 2)
-                noise += amp * rand_noise * np.stack((np.sin(phase_y), np.sin(phase_x)), axis=-1)
-            
-            x_warped = x + noise[:,:,0] * w * mask
-            y_warped = y + noise[:,:,1] * h * mask
-            
+            warp_octaves = int(warp_octaves)
+            offset_x, offset_y = remap_grids.field(
+                ("warp_noise", h, w, center, radius, warp_seed, warp_frequency, warp_octaves),
+                lambda: self._noise_field(h, w, center, radius, warp_seed, warp_frequency, warp_octaves),
+            )
+            x_warped = cv2.scaleAdd(offset_x, warp_strength, x)
+            y_warped = cv2.scaleAdd(offset_y, warp_strength, y)
+
         elif warp_type == "twist":
-            angle = np.arctan2(dy, dx)
-            twist = warp_strength * dist * mask
-            x_warped = x + np.sin(angle + twist) * dist - dx
-            y_warped = y - np.cos(angle + twist) * dist - dy
-            
+            angle, dist, dist_masked = remap_grids.field(
+                ("warp_twist", h, w, center, radius),
+                lambda: self._twist_field(h, w, center, radius),
+            )
+            twisted = cv2.scaleAdd(dist_masked, warp_strength, angle)
+            x_warped = center[0] + np.sin(twisted) * dist
+            y_warped = center[1] - np.cos(twisted) * dist
+
         elif warp_type == "bulge":
-            bulge = 1 + warp_strength * mask
-            x_warped = center[0] + dx * bulge
-            y_warped = center[1] + dy * bulge
-        
+            offset_x, offset_y = remap_grids.field(
+                ("warp_bulge", h, w, center, radius),
+                lambda: self._bulge_field(h, w, center, radius),
+            )
+            x_warped = cv2.scaleAdd(offset_x, warp_strength, x)
+            y_warped = cv2.scaleAdd(offset_y, warp_strength, y)
+
         else:
             raise ValueError(f"Unknown warp type: {warp_type}")
-        
+
         # Ensure warped coordinates are within image bounds
-        x_warped = np.clip(x_warped, 0, w-1)
-        y_warped = np.clip(y_warped, 0, h-1)
-        
+        x_warped = np.clip(x_warped, 0, w-1).astype(np.float32, copy=False)
+        y_warped = np.clip(y_warped, 0, h-1).astype(np.float32, copy=False)
+
         # Remap image
-        warped = cv2.remap(image, x_warped.astype(np.float32), y_warped.astype(np.float32), cv2.INTER_LINEAR)
-        
+        warped = cv2.remap(image, x_warped, y_warped, cv2.INTER_LINEAR)
+
         return warped
+
+    @staticmethod
+    def _radial_geometry(h, w, center, radius):
+        """Offsets from the center, distance and radial falloff mask."""
+        x, y = remap_grids.coordinate_grid(h, w)
+        dx = x - center[0]
+        dy = y - center[1]
+        dist = np.sqrt(dx**2 + dy**2)
+
+        # Create a mask based on the radius
+        max_dist = np.sqrt(w**2 + h**2)
+        mask = np.clip(1 - dist / (radius * max_dist), 0, 1).astype(np.float32)
+        return dx, dy, dist, mask
+
+    @classmethod
+    def _noise_field(cls, h, w, center, radius, warp_seed, warp_frequency, warp_octaves):
+        *_, mask = cls._radial_geometry(h, w, center, radius)
+        x, y = remap_grids.coordinate_grid(h, w)
+
+        # Octave noise at unit strength, modulated with sine waves
+        rng = np.random.RandomState(warp_seed)
+        noise = np.zeros((h, w, 2), dtype=np.float32)
+        for octave in range(warp_octaves):
+            freq = warp_frequency * (2 ** octave)
+            phase_x = freq * x / w
+            phase_y = freq * y / h
+            rand_noise = rng.rand(h, w, 2)
+            noise += (rand_noise * np.stack((np.sin(phase_y), np.sin(phase_x)), axis=-1) / (2 ** octave)).astype(np.float32)
+
+        return noise[:, :, 0] * w * mask, noise[:, :, 1] * h * mask
+
+    @classmethod
+    def _twist_field(cls, h, w, center, radius):
+        dx, dy, dist, mask = cls._radial_geometry(h, w, center, radius)
+        return np.arctan2(dy, dx), dist, dist * mask
+
+    @classmethod
+    def _bulge_field(cls, h, w, center, radius):
+        dx, dy, _, mask = cls._radial_geometry(h, w, center, radius)
+        return dx * mask, dy * mask
     
 
 @apply_tooltips
@@ -1139,34 +1222,17 @@ class FlexImageDepthWarp(FlexImageBase):
         h, w, _ = image.shape
 
         if depth_map is not None:
-            # Extract the depth map for the current frame
-            depth_map_frame = depth_map[frame_index].cpu().numpy()
-
-            # Compute the depth value as the average of the 3 color channels
-            depth_map_gray = np.mean(depth_map_frame, axis=-1)
+            # Depth centered on 0.5 is computed once per depth batch and reused across frames and runs
+            depth_centered = remap_grids.depth_field(depth_map, frame_index, offset=-0.5)
+            x, y = remap_grids.coordinate_grid(h, w)
 
-            # Normalize the depth map to [0,1]
-            depth_map_normalized = depth_map_gray / np.max(depth_map_gray)
-
-            # Compute displacements based on depth
             # warp_strength controls the maximum displacement in pixels
-            dx = warp_strength * (depth_map_normalized - 0.5) * w
-            dy = warp_strength * (depth_map_normalized - 0.5) * h
-
-            # Generate coordinate grid
-            x, y = np.meshgrid(np.arange(w), np.arange(h))
-
-            # Apply displacements
-            x_displaced = x + dx
-            y_displaced = y + dy
+            map_x = cv2.scaleAdd(depth_centered, warp_strength * w, x)
+            map_y = cv2.scaleAdd(depth_centered, warp_strength * h, y)
 
             # Ensure coordinates are within image bounds
-            x_displaced = np.clip(x_displaced, 0, w - 1)
-            y_displaced = np.clip(y_displaced, 0, h - 1)
-
-            # Warp the image using remapping
-            map_x = x_displaced.astype(np.float32)
-            map_y = y_displaced.astype(np.float32)
+            np.clip(map_x, 0, w - 1, out=map_x)
+            np.clip(map_y, 0, h - 1, out=map_y)
 
             warped_image = cv2.remap(image, map_x, map_y, interpolation=cv2.INTER_LINEAR)
 
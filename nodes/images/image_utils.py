@@ -1,3 +1,6 @@
+import os
+import weakref
+from collections import OrderedDict
 import numpy as np
 import cv2
 import torch
@@ -153,7 +156,8 @@ def apply_gaussian_blur_gpu(x: torch.Tensor, kernel_size: int, sigma: float) ->
         return x
         
     # Ensure input is in the right format (N, C, H, W)
-    if len(x.shape) == 3:
+    unbatched = len(x.shape) == 3
+    if unbatched:
         x = x.unsqueeze(0)
     
     # Create gaussian kernel
@@ -167,7 +171,7 @@ def apply_gaussian_blur_gpu(x: torch.Tensor, kernel_size: int, sigma: float) ->
     groups = x.shape[1]  # Number of channels
     blurred = torch.nn.functional.conv2d(x_padded, kernel, groups=groups, padding=0)
     
-    return blurred.squeeze(0) if len(x.shape) == 4 else blurred
+    return blurred.squeeze(0) if unbatched else blurred
 
 
 
@@ -396,4 +400,239 @@ def apply_line_corruption(image: torch.Tensor, corruption_probability: float, de
         else:  # Repeat
             result[y] = image[y].roll(1, dims=0)
     
-    return result
\ No newline at end of file
+    return result
+
+# Parsed LUT files shared by every node in the process, least recently used first.
+# Keyed by path, with the modification time stored alongside so an edited file replaces its old table.
+LUT_CACHE_SIZE = 8
+_LUT_CACHE = OrderedDict()
+
+def _parse_cube_lut(lut_file: str) -> dict:
+    """Parse an Adobe/Resolve .cube file into a LUT dict."""
+    size = None
+    kind = "3d"
+    domain_min = [0.0, 0.0, 0.0]
+    domain_max = [1.0, 1.0, 1.0]
+    rows = []
+    with open(lut_file, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            keyword = line.split()[0].upper()
+            if keyword == "LUT_3D_SIZE":
+                size = int(line.split()[1])
+            elif keyword == "LUT_1D_SIZE":
+                size = int(line.split()[1])
+                kind = "1d"
+            elif keyword == "DOMAIN_MIN":
+                domain_min = [float(v) for v in line.split()[1:4]]
+            elif keyword == "DOMAIN_MAX":
+                domain_max = [float(v) for v in line.split()[1:4]]
+            elif keyword[0].isdigit() or keyword[0] in "-.":
+                rows.append([float(v) for v in line.split()[:3]])
+            # TITLE and other metadata keywords are ignored
+
+    table = np.asarray(rows, dtype=np.float32)
+    if size is None:
+        raise ValueError(f"Missing LUT_3D_SIZE/LUT_1D_SIZE in {lut_file}")
+    if kind == "3d":
+        # Red varies fastest in .cube data, so reshape to (b, g, r, 3)
+        table = table.reshape(size, size, size, 3)
+    else:
+        table = table.reshape(size, 3)
+    return {"kind": kind, "table": table,
+            "domain_min": np.asarray(domain_min, dtype=np.float32),
+            "domain_max": np.asarray(domain_max, dtype=np.float32)}
+
+def _parse_image_lut(lut_file: str) -> dict:
+    """Load a HALD CLUT image or a 256-entry 1D LUT strip into a LUT dict."""
+    image = cv2.imread(lut_file, cv2.IMREAD_UNCHANGED)
+    if image is None:
+        raise ValueError(f"Failed to read LUT image {lut_file}")
+    if image.ndim == 2:
+        image = cv2.cvtColor(image, cv2.COLOR_GRAY2RGB)
+    image = cv2.cvtColor(image[..., :3], cv2.COLOR_BGR2RGB)
+    scale = np.iinfo(image.dtype).max if np.issubdtype(image.dtype, np.integer) else 1.0
+    pixels = image.reshape(-1, 3).astype(np.float32) / scale
+
+    if pixels.shape[0] == 256:
+        return {"kind": "1d", "table": pixels,
+                "domain_min": np.zeros(3, dtype=np.float32), "domain_max": np.ones(3, dtype=np.float32)}
+
+    # HALD level L stores an (L^2)^3 cube in an L^3 x L^3 image, red varying fastest
+    size = int(round(pixels.shape[0] ** (1 / 3)))
+    if size ** 3 != pixels.shape[0]:
+        raise ValueError(f"{lut_file} is neither a HALD CLUT nor a 256 entry LUT")
+    return {"kind": "3d", "table": pixels.reshape(size, size, size, 3),
+            "domain_min": np.zeros(3, dtype=np.float32), "domain_max": np.ones(3, dtype=np.float32)}
+
+def load_lut(lut_file: str):
+    """
+    Load a .cube or HALD/1D image LUT, cached process-wide.
+
+    :param lut_file: Path to the LUT file
+    :return: Dict with "kind" ("1d" or "3d"), "table" and domain bounds, or None if it can't be loaded
+    """
+    if not lut_file:
+        return None
+    try:
+        mtime = os.path.getmtime(lut_file)
+    except OSError:
+        print(f"Warning: Failed to load LUT file: {lut_file}")
+        return None
+    entry = _LUT_CACHE.get(lut_file)
+    if entry is not None and entry[0] == mtime:
+        _LUT_CACHE.move_to_end(lut_file)
+        return entry[1]
+
+    # Drop the table parsed from an older version of the file before reparsing
+    _LUT_CACHE.pop(lut_file, None)
+    try:
+        if lut_file.lower().endswith(".cube"):
+            lut = _parse_cube_lut(lut_file)
+        else:
+            lut = _parse_image_lut(lut_file)
+    except (ValueError, OSError) as e:
+        print(f"Warning: Failed to load LUT file: {lut_file} ({e})")
+        return None
+    _LUT_CACHE[lut_file] = (mtime, lut)
+    while len(_LUT_CACHE) > LUT_CACHE_SIZE:
+        _LUT_CACHE.popitem(last=False)
+    return lut
+
+def apply_lut_batch(images: torch.Tensor, lut: dict) -> torch.Tensor:
+    """
+    Look up a whole (N, H, W, 3) batch in a LUT with linear (1D) or trilinear (3D) interpolation.
+
+    :param images: RGB images in [0, 1], BHWC
+    :param lut: LUT dict from load_lut
+    :return: Graded images with the same shape
+    """
+    device = images.device
+    domain_min = torch.from_numpy(lut["domain_min"]).to(device)
+    domain_max = torch.from_numpy(lut["domain_max"]).to(device)
+    coords = ((images - domain_min) / (domain_max - domain_min)).clamp(0, 1)
+    table = torch.from_numpy(lut["table"]).to(device)
+
+    if lut["kind"] == "1d":
+        # Per-channel linear interpolation into the (size, 3) table
+        position = coords * (table.shape[0] - 1)
+        lower = position.floor().long().clamp(max=table.shape[0] - 2)
+        frac = position - lower
+        channels = torch.arange(3, device=device).expand_as(lower)
+        low_values = table[lower, channels]
+        high_values = table[lower + 1, channels]
+        return low_values + (high_values - low_values) * frac
+
+    # grid_sample on a (1, 3, b, g, r) volume is a trilinear lookup with (x, y, z) = (r, g, b)
+    volume = table.permute(3, 0, 1, 2).unsqueeze(0)
+    grid = (coords * 2 - 1).unsqueeze(0)
+    graded = torch.nn.functional.grid_sample(volume, grid, mode="bilinear", padding_mode="border", align_corners=True)
+    return graded[0].permute(1, 2, 3, 0)
+
+class RemapGridCache:
+    """
+    Process-wide cache of coordinate grids and displacement fields for cv2.remap based effects.
+
+    Base grids are kept per resolution. Derived fields (normalized depth, warp offsets) are kept
+    in an LRU bounded by total bytes, so frames and runs that share a depth map or warp layout
+    only pay for a scaled add and the remap itself.
+    """
+
+    def __init__(self, max_bytes: int = 512 << 20):
+        self.max_bytes = max_bytes
+        self._grids = {}
+        self._fields = OrderedDict()
+        self._field_bytes = 0
+
+    def coordinate_grid(self, h: int, w: int):
+        """
+        Get the read-only (x, y) float32 pixel coordinate grids for a resolution.
+
+        :param h: Image height
+        :param w: Image width
+        :return: Tuple of (x, y) arrays of shape (h, w)
+        """
+        key = (h, w)
+        if key not in self._grids:
+            y, x = np.mgrid[0:h, 0:w].astype(np.float32)
+            x.setflags(write=False)
+            y.setflags(write=False)
+            self._grids[key] = (x, y)
+        return self._grids[key]
+
+    @staticmethod
+    def _nbytes(value) -> int:
+        if isinstance(value, (tuple, list)):
+            return sum(getattr(item, "nbytes", 0) for item in value)
+        return getattr(value, "nbytes", 0)
+
+    def field(self, key, build, source=None):
+        """
+        Get a cached field, building it on a miss.
+
+        :param key: Hashable description of the field
+        :param build: Callable returning the field
+        :param source: Optional tensor the field is derived from; the entry is only reused while that exact tensor is alive and unmodified
+        :return: The cached or newly built field
+        """
+        if source is not None:
+            key = (key, source.data_ptr(), tuple(source.shape), source._version)
+        entry = self._fields.get(key)
+        if entry is not None:
+            source_ref, value, _ = entry
+            if source_ref is None or source_ref() is source:
+                self._fields.move_to_end(key)
+                return value
+            self._field_bytes -= self._fields.pop(key)[2]
+
+        value = build()
+        nbytes = self._nbytes(value)
+        self._fields[key] = (weakref.ref(source) if source is not None else None, value, nbytes)
+        self._field_bytes += nbytes
+        # The newest entry always stays, even when it alone exceeds the budget
+        while self._field_bytes > self.max_bytes and len(self._fields) > 1:
+            self._field_bytes -= self._fields.popitem(last=False)[1][2]
+        return value
+
+    def depth_field(self, depth_map: torch.Tensor, frame_index: int, safe: bool = True, offset: float = 0.0) -> np.ndarray:
+        """
+        Get the channel-averaged depth of one frame normalized by its maximum.
+
+        The whole depth batch is normalized in one pass and cached as a single (B, H, W)
+        entry, so every frame of a run reuses it. Batches too large to share the budget
+        fall back to one entry per frame.
+
+        :param depth_map: Depth IMAGE batch (B, H, W, C)
+        :param frame_index: Frame to read
+        :param safe: Leave an all-zero depth frame unnormalized instead of dividing by zero
+        :param offset: Constant added after normalizing (e.g. -0.5 to center the depth)
+        :return: float32 array (H, W)
+        """
+        def normalize(depth):
+            depth_gray = np.mean(depth.cpu().numpy(), axis=-1).astype(np.float32)
+            max_depth = np.max(depth_gray, axis=(-2, -1), keepdims=True)
+            if safe:
+                max_depth = np.where(max_depth > 0, max_depth, np.float32(1))
+            depth_gray /= max_depth
+            if offset:
+                depth_gray += np.float32(offset)
+            return depth_gray
+
+        stack_bytes = depth_map.shape[0] * depth_map.shape[1] * depth_map.shape[2] * 4
+        if stack_bytes <= self.max_bytes // 2:
+            stack = self.field(("depth", safe, offset), lambda: normalize(depth_map), source=depth_map)
+            return stack[frame_index]
+        return self.field(
+            ("depth", frame_index, safe, offset), lambda: normalize(depth_map[frame_index]), source=depth_map
+        )
+
+    def clear(self):
+        """Drop all cached grids and fields."""
+        self._grids.clear()
+        self._fields.clear()
+        self._field_bytes = 0
+
+# Shared by every remap-based image effect in the process
+remap_grids = RemapGridCache()
@@ -22,6 +22,11 @@ class FlexLatentBase(RyanOnTheInside, FlexBase):
     RETURN_TYPES = ("LATENT",)
     FUNCTION = "apply_effect"
 
+    # Effects that set this implement apply_effect_batch(samples, feature_value, active, **kwargs),
+    # which runs once over the whole (N, ...) latent batch on its device. Per-frame numeric
+    # parameters arrive as (N,) tensors; frames where `active` is False must come back unchanged.
+    SUPPORTS_BATCH = False
+
     def __init__(self):
         super().__init__()
 
@@ -39,6 +44,35 @@ class FlexLatentBase(RyanOnTheInside, FlexBase):
         opt_feature=None,
         **kwargs
     ):
+        if self.SUPPORTS_BATCH:
+            samples = latents["samples"]
+            num_frames = samples.shape[0]
+
+            self.start_progress(num_frames, desc=f"Applying {self.__class__.__name__}")
+
+            # Parameters are still resolved per frame, the latent math then runs once over the batch
+            frame_params = []
+            for i in range(num_frames):
+                feature_value = self.get_feature_value(i, opt_feature)
+                frame_params.append(self.process_parameters(
+                    frame_index=i,
+                    feature_value=feature_value,
+                    feature_threshold=feature_threshold,
+                    strength=strength,
+                    feature_param=feature_param,
+                    feature_mode=feature_mode,
+                    **kwargs
+                ))
+
+            result_tensor = self.apply_effect_batch(
+                samples,
+                **self.batch_parameters(frame_params, samples)
+            )
+            self.update_progress(num_frames)
+            self.end_progress()
+
+            return ({"samples": result_tensor},)
+
         latents_np = latents["samples"].cpu().numpy()
 
         num_frames = latents_np.shape[0]
@@ -90,9 +124,37 @@ class FlexLatentBase(RyanOnTheInside, FlexBase):
 
         return ({"samples": result_tensor},)
 
+    def batch_parameters(self, frame_params, samples):
+        """Turn per-frame parameter dicts into batch kwargs for apply_effect_batch.
+
+        Adds the feature values as a tensor and an `active` bool mask marking frames
+        whose feature value reaches the threshold.
+        """
+        device = samples.device
+        dtype = samples.dtype if samples.is_floating_point() else torch.float32
+
+        feature_values = [params.get('feature_value') for params in frame_params]
+        thresholds = [params['feature_threshold'] for params in frame_params]
+        active = [fv is not None and fv >= th for fv, th in zip(feature_values, thresholds)]
+
+        batch = self.stack_frame_parameters(frame_params, device=device, dtype=dtype)
+        batch['feature_value'] = torch.tensor([0.0 if fv is None else fv for fv in feature_values], dtype=dtype, device=device)
+        batch['active'] = torch.tensor(active, dtype=torch.bool, device=device)
+        return batch
+
+    @staticmethod
+    def _frame_weights(values, like):
+        """Reshape an (N,) weight or mask vector to broadcast against (N, ...) latents."""
+        values = values.view(-1, *([1] * (like.ndim - 1)))
+        return values.to(like.dtype) if values.is_floating_point() else values
+
+    def modulate_param_batch(self, param_values, feature_values, strength, mode):
+        """Vectorized counterpart of modulate_param for (N,) tensors."""
+        if mode == "relative":
+            return param_values * (1 + (feature_values - 0.5) * 2 * strength)
+        return param_values * feature_values * strength
+
     @abstractmethod
-    def apply_effect_internal(self, latent: np.ndarray, feature_value: float, strength: float, 
-                            feature_param: str, feature_mode: str, **kwargs) -> np.ndarray:
+    def apply_effect_internal(self, latent: np.ndarray, **kwargs) -> np.ndarray:
         """Apply the effect with processed parameters. To be implemented by child classes."""
         pass
-
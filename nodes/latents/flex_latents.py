@@ -1,9 +1,13 @@
 from .flex_latent_base import FlexLatentBase
-import numpy as np
+import torch
+from .latent_utils import slerp
 from ...tooltips import apply_tooltips
 
+
 @apply_tooltips
 class FlexLatentInterpolate(FlexLatentBase):
+    SUPPORTS_BATCH = True
+
     @classmethod
     def INPUT_TYPES(cls):
         inputs = super().INPUT_TYPES()
@@ -18,46 +22,31 @@ class FlexLatentInterpolate(FlexLatentBase):
     def get_modifiable_params(cls):
         return ["None"]
 
-    def apply_effect_internal(self, latent: np.ndarray, **kwargs) -> np.ndarray:
-        feature_value = kwargs['feature_value']
+    def apply_effect_internal(self, latent, **kwargs):
+        return self.apply_effect_batch_to_frame(latent, **kwargs)
+
+    def apply_effect_batch(self, samples, feature_value, active, **kwargs):
         strength = kwargs['strength']
         latent_2 = kwargs['latent_2']
         interpolation_mode = kwargs['interpolation_mode']
         frame_index = kwargs['frame_index']
 
-        latent_2_np = latent_2["samples"].cpu().numpy()[frame_index]
+        # Gather the matching second-latent frames once for the whole batch
+        latent_2_samples = latent_2["samples"].to(device=samples.device, dtype=samples.dtype)[frame_index]
 
         # Perform interpolation
-        t = np.clip(feature_value * strength, 0.0, 1.0)
+        t = torch.clamp(feature_value * strength, 0.0, 1.0)
         if interpolation_mode == "Linear":
-            result = (1 - t) * latent + t * latent_2_np
+            weights = self._frame_weights(t, samples)
+            result = (1 - weights) * samples + weights * latent_2_samples
         else:  # Spherical interpolation
-            result = self.spherical_interpolation(latent, latent_2_np, t)
-        return result
-
-    def spherical_interpolation(self, latent1, latent2, t):
-        # Flatten the latents
-        latent1_flat = latent1.flatten()
-        latent2_flat = latent2.flatten()
-
-        # Compute dot product and norms
-        dot = np.dot(latent1_flat, latent2_flat)
-        norm1 = np.linalg.norm(latent1_flat)
-        norm2 = np.linalg.norm(latent2_flat)
-        denominator = norm1 * norm2 + 1e-8  # Avoid division by zero
-        omega = np.arccos(np.clip(dot / denominator, -1.0, 1.0))
-
-        if np.isclose(omega, 0):
-            return latent1
-        else:
-            sin_omega = np.sin(omega)
-            coef1 = np.sin((1 - t) * omega) / sin_omega
-            coef2 = np.sin(t * omega) / sin_omega
-            result = coef1 * latent1 + coef2 * latent2
-            return result.reshape(latent1.shape)
+            result = slerp(samples, latent_2_samples, t)
+        return torch.where(self._frame_weights(active, samples), result, samples)
 
 @apply_tooltips
 class EmbeddingGuidedLatentInterpolate(FlexLatentBase):
+    SUPPORTS_BATCH = True
+
     @classmethod
     def INPUT_TYPES(cls):
         inputs = super().INPUT_TYPES()
@@ -74,8 +63,10 @@ class EmbeddingGuidedLatentInterpolate(FlexLatentBase):
     def get_modifiable_params(cls):
         return ["interpolation_mode", "None"]
 
-    def apply_effect_internal(self, latent: np.ndarray, **kwargs) -> np.ndarray:
-        feature_value = kwargs['feature_value']
+    def apply_effect_internal(self, latent, **kwargs):
+        return self.apply_effect_batch_to_frame(latent, **kwargs)
+
+    def apply_effect_batch(self, samples, feature_value, active, **kwargs):
         strength = kwargs['strength']
         latent_2 = kwargs['latent_2']
         embedding_1 = kwargs['embedding_1']
@@ -83,52 +74,38 @@ class EmbeddingGuidedLatentInterpolate(FlexLatentBase):
         interpolation_mode = kwargs['interpolation_mode']
         frame_index = kwargs['frame_index']
 
-        latent_2_np = latent_2["samples"].cpu().numpy()[frame_index]
-        embedding_1_np = embedding_1.cpu().numpy()[frame_index]
-        embedding_2_np = embedding_2.cpu().numpy()[frame_index]
+        latent_2_samples = latent_2["samples"].to(device=samples.device, dtype=samples.dtype)[frame_index]
+        embedding_1_frames = embedding_1.to(device=samples.device, dtype=samples.dtype)[frame_index]
+        embedding_2_frames = embedding_2.to(device=samples.device, dtype=samples.dtype)[frame_index]
 
         # Compute similarity between embeddings
-        similarity = self.compute_similarity(embedding_1_np, embedding_2_np)
+        similarity = self.compute_similarity(embedding_1_frames, embedding_2_frames)
 
         # Adjust interpolation factor based on similarity
-        t = np.clip(feature_value * strength * similarity, 0.0, 1.0)
+        t = torch.clamp(feature_value * strength * similarity, 0.0, 1.0)
 
         if interpolation_mode == "Linear":
-            result = (1 - t) * latent + t * latent_2_np
+            weights = self._frame_weights(t, samples)
+            result = (1 - weights) * samples + weights * latent_2_samples
         else:  # Spherical interpolation
-            result = self.spherical_interpolation(latent, latent_2_np, t)
-        return result
+            result = slerp(samples, latent_2_samples, t)
+        return torch.where(self._frame_weights(active, samples), result, samples)
 
     def compute_similarity(self, emb1, emb2):
-        emb1_norm = emb1 / (np.linalg.norm(emb1) + 1e-8)
-        emb2_norm = emb2 / (np.linalg.norm(emb2) + 1e-8)
-        similarity = np.dot(emb1_norm.flatten(), emb2_norm.flatten())
+        """Per-frame cosine similarity of (N, ...) embeddings, normalized to [0, 1]."""
+        emb1 = emb1.reshape(emb1.shape[0], -1)
+        emb2 = emb2.reshape(emb2.shape[0], -1)
+        emb1_norm = emb1 / (emb1.norm(dim=1, keepdim=True) + 1e-8)
+        emb2_norm = emb2 / (emb2.norm(dim=1, keepdim=True) + 1e-8)
+        similarity = (emb1_norm * emb2_norm).sum(dim=1)
         # Normalize similarity to [0, 1]
         similarity = (similarity + 1) / 2
         return similarity
 
-    def spherical_interpolation(self, latent1, latent2, t):
-        # Same as in the previous subclass
-        latent1_flat = latent1.flatten()
-        latent2_flat = latent2.flatten()
-
-        dot = np.dot(latent1_flat, latent2_flat)
-        norm1 = np.linalg.norm(latent1_flat)
-        norm2 = np.linalg.norm(latent2_flat)
-        denominator = norm1 * norm2 + 1e-8
-        omega = np.arccos(np.clip(dot / denominator, -1.0, 1.0))
-
-        if np.isclose(omega, 0):
-            return latent1
-        else:
-            sin_omega = np.sin(omega)
-            coef1 = np.sin((1 - t) * omega) / sin_omega
-            coef2 = np.sin(t * omega) / sin_omega
-            result = coef1 * latent1 + coef2 * latent2
-            return result.reshape(latent1.shape)
-
 @apply_tooltips
 class FlexLatentBlend(FlexLatentBase):
+    SUPPORTS_BATCH = True
+
     @classmethod
     def INPUT_TYPES(cls):
         inputs = super().INPUT_TYPES()
@@ -144,8 +121,10 @@ class FlexLatentBlend(FlexLatentBase):
     def get_modifiable_params(cls):
         return ["blend_strength", "None"]
 
-    def apply_effect_internal(self, latent: np.ndarray, **kwargs) -> np.ndarray:
-        feature_value = kwargs['feature_value']
+    def apply_effect_internal(self, latent, **kwargs):
+        return self.apply_effect_batch_to_frame(latent, **kwargs)
+
+    def apply_effect_batch(self, samples, feature_value, active, **kwargs):
         strength = kwargs['strength']
         feature_param = kwargs['feature_param']
         feature_mode = kwargs['feature_mode']
@@ -156,24 +135,19 @@ class FlexLatentBlend(FlexLatentBase):
 
         # Modulate the blend_strength parameter if selected
         if feature_param == "blend_strength":
-            blend_strength = self.modulate_param(
-                "blend_strength",
-                blend_strength,
-                feature_value,
-                strength,
-                feature_mode
-            )
+            blend_strength = self.modulate_param_batch(blend_strength, feature_value, strength, feature_mode)
             # Ensure blend_strength remains within [0, 1]
-            blend_strength = np.clip(blend_strength, 0.0, 1.0)
+            blend_strength = torch.clamp(blend_strength, 0.0, 1.0)
 
-        latent_2_np = latent_2["samples"].cpu().numpy()[frame_index]
+        latent_2_samples = latent_2["samples"].to(device=samples.device, dtype=samples.dtype)[frame_index]
 
         # Apply blending operation
-        blended_latent = self.apply_blend(latent, latent_2_np, blend_mode)
+        blended_latent = self.apply_blend(samples, latent_2_samples, blend_mode)
         # Interpolate between original and blended latent based on blend_strength
-        result = (1 - blend_strength) * latent + blend_strength * blended_latent
+        weights = self._frame_weights(blend_strength, samples)
+        result = (1 - weights) * samples + weights * blended_latent
 
-        return result
+        return torch.where(self._frame_weights(active, samples), result, samples)
 
     def apply_blend(self, latent1, latent2, mode):
         if mode == "Add":
@@ -183,15 +157,17 @@ class FlexLatentBlend(FlexLatentBase):
         elif mode == "Screen":
             return 1 - (1 - latent1) * (1 - latent2)
         elif mode == "Overlay":
-            return np.where(latent1 < 0.5,
-                            2 * latent1 * latent2,
-                            1 - 2 * (1 - latent1) * (1 - latent2))
+            return torch.where(latent1 < 0.5,
+                               2 * latent1 * latent2,
+                               1 - 2 * (1 - latent1) * (1 - latent2))
         else:
             # Default to Add if mode is unrecognized
             return latent1 + latent2
 
 @apply_tooltips
 class FlexLatentNoise(FlexLatentBase):
+    SUPPORTS_BATCH = True
+
     @classmethod
     def INPUT_TYPES(cls):
         inputs = super().INPUT_TYPES()
@@ -206,8 +182,10 @@ class FlexLatentNoise(FlexLatentBase):
     def get_modifiable_params(cls):
         return ["noise_level", "None"]
 
-    def apply_effect_internal(self, latent: np.ndarray, **kwargs) -> np.ndarray:
-        feature_value = kwargs['feature_value']
+    def apply_effect_internal(self, latent, **kwargs):
+        return self.apply_effect_batch_to_frame(latent, **kwargs)
+
+    def apply_effect_batch(self, samples, feature_value, active, **kwargs):
         strength = kwargs['strength']
         feature_param = kwargs['feature_param']
         feature_mode = kwargs['feature_mode']
@@ -216,28 +194,23 @@ class FlexLatentNoise(FlexLatentBase):
 
         # Modulate the noise_level parameter if selected
         if feature_param == "noise_level":
-            noise_level = self.modulate_param(
-                "noise_level",
-                noise_level,
-                feature_value,
-                strength,
-                feature_mode
-            )
+            noise_level = self.modulate_param_batch(noise_level, feature_value, strength, feature_mode)
             # Ensure noise_level remains within [0.0, 1.0]
-            noise_level = np.clip(noise_level, 0.0, 1.0)
+            noise_level = torch.clamp(noise_level, 0.0, 1.0)
 
-        # Generate noise
+        # Generate noise for the whole batch on the latent device
+        levels = self._frame_weights(noise_level, samples)
         if noise_type == "Gaussian":
-            noise = np.random.randn(*latent.shape) * noise_level
+            noise = torch.randn_like(samples) * levels
         elif noise_type == "Uniform":
-            noise = (np.random.rand(*latent.shape) - 0.5) * 2 * noise_level
+            noise = (torch.rand_like(samples) - 0.5) * 2 * levels
         else:
-            noise = np.zeros_like(latent)
+            noise = torch.zeros_like(samples)
 
         # Add noise to the latent
-        result = latent + noise
+        result = samples + noise
 
-        return result
+        return torch.where(self._frame_weights(active, samples), result, samples)
 
 NODE_CLASS_MAPPINGS = {
     "FlexLatentInterpolate": FlexLatentInterpolate,
@@ -1,4 +1,7 @@
 from .flex_latent_base import FlexLatentBase
+from .latent_utils import slerp
+import hashlib
+from collections import OrderedDict
 import torch
 import numpy as np
 from scipy.signal import butter, sosfilt
@@ -10,6 +13,11 @@ from ..audio.audio_utils import (
 )
 from ...tooltips import apply_tooltips
 
+# Filtered float32 waveforms keyed by audio content and filter settings, least recently used first
+BANDPASS_CACHE_BYTES = 256 << 20
+_BANDPASS_CACHE = OrderedDict()
+_bandpass_cache_bytes = 0
+
 #NOTE just an experiment, it sucks
 #TODO: get to this
 @apply_tooltips
@@ -85,7 +93,8 @@ class LatentFrequencyBlender(FlexLatentBase):
         frame_count = int(audio_duration * frame_rate)
 
         # Prepare latents
-        latents_np = latents["samples"].cpu().numpy()
+        latent_samples = latents["samples"].float()
+        num_latents = latent_samples.shape[0]
         num_frames = frame_count
 
         self.start_progress(num_frames, desc=f"Applying {self.__class__.__name__}")
@@ -124,76 +133,54 @@ class LatentFrequencyBlender(FlexLatentBase):
 
             feature_values_per_range.append(feature_values)
 
-        # Stack feature values and normalize
-        feature_values_array = np.vstack(feature_values_per_range)
+        # Stack feature values into a (frames, ranges) matrix
+        feature_values_array = np.vstack(feature_values_per_range)[:, :num_frames].T
         # Avoid division by zero
-        feature_values_array += 1e-8
-
-        result = []
-        for i in range(num_frames):
-            # Get feature values for the current frame from each frequency range
-            feature_values = feature_values_array[:, i]
-
-            # Normalize feature values
-            total = np.sum(feature_values)
-            if total > 0:
-                normalized_weights = feature_values / total
-            else:
-                # Equal weights if total is zero
-                normalized_weights = np.ones(len(frequency_ranges)) / len(frequency_ranges)
-
-            # Amplify weights using strength parameter
-            normalized_weights *= strength
+        feature_values_array = feature_values_array + 1e-8
+
+        weights = self._normalize_weights(feature_values_array, strength)
+        weights = torch.from_numpy(weights).to(device=latent_samples.device, dtype=latent_samples.dtype)
+        frame_latent_indices = torch.arange(num_frames, device=latent_samples.device) % num_latents
+
+        # Blend latents based on normalized weights
+        if blending_mode == "hard_switch":
+            # Use the latent with the highest weight
+            blended = latent_samples[torch.argmax(weights, dim=1) % num_latents]
+        elif blending_mode == "slerp":
+            # Chain spherical interpolations, each step batched across all frames
+            blended = latent_samples[0].expand(num_frames, *latent_samples.shape[1:])
+            for idx in range(1, num_latents):
+                target = latent_samples[idx].expand_as(blended)
+                blended = slerp(blended, target, weights[:, idx], normalize=True)
+        else:  # Linear blending
+            range_latents = latent_samples[torch.arange(weights.shape[1], device=latent_samples.device) % num_latents]
+            blended = torch.einsum('fr,r...->f...', weights, range_latents)
+
+        # Apply strength and feature mode
+        if feature_mode == "relative":
+            base_latents = latent_samples[frame_latent_indices]
+            result_tensor = (1 - strength) * base_latents + strength * blended
+        else:  # Absolute
+            result_tensor = strength * blended
+
+        self.update_progress(num_frames)
+        self.end_progress()
 
-            # Normalize again after amplification
-            total = np.sum(normalized_weights)
-            if total > 0:
-                normalized_weights /= total
-            else:
-                normalized_weights = np.ones(len(frequency_ranges)) / len(frequency_ranges)
-
-            # Blend latents based on normalized weights
-            blended_latent = None
-
-            if blending_mode == "hard_switch":
-                # Use the latent with the highest weight
-                idx = np.argmax(normalized_weights)
-                blended_latent = latents_np[idx % len(latents_np)]
-            elif blending_mode == "slerp":
-                # Initialize with first latent
-                blended_latent = latents_np[0]
-                # Iteratively apply spherical interpolation with weights
-                for idx in range(1, len(latents_np)):
-                    t = normalized_weights[idx]
-                    blended_latent = self.spherical_interpolation(
-                        blended_latent, 
-                        latents_np[idx], 
-                        t
-                    )
-            else:  # Linear blending
-                for idx, weight in enumerate(normalized_weights):
-                    latent_frame = latents_np[idx % len(latents_np)]
-                    if blended_latent is None:
-                        blended_latent = weight * latent_frame
-                    else:
-                        blended_latent += weight * latent_frame
-
-            # Apply strength and feature mode
-            if feature_mode == "relative":
-                base_latent = latents_np[i % len(latents_np)]
-                blended_latent = (1 - strength) * base_latent + strength * blended_latent
-            else:  # Absolute
-                blended_latent = strength * blended_latent
-
-            result.append(blended_latent)
-            self.update_progress()
+        return ({"samples": result_tensor},)
 
-        self.end_progress()
+    def _normalize_weights(self, feature_values, strength):
+        """Per-frame blend weights from a (frames, ranges) feature matrix."""
+        num_ranges = feature_values.shape[1]
+        uniform = np.full_like(feature_values, 1.0 / num_ranges)
 
-        result_np = np.stack(result)
-        result_tensor = torch.from_numpy(result_np).float()
+        # Normalize feature values, equal weights where a frame's total is zero
+        total = feature_values.sum(axis=1, keepdims=True)
+        weights = np.where(total > 0, feature_values / np.where(total > 0, total, 1.0), uniform)
 
-        return ({"samples": result_tensor},)
+        # Amplify weights using strength parameter, then normalize again
+        weights = weights * strength
+        total = weights.sum(axis=1, keepdims=True)
+        return np.where(total > 0, weights / np.where(total > 0, total, 1.0), uniform)
 
     def _apply_bandpass_filter(self, audio, freq_range):
         # Implement bandpass filter using scipy.signal
@@ -207,8 +194,27 @@ class LatentFrequencyBlender(FlexLatentBase):
         if isinstance(waveform, torch.Tensor):
             waveform = waveform.cpu().numpy()
 
+        # Re-running the node with the same audio reuses the filtered signal
+        key = (
+            hashlib.sha1(np.ascontiguousarray(waveform).tobytes()).hexdigest(),
+            waveform.shape, sample_rate, order, low_cutoff, high_cutoff,
+        )
+        filtered = _BANDPASS_CACHE.get(key)
+        if filtered is not None:
+            _BANDPASS_CACHE.move_to_end(key)
+            return {'waveform': filtered, 'sample_rate': sample_rate}
+
         sos = butter(order, [low_cutoff, high_cutoff], btype='bandpass', fs=sample_rate, output='sos')
-        filtered = sosfilt(sos, waveform)
+        filtered = sosfilt(sos, waveform).astype(np.float32)
+        # Shared with later cache hits, so callers must not modify it in place
+        filtered.setflags(write=False)
+
+        global _bandpass_cache_bytes
+        _BANDPASS_CACHE[key] = filtered
+        _bandpass_cache_bytes += filtered.nbytes
+        while _bandpass_cache_bytes > BANDPASS_CACHE_BYTES and len(_BANDPASS_CACHE) > 1:
+            _, evicted = _BANDPASS_CACHE.popitem(last=False)
+            _bandpass_cache_bytes -= evicted.nbytes
 
         # Convert filtered waveform back to PyTorch tensor if needed
         return {'waveform': filtered, 'sample_rate': sample_rate}
@@ -229,40 +235,15 @@ class LatentFrequencyBlender(FlexLatentBase):
         # This method is not used in this implementation since processing is done in apply_effect
         return latent
     
-    #TODO contrast with base class version
     def spherical_interpolation(self, latent1, latent2, t):
-        # Flatten the latents
-        latent1_flat = latent1.flatten()
-        latent2_flat = latent2.flatten()
-
-        # Normalize the vectors
-        norm1 = np.linalg.norm(latent1_flat) + 1e-8  # Avoid division by zero
-        norm2 = np.linalg.norm(latent2_flat) + 1e-8
-        latent1_norm = latent1_flat / norm1
-        latent2_norm = latent2_flat / norm2
-
-        # Compute dot product and omega
-        dot = np.dot(latent1_norm, latent2_norm)
-        dot = np.clip(dot, -1.0, 1.0)  # Ensure the dot product is within [-1, 1]
-        omega = np.arccos(dot)
-
-        # Check if omega is close to zero
-        if np.isclose(omega, 0):
-            # Use linear interpolation
-            result_flat = (1 - t) * latent1_flat + t * latent2_flat
-        else:
-            sin_omega = np.sin(omega)
-            coef1 = np.sin((1 - t) * omega) / sin_omega
-            coef2 = np.sin(t * omega) / sin_omega
-            # Interpolate using normalized vectors
-            result_norm = coef1 * latent1_norm + coef2 * latent2_norm
-            # Scale back to original magnitude (optional)
-            interpolated_norm = (1 - t) * norm1 + t * norm2
-            result_flat = result_norm * interpolated_norm
-
-        # Reshape result to original latent shape
-        result = result_flat.reshape(latent1.shape)
-        return result
+        # Slerp unit directions and rescale to the interpolated magnitude
+        result = slerp(
+            torch.from_numpy(np.asarray(latent1))[None],
+            torch.from_numpy(np.asarray(latent2))[None],
+            float(t),
+            normalize=True,
+        )
+        return result[0].numpy()
 
 NODE_CLASS_MAPPINGS = {
     "LatentFrequencyBlender": LatentFrequencyBlender,
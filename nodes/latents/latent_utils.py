@@ -0,0 +1,50 @@
+import torch
+
+# Above this cosine the arc is too short for a stable sin(omega) division, so slerp falls back to lerp
+SLERP_DOT_THRESHOLD = 0.9995
+
+def slerp(latent1, latent2, t, normalize=False, half_precision=False, eps=1e-8):
+    """Batched spherical interpolation between (B, ...) tensors.
+
+    Args:
+        latent1: Start tensor of shape (B, ...)
+        latent2: End tensor with the same shape as latent1
+        t: Interpolation factor, a float or a (B,) tensor with one value per item
+        normalize: Interpolate unit directions and rescale to the linearly interpolated
+            norm, instead of applying the slerp weights to the raw vectors
+        half_precision: Run the elementwise blend in float16. Angles and norms are always
+            computed in float32.
+        eps: Guard against division by zero for zero-norm items
+
+    Returns:
+        Interpolated tensor with the shape and dtype of latent1. Items whose vectors are
+        (nearly) parallel are linearly interpolated.
+    """
+    batch = latent1.shape[0]
+    shape = (-1,) + (1,) * (latent1.ndim - 1)
+
+    flat1 = latent1.reshape(batch, -1).float()
+    flat2 = latent2.reshape(batch, -1).float()
+    t = torch.as_tensor(t, dtype=torch.float32, device=latent1.device).expand(batch)
+
+    norm1 = flat1.norm(dim=1) + eps
+    norm2 = flat2.norm(dim=1) + eps
+    dot = torch.clamp((flat1 * flat2).sum(dim=1) / (norm1 * norm2), -1.0, 1.0)
+    omega = torch.arccos(dot)
+    sin_omega = torch.sin(omega)
+
+    parallel = dot.abs() > SLERP_DOT_THRESHOLD
+    safe_sin = torch.where(parallel, torch.ones_like(sin_omega), sin_omega)
+    coef1 = torch.where(parallel, 1 - t, torch.sin((1 - t) * omega) / safe_sin)
+    coef2 = torch.where(parallel, t, torch.sin(t * omega) / safe_sin)
+
+    if normalize:
+        # Blend unit vectors and scale back to the interpolated magnitude
+        magnitude = (1 - t) * norm1 + t * norm2
+        coef1 = torch.where(parallel, coef1, coef1 / norm1 * magnitude)
+        coef2 = torch.where(parallel, coef2, coef2 / norm2 * magnitude)
+
+    work_dtype = torch.float16 if half_precision else torch.float32
+    result = (coef1.to(work_dtype).view(shape) * latent1.to(work_dtype)
+              + coef2.to(work_dtype).view(shape) * latent2.to(work_dtype))
+    return result.to(latent1.dtype)
@@ -242,8 +242,39 @@ class TextMaskNode(ProgressMixin):
 
         return (mask_tensor, image_tensor)
 
+def _rgb_to_hsv_cone(rgb):
+    """Map RGB in [0, 1] (..., 3) onto the HSV cone, where hue wraps and greys share one axis."""
+    maxc, max_idx = rgb.max(dim=-1)
+    minc = rgb.min(dim=-1).values
+    delta = maxc - minc
+    safe_delta = torch.where(delta > 0, delta, torch.ones_like(delta))
+    r, g, b = rgb.unbind(dim=-1)
+    hue = torch.where(max_idx == 0, (g - b) / safe_delta,
+          torch.where(max_idx == 1, 2.0 + (b - r) / safe_delta, 4.0 + (r - g) / safe_delta))
+    hue = hue * (np.pi / 3.0)
+    # Chroma (saturation * value) is the cone radius
+    return torch.stack((delta * torch.cos(hue), delta * torch.sin(hue), maxc), dim=-1)
+
+def _rgb_to_lab(rgb):
+    """Convert sRGB in [0, 1] (..., 3) to CIELAB under D65."""
+    linear = torch.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    rgb_to_xyz = torch.tensor([
+        [0.4124564, 0.3575761, 0.1804375],
+        [0.2126729, 0.7151522, 0.0721750],
+        [0.0193339, 0.1191920, 0.9503041],
+    ], device=rgb.device, dtype=rgb.dtype)
+    white = torch.tensor([0.95047, 1.0, 1.08883], device=rgb.device, dtype=rgb.dtype)
+    xyz = (linear @ rgb_to_xyz.T) / white
+    delta = 6.0 / 29.0
+    f = torch.where(xyz > delta ** 3, xyz.clamp(min=1e-12) ** (1.0 / 3.0), xyz / (3 * delta ** 2) + 4.0 / 29.0)
+    fx, fy, fz = f.unbind(dim=-1)
+    return torch.stack((116.0 * fy - 16.0, 500.0 * (fx - fy), 200.0 * (fy - fz)), dim=-1)
+
 @apply_tooltips
 class _mfc:
+    # Pixels matched per chunk, roughly one 4K frame, so temporaries stay bounded on long batches
+    CHUNK_PIXELS = 1 << 23
+
     @classmethod
     def INPUT_TYPES(s):
         return {
@@ -253,6 +284,9 @@ class _mfc:
                 "green": ("INT", { "default": 255, "min": 0, "max": 255, "step": 1, }),
                 "blue": ("INT", { "default": 255, "min": 0, "max": 255, "step": 1, }),
                 "threshold": ("INT", { "default": 0, "min": 0, "max": 127, "step": 1, }),
+            },
+            "optional": {
+                "tolerance_mode": (["rgb", "hsv", "lab"], {"default": "rgb"}),
             }
         }
     
@@ -260,17 +294,39 @@ class _mfc:
     FUNCTION = "execute"
     CATEGORY = "RyanOnTheInside/Masks"
 
-    def execute(self, image, red, green, blue, threshold):
-        temp = (torch.clamp(image, 0, 1.0) * 255.0).round().to(torch.int)
-        color = torch.tensor([red, green, blue], device=image.device)
-        lower_bound = (color - threshold).clamp(min=0)
-        upper_bound = (color + threshold).clamp(max=255)
-        lower_bound = lower_bound.view(1, 1, 1, 3)
-        upper_bound = upper_bound.view(1, 1, 1, 3)
-        mask = (temp >= lower_bound) & (temp <= upper_bound)
-        mask = mask.all(dim=-1)
-        mask = mask.float()
-        
+    def execute(self, image, red, green, blue, threshold, tolerance_mode="rgb"):
+        batch, height, width = image.shape[:3]
+        color = torch.tensor([red, green, blue], device=image.device, dtype=torch.float32)
+        mask = torch.empty((batch, height, width), device=image.device, dtype=torch.float32)
+
+        if tolerance_mode == "rgb":
+            lower_bound = (color - threshold).clamp(min=0)
+            upper_bound = (color + threshold).clamp(max=255)
+        elif tolerance_mode == "hsv":
+            target = _rgb_to_hsv_cone(color / 255.0)
+        elif tolerance_mode == "lab":
+            target = _rgb_to_lab(color / 255.0)
+        else:
+            raise ValueError(f"Unknown tolerance mode: {tolerance_mode}")
+
+        frames_per_chunk = max(1, self.CHUNK_PIXELS // max(1, height * width))
+        for start in range(0, batch, frames_per_chunk):
+            end = min(start + frames_per_chunk, batch)
+            chunk = image[start:end, ..., :3].to(torch.float32).clamp(0, 1.0)
+
+            if tolerance_mode == "rgb":
+                # Per-channel box around the target, on 8-bit levels
+                chunk = chunk.mul_(255.0).round_()
+                matched = ((chunk >= lower_bound) & (chunk <= upper_bound)).all(dim=-1)
+            elif tolerance_mode == "hsv":
+                # Distance on the HSV cone, scaled to 8-bit levels
+                matched = torch.linalg.vector_norm(_rgb_to_hsv_cone(chunk) - target, dim=-1) * 255.0 <= threshold
+            else:
+                # CIE76 delta E
+                matched = torch.linalg.vector_norm(_rgb_to_lab(chunk) - target, dim=-1) <= threshold
+
+            mask[start:end] = matched
+
         # Create an image of the mask
         mask_image = mask.unsqueeze(-1).repeat(1, 1, 1, 3)
         
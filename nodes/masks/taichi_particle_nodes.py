@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import math
 from typing import List, Tuple
 
@@ -10,7 +12,19 @@ import torch
 from ... import RyanOnTheInside
 from ...tooltips import apply_tooltips
 from .mask_base import MaskBase
-from .taichi_particle_system import EmitterSettings, TaichiParticleSystem, get_cached_system, reset_taichi_cache
+from .taichi_particle_system import (
+    EMIT_PARAM_COUNT,
+    SNAPSHOT_FORMAT,
+    EmitterSettings,
+    TaichiParticleSystem,
+    configure_taichi_pool,
+    get_cached_system,
+    get_taichi_pool_stats,
+    load_checkpoint,
+    reset_taichi_cache,
+    store_checkpoint,
+    warm_up_system,
+)
 
 
 def _parse_color(color_value) -> Tuple[float, float, float]:
@@ -24,41 +38,284 @@ def _parse_color(color_value) -> Tuple[float, float, float]:
 
 
 def _prepare_path(points: List[Tuple[float, float]], width: int, height: int):
+    """Build an arc-length table for a normalized polyline in pixel space."""
     if len(points) < 2:
         return None
-    points_px = [(p[0] * width, p[1] * height) for p in points]
-    seg_lengths = []
-    total = 0.0
-    for i in range(len(points_px) - 1):
-        dx = points_px[i + 1][0] - points_px[i][0]
-        dy = points_px[i + 1][1] - points_px[i][1]
-        length = math.hypot(dx, dy)
-        seg_lengths.append(length)
-        total += length
+    points_px = np.asarray(points, dtype=np.float64)[:, :2] * np.array([width, height], dtype=np.float64)
+    deltas = np.diff(points_px, axis=0)
+    seg_lengths = np.hypot(deltas[:, 0], deltas[:, 1])
+    cumulative = np.concatenate(([0.0], np.cumsum(seg_lengths)))
     return {
         "points": points_px,
         "seg_lengths": seg_lengths,
-        "total": total,
+        "cumulative": cumulative,
+        "angles": np.degrees(np.arctan2(deltas[:, 1], deltas[:, 0])),
+        "total": float(cumulative[-1]),
     }
 
 
-def _sample_path(path_data, progress: float):
+def _sample_path_many(path_data, progress: np.ndarray):
+    """Sample positions and tangent angles for an array of progress values in [0, 1]."""
     if path_data is None or path_data["total"] <= 0:
-        return None, 0.0
-    target = max(0.0, min(1.0, progress)) * path_data["total"]
-    accumulated = 0.0
+        return None, None
     points = path_data["points"]
-    for i, length in enumerate(path_data["seg_lengths"]):
-        if accumulated + length >= target:
-            t = (target - accumulated) / max(length, 1e-6)
-            x0, y0 = points[i]
-            x1, y1 = points[i + 1]
-            x = x0 + (x1 - x0) * t
-            y = y0 + (y1 - y0) * t
-            angle = math.degrees(math.atan2(y1 - y0, x1 - x0))
-            return (x, y), angle
-        accumulated += length
-    return points[-1], 0.0
+    seg_lengths = path_data["seg_lengths"]
+    cumulative = path_data["cumulative"]
+    target = np.clip(np.asarray(progress, dtype=np.float64), 0.0, 1.0) * path_data["total"]
+
+    # First segment whose end reaches the target distance.
+    seg = np.searchsorted(cumulative[1:], target, side="left")
+    past_end = seg >= len(seg_lengths)
+    seg = np.minimum(seg, len(seg_lengths) - 1)
+
+    t = (target - cumulative[seg]) / np.maximum(seg_lengths[seg], 1e-6)
+    positions = points[seg] + (points[seg + 1] - points[seg]) * t[:, None]
+    angles = path_data["angles"][seg].copy()
+
+    positions[past_end] = points[-1]
+    angles[past_end] = 0.0
+    return positions, angles
+
+
+def _sample_path(path_data, progress: float):
+    positions, angles = _sample_path_many(path_data, np.array([progress], dtype=np.float64))
+    if positions is None:
+        return None, 0.0
+    return (float(positions[0, 0]), float(positions[0, 1])), float(angles[0])
+
+
+def _feature_series(feature, frames: np.ndarray) -> np.ndarray:
+    data = getattr(feature, "data", None)
+    if data is not None and len(data) > int(frames.max()):
+        return np.asarray(data, dtype=np.float64)[frames]
+    return np.array([float(feature.get_value_at_frame(int(f))) for f in frames], dtype=np.float64)
+
+
+def _apply_modulation(base: np.ndarray, values, scale: float, offset: float, threshold: float, mode: str) -> np.ndarray:
+    if values is None:
+        return base
+    value = np.maximum(0.0, values - threshold)
+    if mode == "absolute":
+        return base + offset + scale * value
+    return base * (1.0 + scale * value) + offset
+
+
+def _burst_counts(delta: np.ndarray, modulation) -> np.ndarray:
+    counts = np.trunc(float(modulation.get("burst_strength", 0.0)) * delta).astype(np.int64)
+    burst_min = int(modulation.get("burst_min", 0))
+    burst_max = int(modulation.get("burst_max", 0))
+    if burst_min > 0:
+        counts = np.maximum(burst_min, counts)
+    if burst_max > 0:
+        counts = np.minimum(burst_max, counts)
+    triggered = delta >= float(modulation.get("onset_threshold", 0.0))
+    return np.where(triggered, counts, 0)
+
+
+def _previous_values(values: np.ndarray) -> np.ndarray:
+    previous = np.zeros_like(values)
+    previous[1:] = values[:-1]
+    return previous
+
+
+def _path_progress(deltas: np.ndarray, loop_mode: str) -> np.ndarray:
+    if loop_mode == "loop":
+        return np.cumsum(deltas) % 1.0
+    # Clamp and ping-pong depend on where the previous step ended, so they are
+    # resolved with a scalar recurrence over the (cheap) per-frame deltas.
+    progress = np.empty_like(deltas)
+    value = 0.0
+    direction = 1
+    for i, delta in enumerate(deltas.tolist()):
+        if loop_mode == "clamp":
+            value = max(0.0, min(1.0, value + delta))
+        else:
+            value += delta * direction
+            if value > 1.0:
+                value = 2.0 - value
+                direction = -1
+            elif value < 0.0:
+                value = -value
+                direction = 1
+        progress[i] = value
+    return progress
+
+
+def _build_emission_schedule(
+    emitters,
+    path_data_list,
+    num_frames: int,
+    width: int,
+    height: int,
+    dt: float,
+    particle_lifetime: float,
+    start_frame: int,
+    end_frame: int,
+):
+    """Resolve every emitter's per-frame parameters up front.
+
+    Returns ``counts`` of shape (frames, emitters) and ``params`` of shape
+    (frames, emitters, EMIT_PARAM_COUNT) ready for ``TaichiParticleSystem.emit_batch``.
+    """
+    emitter_count = len(emitters)
+    counts = np.zeros((num_frames, emitter_count), dtype=np.int32)
+    params = np.zeros((num_frames, emitter_count, EMIT_PARAM_COUNT), dtype=np.float32)
+    frames = np.arange(num_frames)
+
+    for emitter_index, emitter in enumerate(emitters):
+        emitter_start = emitter.get("start_frame", 0)
+        emitter_end = emitter.get("end_frame", 0)
+        active = (frames >= emitter_start) & (frames >= start_frame) & (frames < end_frame)
+        if emitter_end > 0:
+            active &= frames < emitter_end
+        active_frames = frames[active]
+        if active_frames.size == 0:
+            continue
+        n = active_frames.size
+
+        emission_rate = np.full(n, float(emitter["emission_rate"]))
+        emitter_x = np.full(n, float(emitter.get("base_emitter_x", emitter["emitter_x"])))
+        emitter_y = np.full(n, float(emitter.get("base_emitter_y", emitter["emitter_y"])))
+        particle_size = np.full(n, float(emitter.get("base_particle_size", emitter["particle_size"])))
+        particle_spread = np.full(n, float(emitter.get("base_particle_spread", emitter["particle_spread"])))
+        particle_direction = np.full(n, float(emitter.get("base_particle_direction", emitter["particle_direction"])))
+        path_speed = np.full(n, float(emitter.get("base_path_speed", emitter.get("path_speed", 0.0))))
+        burst_count = np.zeros(n, dtype=np.int64)
+
+        audio_value = None
+        modulation = emitter.get("audio_modulation")
+        if modulation is not None and modulation.get("feature") is not None:
+            audio_value = np.maximum(
+                0.0,
+                _feature_series(modulation["feature"], active_frames) - float(modulation.get("threshold", 0.0)),
+            )
+            scale = float(modulation.get("scale", 1.0))
+            if modulation.get("mode") == "absolute":
+                emission_rate = emission_rate + scale * audio_value
+            else:
+                emission_rate = emission_rate * (1.0 + scale * audio_value)
+
+        burst_value = None
+        path_modulation = emitter.get("path_modulation")
+        if path_modulation is not None:
+            series = {}
+            for name in ("speed", "size", "angle", "spread"):
+                feature = path_modulation.get(f"{name}_feature")
+                series[name] = _feature_series(feature, active_frames) if feature is not None else None
+
+            path_speed = _apply_modulation(
+                path_speed,
+                series["speed"],
+                float(path_modulation.get("speed_scale", 1.0)),
+                float(path_modulation.get("speed_offset", 0.0)),
+                float(path_modulation.get("speed_threshold", 0.0)),
+                path_modulation.get("speed_mode", "relative"),
+            )
+            particle_size = _apply_modulation(
+                particle_size,
+                series["size"],
+                float(path_modulation.get("size_scale", 0.0)),
+                float(path_modulation.get("size_offset", 0.0)),
+                float(path_modulation.get("size_threshold", 0.0)),
+                path_modulation.get("size_mode", "relative"),
+            )
+            particle_direction = _apply_modulation(
+                particle_direction,
+                series["angle"],
+                float(path_modulation.get("angle_scale", 0.0)),
+                float(path_modulation.get("angle_offset", 0.0)),
+                float(path_modulation.get("angle_threshold", 0.0)),
+                path_modulation.get("angle_mode", "relative"),
+            )
+            particle_spread = _apply_modulation(
+                particle_spread,
+                series["spread"],
+                float(path_modulation.get("spread_scale", 0.0)),
+                float(path_modulation.get("spread_offset", 0.0)),
+                float(path_modulation.get("spread_threshold", 0.0)),
+                path_modulation.get("spread_mode", "relative"),
+            )
+
+            burst_feature = path_modulation.get("burst_feature") or path_modulation.get("speed_feature")
+            if burst_feature is not None:
+                burst_value = np.maximum(
+                    0.0,
+                    _feature_series(burst_feature, active_frames) - float(path_modulation.get("speed_threshold", 0.0)),
+                )
+
+        # Audio and path bursts share one "previous value" slot per emitter: each
+        # frame the audio value is written first, then the path burst value.
+        last_written = burst_value if burst_value is not None else audio_value
+        if audio_value is not None:
+            burst_count += _burst_counts(audio_value - _previous_values(last_written), modulation)
+        if burst_value is not None:
+            previous = audio_value if audio_value is not None else _previous_values(burst_value)
+            burst_count += _burst_counts(burst_value - previous, path_modulation)
+
+        path_data = path_data_list[emitter_index]
+        if isinstance(path_data, dict) and path_data.get("frame_points"):
+            frame_points = np.asarray(path_data["frame_points"], dtype=np.float64)
+            frame_angles = path_data.get("frame_angles")
+            idx = active_frames % len(frame_points)
+            emitter_x = frame_points[idx, 0]
+            emitter_y = frame_points[idx, 1]
+            if emitter.get("align_to_path", False) and frame_angles:
+                particle_direction = np.asarray(frame_angles, dtype=np.float64)[idx]
+        elif path_data is not None:
+            progress = _path_progress(path_speed * dt, emitter.get("loop_mode", "loop"))
+            positions, path_angles = _sample_path_many(path_data, progress)
+            if positions is not None:
+                emitter_x = positions[:, 0] / width
+                emitter_y = positions[:, 1] / height
+                if emitter.get("align_to_path", False):
+                    particle_direction = path_angles
+
+        # Fractional emission carries over between frames, so the particles
+        # emitted per frame are the steps of the floored running total.
+        emitted = np.floor(np.cumsum(np.maximum(0.0, emission_rate) * dt))
+        emit_count = np.diff(emitted, prepend=0.0).astype(np.int64) + burst_count
+
+        lifetime_override = float(emitter.get("particle_lifetime", 0.0))
+        lifetime = lifetime_override if lifetime_override > 0.0 else float(particle_lifetime)
+        color = emitter["color"]
+
+        counts[active_frames, emitter_index] = emit_count
+        rows = params[active_frames, emitter_index]
+        rows[:, 0] = emitter_x * width
+        rows[:, 1] = emitter_y * height
+        rows[:, 2] = np.radians(particle_direction + float(emitter.get("direction_offset", 0.0)))
+        rows[:, 3] = np.radians(particle_spread)
+        rows[:, 4] = float(emitter["particle_speed"])
+        rows[:, 5] = particle_size
+        rows[:, 6] = float(emitter.get("emission_radius", 0.0))
+        rows[:, 7:10] = color
+        rows[:, 10] = lifetime
+        rows[:, 11] = int(emitter.get("particle_shape", 0))
+        rows[:, 12] = float(emitter.get("spark_length", 0.0))
+        rows[:, 13] = 1 if emitter.get("endless_mode", False) else 0
+        params[active_frames, emitter_index] = rows
+
+    return counts, params
+
+
+def _checkpoint_keys(simulation_config, counts: np.ndarray, params: np.ndarray, interval: int):
+    """Hash the simulation state inputs for every checkpoint frame.
+
+    The particle state entering frame ``f`` depends only on the simulation
+    constants and the emission schedule rows before ``f``, so the key for a
+    checkpoint is a running hash over exactly those. Frames run up to and
+    including ``counts.shape[0]``, the state after the last simulated frame,
+    which is where the next chunk of a chunked render resumes.
+    """
+    hasher = hashlib.sha1(repr(simulation_config).encode("utf-8"))
+    keys = {}
+    for frame_index in range(counts.shape[0] + 1):
+        if frame_index > 0 and frame_index % interval == 0:
+            keys[frame_index] = hasher.hexdigest()
+        if frame_index < counts.shape[0]:
+            hasher.update(counts[frame_index].tobytes())
+            hasher.update(params[frame_index].tobytes())
+    return keys
 
 
 @apply_tooltips
@@ -756,7 +1013,13 @@ class TaichiParticleMask(MaskBase):
                 "frame_rate": ("FLOAT", {"default": 30.0, "min": 1.0, "max": 120.0, "step": 1.0}),
                 "start_frame": ("INT", {"default": 0, "min": 0, "max": 10000, "step": 1}),
                 "end_frame": ("INT", {"default": 0, "min": 0, "max": 10000, "step": 1}),
-            }
+            },
+            "optional": {
+                "random_seed": ("INT", {"default": 0, "min": 0, "max": 2**31 - 1, "step": 1}),
+                "frame_offset": ("INT", {"default": 0, "min": 0, "max": 100000, "step": 1}),
+                "checkpoint_interval": ("INT", {"default": 0, "min": 0, "max": 10000, "step": 1}),
+                "checkpoint_dir": ("STRING", {"default": ""}),
+            },
         }
 
     RETURN_TYPES = ("MASK", "IMAGE")
@@ -782,11 +1045,29 @@ class TaichiParticleMask(MaskBase):
         frame_rate,
         start_frame,
         end_frame,
+        random_seed=0,
+        frame_offset=0,
+        checkpoint_interval=0,
+        checkpoint_dir="",
     ):
         masks_np = masks.cpu().numpy() if isinstance(masks, torch.Tensor) else masks
         num_frames, height, width = masks_np.shape
 
-        end_frame = end_frame if end_frame > 0 else num_frames
+        # The mask batch covers frames [frame_offset, frame_offset + num_frames) of
+        # the full simulation; earlier frames are simulated (or resumed) but not rendered.
+        frame_offset = max(0, int(frame_offset))
+        total_frames = frame_offset + num_frames
+        checkpoint_interval = max(0, int(checkpoint_interval))
+        checkpoint_dir = (checkpoint_dir or "").strip()
+
+        # Seed 0 keeps the original behaviour of fresh randomness on every run. Such runs
+        # can't be reproduced, so they are never checkpointed.
+        random_seed = int(random_seed)
+        if random_seed == 0:
+            random_seed = int(np.random.default_rng().integers(1, 2**31))
+            checkpoint_interval = 0
+
+        end_frame = end_frame if end_frame > 0 else total_frames
         frame_rate = max(1.0, float(frame_rate))
         dt = 1.0 / frame_rate
 
@@ -794,14 +1075,8 @@ class TaichiParticleMask(MaskBase):
         gravity_y = float(gravity) + float(wind_strength) * math.sin(math.radians(float(wind_direction)))
 
         system = get_cached_system(width, height, int(particle_count))
-        system.reset()
 
-        emit_accumulators: List[float] = [0.0] * len(emitters)
-        feature_prev: List[float] = [0.0] * len(emitters)
-        path_progress: List[float] = [0.0] * len(emitters)
-        path_direction: List[int] = [1] * len(emitters)
         path_data_list = []
-
         for emitter in emitters:
             path = emitter.get("path")
             if path is None:
@@ -821,201 +1096,64 @@ class TaichiParticleMask(MaskBase):
             points = [(min(1.0, max(0.0, p[0])), min(1.0, max(0.0, p[1]))) for p in points]
             path_data_list.append(_prepare_path(points, width, height))
 
+        emission_counts, emission_params = _build_emission_schedule(
+            emitters,
+            path_data_list,
+            total_frames,
+            width,
+            height,
+            dt,
+            particle_lifetime,
+            start_frame,
+            end_frame,
+        )
+
+        checkpoint_keys = {}
+        if checkpoint_interval > 0:
+            checkpoint_keys = _checkpoint_keys(
+                (SNAPSHOT_FORMAT, width, height, int(particle_count), dt, gravity_x, gravity_y, random_seed),
+                emission_counts,
+                emission_params,
+                checkpoint_interval,
+            )
+
+        resume_frame = 0
+        for checkpoint_frame in sorted(checkpoint_keys, reverse=True):
+            if checkpoint_frame > frame_offset:
+                continue
+            snapshot = load_checkpoint(checkpoint_keys[checkpoint_frame], checkpoint_dir)
+            if snapshot is not None:
+                system.restore(snapshot)
+                resume_frame = checkpoint_frame
+                break
+        else:
+            system.reset()
+            system.set_seed(random_seed)
+
         mask_frames = []
         image_frames = []
 
-        self.start_progress(num_frames, desc="Processing Taichi particle mask")
-
-        for frame_index in range(num_frames):
-            system.clear_image()
+        self.start_progress(total_frames - resume_frame, desc="Processing Taichi particle mask")
 
-            for emitter_index, emitter in enumerate(emitters):
-                emitter_start = emitter.get("start_frame", 0)
-                emitter_end = emitter.get("end_frame", 0)
-                if frame_index < emitter_start:
-                    continue
-                if emitter_end > 0 and frame_index >= emitter_end:
-                    continue
-                if frame_index < start_frame or frame_index >= end_frame:
-                    continue
-
-                emission_rate = float(emitter["emission_rate"])
-                emitter_x = float(emitter.get("base_emitter_x", emitter["emitter_x"]))
-                emitter_y = float(emitter.get("base_emitter_y", emitter["emitter_y"]))
-                particle_size = float(emitter.get("base_particle_size", emitter["particle_size"]))
-                particle_spread = float(emitter.get("base_particle_spread", emitter["particle_spread"]))
-                particle_direction = float(emitter.get("base_particle_direction", emitter["particle_direction"]))
-                path_speed = float(emitter.get("base_path_speed", emitter.get("path_speed", 0.0)))
-                modulation = emitter.get("audio_modulation")
-                burst_count = 0
-                if modulation is not None:
-                    feature = modulation.get("feature")
-                    if feature is not None:
-                        feature_value = float(feature.get_value_at_frame(frame_index))
-                        feature_value = max(0.0, feature_value - float(modulation.get("threshold", 0.0)))
-                        scale = float(modulation.get("scale", 1.0))
-                        if modulation.get("mode") == "absolute":
-                            emission_rate = emission_rate + scale * feature_value
-                        else:
-                            emission_rate = emission_rate * (1.0 + scale * feature_value)
-
-                        delta = feature_value - feature_prev[emitter_index]
-                        onset_threshold = float(modulation.get("onset_threshold", 0.0))
-                        if delta >= onset_threshold:
-                            burst_strength = float(modulation.get("burst_strength", 0.0))
-                            burst_count = int(burst_strength * delta)
-                            burst_min = int(modulation.get("burst_min", 0))
-                            burst_max = int(modulation.get("burst_max", 0))
-                            if burst_min > 0:
-                                burst_count = max(burst_min, burst_count)
-                            if burst_max > 0:
-                                burst_count = min(burst_max, burst_count)
-                        feature_prev[emitter_index] = feature_value
-
-                def _apply_mod(base, feature_value, scale, offset, threshold, mode):
-                    if feature_value is None:
-                        return base
-                    value = max(0.0, feature_value - threshold)
-                    if mode == "absolute":
-                        return base + offset + scale * value
-                    return base * (1.0 + scale * value) + offset
-
-                path_modulation = emitter.get("path_modulation")
-                if path_modulation is not None:
-                    speed_feature = path_modulation.get("speed_feature")
-                    speed_value = float(speed_feature.get_value_at_frame(frame_index)) if speed_feature is not None else None
-                    path_speed = _apply_mod(
-                        path_speed,
-                        speed_value,
-                        float(path_modulation.get("speed_scale", 1.0)),
-                        float(path_modulation.get("speed_offset", 0.0)),
-                        float(path_modulation.get("speed_threshold", 0.0)),
-                        path_modulation.get("speed_mode", "relative"),
-                    )
-
-                    size_feature = path_modulation.get("size_feature")
-                    size_value = float(size_feature.get_value_at_frame(frame_index)) if size_feature is not None else None
-                    particle_size = _apply_mod(
-                        particle_size,
-                        size_value,
-                        float(path_modulation.get("size_scale", 0.0)),
-                        float(path_modulation.get("size_offset", 0.0)),
-                        float(path_modulation.get("size_threshold", 0.0)),
-                        path_modulation.get("size_mode", "relative"),
-                    )
-
-                    angle_feature = path_modulation.get("angle_feature")
-                    angle_value = float(angle_feature.get_value_at_frame(frame_index)) if angle_feature is not None else None
-                    particle_direction = _apply_mod(
-                        particle_direction,
-                        angle_value,
-                        float(path_modulation.get("angle_scale", 0.0)),
-                        float(path_modulation.get("angle_offset", 0.0)),
-                        float(path_modulation.get("angle_threshold", 0.0)),
-                        path_modulation.get("angle_mode", "relative"),
-                    )
-
-                    spread_feature = path_modulation.get("spread_feature")
-                    spread_value = float(spread_feature.get_value_at_frame(frame_index)) if spread_feature is not None else None
-                    particle_spread = _apply_mod(
-                        particle_spread,
-                        spread_value,
-                        float(path_modulation.get("spread_scale", 0.0)),
-                        float(path_modulation.get("spread_offset", 0.0)),
-                        float(path_modulation.get("spread_threshold", 0.0)),
-                        path_modulation.get("spread_mode", "relative"),
-                    )
-
-                    burst_feature = path_modulation.get("burst_feature") or speed_feature
-                    if burst_feature is not None:
-                        burst_value = float(burst_feature.get_value_at_frame(frame_index))
-                        burst_value = max(0.0, burst_value - float(path_modulation.get("speed_threshold", 0.0)))
-                        delta = burst_value - feature_prev[emitter_index]
-                        onset_threshold = float(path_modulation.get("onset_threshold", 0.0))
-                        if delta >= onset_threshold:
-                            burst_strength = float(path_modulation.get("burst_strength", 0.0))
-                            burst_extra = int(burst_strength * delta)
-                            burst_min = int(path_modulation.get("burst_min", 0))
-                            burst_max = int(path_modulation.get("burst_max", 0))
-                            if burst_min > 0:
-                                burst_extra = max(burst_min, burst_extra)
-                            if burst_max > 0:
-                                burst_extra = min(burst_max, burst_extra)
-                            burst_count += burst_extra
-                        feature_prev[emitter_index] = burst_value
-
-                path_data = path_data_list[emitter_index]
-                if isinstance(path_data, dict) and path_data.get("frame_points"):
-                    frame_points = path_data["frame_points"]
-                    frame_angles = path_data.get("frame_angles")
-                    if frame_points:
-                        idx = frame_index % len(frame_points)
-                        px, py = frame_points[idx]
-                        emitter_x = px
-                        emitter_y = py
-                        if emitter.get("align_to_path", False) and frame_angles:
-                            particle_direction = frame_angles[idx]
-                elif path_data is not None:
-                    base_speed = path_speed
-                    progress = path_progress[emitter_index]
-                    direction = path_direction[emitter_index]
-                    delta = base_speed * dt
-                    loop_mode = emitter.get("loop_mode", "loop")
-                    if loop_mode == "loop":
-                        progress = (progress + delta) % 1.0
-                    elif loop_mode == "clamp":
-                        progress = max(0.0, min(1.0, progress + delta))
-                    else:
-                        progress += delta * direction
-                        if progress > 1.0:
-                            progress = 2.0 - progress
-                            direction = -1
-                        elif progress < 0.0:
-                            progress = -progress
-                            direction = 1
-                    path_progress[emitter_index] = progress
-                    path_direction[emitter_index] = direction
-                    sampled = _sample_path(path_data, progress)
-                    if sampled[0] is not None:
-                        (px, py), path_angle = sampled
-                        emitter_x = px / width
-                        emitter_y = py / height
-                        if emitter.get("align_to_path", False):
-                            particle_direction = path_angle
-
-                emit_accumulators[emitter_index] += max(0.0, emission_rate) * dt
-                emit_count = int(emit_accumulators[emitter_index])
-                if emit_count > 0:
-                    emit_accumulators[emitter_index] -= emit_count
-                emit_count += burst_count
-                if emit_count > 0:
-                    lifetime_override = float(emitter.get("particle_lifetime", 0.0))
-                    lifetime = lifetime_override if lifetime_override > 0.0 else float(particle_lifetime)
-                    direction_deg = particle_direction + float(emitter.get("direction_offset", 0.0))
-                    settings = EmitterSettings(
-                        x=emitter_x * width,
-                        y=emitter_y * height,
-                        direction=math.radians(direction_deg),
-                        spread=math.radians(particle_spread),
-                        speed=float(emitter["particle_speed"]),
-                        size=particle_size,
-                        emission_radius=float(emitter.get("emission_radius", 0.0)),
-                        color=emitter["color"],
-                        particle_life=lifetime,
-                        shape=int(emitter.get("particle_shape", 0)),
-                        spark_length=float(emitter.get("spark_length", 0.0)),
-                        endless=1 if emitter.get("endless_mode", False) else 0,
-                    )
-                    system.emit(emit_count, settings)
+        for frame_index in range(resume_frame, total_frames):
+            if frame_index != resume_frame and frame_index in checkpoint_keys:
+                store_checkpoint(checkpoint_keys[frame_index], system.snapshot(), checkpoint_dir)
 
+            system.emit_batch(emission_counts[frame_index], emission_params[frame_index])
             system.update(dt, gravity_x, gravity_y)
+
+            if frame_index < frame_offset:
+                self.update_progress()
+                continue
+
+            system.clear_image()
             system.rasterize()
 
             image = system.get_image()
             particle_mask = np.clip(image[..., 3], 0.0, 1.0)
             particle_image = np.clip(image[..., :3], 0.0, 1.0)
 
-            base_mask = masks_np[frame_index]
+            base_mask = masks_np[frame_index - frame_offset]
             result_mask = np.maximum(base_mask, particle_mask)
             result_image = np.maximum(particle_image, np.stack([base_mask] * 3, axis=-1))
 
@@ -1024,6 +1162,10 @@ class TaichiParticleMask(MaskBase):
 
             self.update_progress()
 
+        # The state after the last frame seeds the next chunk of a chunked render.
+        if total_frames != resume_frame and total_frames in checkpoint_keys:
+            store_checkpoint(checkpoint_keys[total_frames], system.snapshot(), checkpoint_dir)
+
         self.end_progress()
 
         processed_masks = torch.from_numpy(np.stack(mask_frames)).float()
@@ -1045,12 +1187,35 @@ class TaichiParticleMask(MaskBase):
 class TaichiResetCache(RyanOnTheInside):
     @classmethod
     def INPUT_TYPES(cls):
-        return {"required": {}}
+        return {
+            "required": {
+                "action": (["reset", "stats", "warm_up"],),
+                "max_pool_entries": ("INT", {"default": 4, "min": 1, "max": 32, "step": 1}),
+                "memory_budget_mb": ("FLOAT", {"default": 1024.0, "min": 16.0, "max": 65536.0, "step": 16.0}),
+                "warm_up_width": ("INT", {"default": 512, "min": 8, "max": 8192, "step": 8}),
+                "warm_up_height": ("INT", {"default": 512, "min": 8, "max": 8192, "step": 8}),
+                "warm_up_particle_count": ("INT", {"default": 10000, "min": 1, "max": 200000, "step": 100}),
+            }
+        }
 
-    RETURN_TYPES = ()
+    RETURN_TYPES = ("STRING",)
+    RETURN_NAMES = ("stats",)
     FUNCTION = "reset_cache"
     CATEGORY = "RyanOnTheInside/ParticleSystems/Taichi"
+    OUTPUT_NODE = True
 
-    def reset_cache(self):
-        reset_taichi_cache()
-        return ()
+    def reset_cache(
+        self,
+        action="reset",
+        max_pool_entries=4,
+        memory_budget_mb=1024.0,
+        warm_up_width=512,
+        warm_up_height=512,
+        warm_up_particle_count=10000,
+    ):
+        configure_taichi_pool(max_pool_entries, memory_budget_mb)
+        if action == "reset":
+            reset_taichi_cache()
+        elif action == "warm_up":
+            warm_up_system(warm_up_width, warm_up_height, warm_up_particle_count)
+        return (json.dumps(get_taichi_pool_stats(), indent=2),)
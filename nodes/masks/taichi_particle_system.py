@@ -1,29 +1,231 @@
+import os
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 import taichi as ti
 
 from .taichi_runtime import get_taichi_runtime
 
-_SYSTEM_CACHE = {}
+# Pool of particle systems keyed by (width, height, capacity bucket). Entries are
+# kept in LRU order; the least recently used system is destroyed when the pool
+# exceeds either the entry limit or the memory budget.
+_SYSTEM_POOL: "OrderedDict[Tuple[int, int, int], TaichiParticleSystem]" = OrderedDict()
+_POOL_MAX_ENTRIES = 4
+_POOL_MEMORY_BUDGET = 1024 * 1024 * 1024
+_MIN_CAPACITY_BUCKET = 1024
+_POOL_STATS = {"hits": 0, "misses": 0, "evictions": 0}
+
+# Bytes per particle slot: pos(8) + vel(8) + color(12) + size, shape, spark_length, age, life, birth, active(4 each),
+# plus the compaction scratch copy of everything except the active flag.
+_BYTES_PER_PARTICLE = 56 + 52
+# Bytes per image pixel: RGBA float32.
+_BYTES_PER_PIXEL = 16
+
+# Column layout of the per-emitter parameter rows consumed by the batched emit kernel.
+EMIT_PARAM_FIELDS = (
+    "x",
+    "y",
+    "direction",
+    "spread",
+    "speed",
+    "size",
+    "emission_radius",
+    "color_r",
+    "color_g",
+    "color_b",
+    "particle_life",
+    "shape",
+    "spark_length",
+    "endless",
+)
+EMIT_PARAM_COUNT = len(EMIT_PARAM_FIELDS)
+
+# Per-particle fields captured by snapshots, in the packed [0, active_count) range.
+SNAPSHOT_FIELDS = ("pos", "vel", "color", "size", "shape", "spark_length", "age", "life", "birth", "active")
+# Bumped whenever the snapshot layout changes, so stale checkpoints are never restored.
+SNAPSHOT_FORMAT = 2
+
+# In-memory simulation checkpoints keyed by the hash of everything that
+# determines the particle state at that frame. Oldest entries are dropped first.
+_CHECKPOINTS: "OrderedDict[str, Dict[str, np.ndarray]]" = OrderedDict()
+_CHECKPOINT_MAX_ENTRIES = 64
+# On-disk checkpoints are pruned least recently used first once a directory
+# holds more than this many bytes of .npz files.
+_CHECKPOINT_DISK_BUDGET = 2 * 1024 * 1024 * 1024
+
+
+def capacity_bucket(max_particles: int) -> int:
+    """Round a particle count up to the next power of two (minimum 1024)."""
+    capacity = max(_MIN_CAPACITY_BUCKET, int(max_particles))
+    return 1 << (capacity - 1).bit_length()
+
+
+def estimate_system_bytes(width: int, height: int, capacity: int) -> int:
+    return int(capacity) * _BYTES_PER_PARTICLE + int(width) * int(height) * _BYTES_PER_PIXEL
+
+
+def _pool_bytes() -> int:
+    return sum(system.memory_bytes for system in _SYSTEM_POOL.values())
+
+
+def _evict(keep_key=None) -> None:
+    while len(_SYSTEM_POOL) > 1 and (
+        len(_SYSTEM_POOL) > _POOL_MAX_ENTRIES or _pool_bytes() > _POOL_MEMORY_BUDGET
+    ):
+        victim_key = next(iter(_SYSTEM_POOL))
+        if victim_key == keep_key:
+            _SYSTEM_POOL.move_to_end(victim_key)
+            victim_key = next(iter(_SYSTEM_POOL))
+        victim = _SYSTEM_POOL.pop(victim_key)
+        victim.release()
+        _POOL_STATS["evictions"] += 1
 
 
 def get_cached_system(width: int, height: int, max_particles: int):
-    global _SYSTEM_CACHE
-    key = (int(width), int(height))
-    system = _SYSTEM_CACHE.get(key)
-    if system is None or system.max_particles < int(max_particles):
-        # Drop old cache to avoid growth across multiple sizes.
-        _SYSTEM_CACHE = {}
-        system = TaichiParticleSystem(int(max_particles), int(width), int(height))
-        _SYSTEM_CACHE[key] = system
+    width = int(width)
+    height = int(height)
+    max_particles = int(max_particles)
+    bucket = capacity_bucket(max_particles)
+
+    key = (width, height, bucket)
+    system = _SYSTEM_POOL.get(key)
+    if system is None:
+        # A larger bucket at the same resolution can serve a smaller request.
+        candidates = [k for k in _SYSTEM_POOL if k[0] == width and k[1] == height and k[2] >= bucket]
+        if candidates:
+            key = min(candidates, key=lambda k: k[2])
+            system = _SYSTEM_POOL[key]
+
+    if system is not None:
+        _SYSTEM_POOL.move_to_end(key)
+        _POOL_STATS["hits"] += 1
+    else:
+        _POOL_STATS["misses"] += 1
+        system = TaichiParticleSystem(bucket, width, height)
+        _SYSTEM_POOL[key] = system
+        _evict(keep_key=key)
+
+    system.set_particle_limit(max_particles)
+    return system
+
+
+def warm_up_system(width: int, height: int, max_particles: int):
+    """Allocate a pooled system and compile its kernels ahead of the first render."""
+    system = get_cached_system(width, height, max_particles)
+    system.warm_up()
     return system
 
 
+def configure_taichi_pool(
+    max_entries: Optional[int] = None,
+    memory_budget_mb: Optional[float] = None,
+    checkpoint_disk_budget_mb: Optional[float] = None,
+) -> None:
+    global _POOL_MAX_ENTRIES, _POOL_MEMORY_BUDGET, _CHECKPOINT_DISK_BUDGET
+    if max_entries is not None:
+        _POOL_MAX_ENTRIES = max(1, int(max_entries))
+    if memory_budget_mb is not None:
+        _POOL_MEMORY_BUDGET = max(1, int(float(memory_budget_mb) * 1024 * 1024))
+    if checkpoint_disk_budget_mb is not None:
+        _CHECKPOINT_DISK_BUDGET = max(0, int(float(checkpoint_disk_budget_mb) * 1024 * 1024))
+    _evict()
+
+
+def get_taichi_pool_stats() -> Dict[str, object]:
+    return {
+        "entries": [
+            {
+                "width": key[0],
+                "height": key[1],
+                "capacity": key[2],
+                "particle_limit": system.particle_limit,
+                "memory_bytes": system.memory_bytes,
+            }
+            for key, system in _SYSTEM_POOL.items()
+        ],
+        "memory_bytes": _pool_bytes(),
+        "memory_budget_bytes": _POOL_MEMORY_BUDGET,
+        "max_entries": _POOL_MAX_ENTRIES,
+        "checkpoints": len(_CHECKPOINTS),
+        **_POOL_STATS,
+    }
+
+
+def _remember_checkpoint(key: str, snapshot: Dict[str, np.ndarray]) -> None:
+    _CHECKPOINTS[key] = snapshot
+    _CHECKPOINTS.move_to_end(key)
+    while len(_CHECKPOINTS) > _CHECKPOINT_MAX_ENTRIES:
+        _CHECKPOINTS.popitem(last=False)
+
+
+def store_checkpoint(key: str, snapshot: Dict[str, np.ndarray], directory: str = "") -> None:
+    _remember_checkpoint(key, snapshot)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{key}.npz")
+        np.savez(path, **snapshot)
+        prune_checkpoint_dir(directory, keep=path)
+
+
+def load_checkpoint(key: str, directory: str = "") -> Optional[Dict[str, np.ndarray]]:
+    snapshot = _CHECKPOINTS.get(key)
+    if snapshot is not None:
+        _CHECKPOINTS.move_to_end(key)
+        return snapshot
+    if directory:
+        path = os.path.join(directory, f"{key}.npz")
+        if os.path.isfile(path):
+            with np.load(path) as data:
+                snapshot = {name: data[name] for name in data.files}
+            # Reads count as use, so pruning drops checkpoints nobody resumes from.
+            os.utime(path)
+            _remember_checkpoint(key, snapshot)
+            return snapshot
+    return None
+
+
+def prune_checkpoint_dir(directory: str, budget_bytes: Optional[int] = None, keep: str = "") -> None:
+    """Delete the least recently used .npz checkpoints until the directory fits the budget."""
+    budget = _CHECKPOINT_DISK_BUDGET if budget_bytes is None else int(budget_bytes)
+    entries = []
+    for name in os.listdir(directory):
+        if not name.endswith(".npz"):
+            continue
+        path = os.path.join(directory, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= budget:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+
+def clear_checkpoints(directory: str = "") -> None:
+    """Drop in-memory checkpoints, and every .npz checkpoint in ``directory`` if given."""
+    _CHECKPOINTS.clear()
+    if directory and os.path.isdir(directory):
+        prune_checkpoint_dir(directory, budget_bytes=0)
+
+
 def reset_taichi_cache():
-    global _SYSTEM_CACHE
-    _SYSTEM_CACHE = {}
+    while _SYSTEM_POOL:
+        _, system = _SYSTEM_POOL.popitem(last=False)
+        system.release()
+    for name in _POOL_STATS:
+        _POOL_STATS[name] = 0
+    clear_checkpoints()
 
 
 @dataclass
@@ -41,54 +243,227 @@ class EmitterSettings:
     spark_length: float
     endless: int
 
+    def as_params(self) -> np.ndarray:
+        return np.array(
+            [
+                self.x,
+                self.y,
+                self.direction,
+                self.spread,
+                self.speed,
+                self.size,
+                self.emission_radius,
+                self.color[0],
+                self.color[1],
+                self.color[2],
+                self.particle_life,
+                self.shape,
+                self.spark_length,
+                self.endless,
+            ],
+            dtype=np.float32,
+        )
+
+
+@ti.func
+def _hash_u32(value):
+    h = ti.cast(value, ti.u32)
+    h ^= h >> 16
+    h *= ti.u32(0x7FEB352D)
+    h ^= h >> 15
+    h *= ti.u32(0x846CA68B)
+    h ^= h >> 16
+    return h
+
+
+@ti.func
+def _random01(seed, index, stream):
+    # Counter-based random number: the value depends only on (seed, particle
+    # index, stream), so the simulation state is fully described by the emit
+    # cursor and can be checkpointed.
+    h = _hash_u32(ti.cast(seed, ti.u32) ^ _hash_u32(ti.cast(index, ti.u32) * ti.u32(4) + ti.cast(stream, ti.u32)))
+    return ti.cast(h >> 8, ti.f32) / 16777216.0
+
 
 @ti.data_oriented
 class TaichiParticleSystem:
     def __init__(self, max_particles: int, width: int, height: int):
         get_taichi_runtime()
         self.max_particles = int(max_particles)
+        self.particle_limit = self.max_particles
+        self.seed = 0
+        # Emission counter, tracked on the host so slot ranges can be planned per launch.
+        self.emit_cursor = 0
         self.width = int(width)
         self.height = int(height)
+        self._snode_tree = None
         self._build_fields()
 
     def _build_fields(self) -> None:
-        self.pos = ti.Vector.field(2, dtype=ti.f32, shape=self.max_particles)
-        self.vel = ti.Vector.field(2, dtype=ti.f32, shape=self.max_particles)
-        self.color = ti.Vector.field(3, dtype=ti.f32, shape=self.max_particles)
-        self.size = ti.field(dtype=ti.f32, shape=self.max_particles)
-        self.shape = ti.field(dtype=ti.i32, shape=self.max_particles)
-        self.spark_length = ti.field(dtype=ti.f32, shape=self.max_particles)
-        self.age = ti.field(dtype=ti.f32, shape=self.max_particles)
-        self.life = ti.field(dtype=ti.f32, shape=self.max_particles)
-        self.active = ti.field(dtype=ti.i32, shape=self.max_particles)
-        self.emit_cursor = ti.field(dtype=ti.i32, shape=())
-
-        self.image = ti.Vector.field(4, dtype=ti.f32, shape=(self.height, self.width))
+        self.pos = ti.Vector.field(2, dtype=ti.f32)
+        self.vel = ti.Vector.field(2, dtype=ti.f32)
+        self.color = ti.Vector.field(3, dtype=ti.f32)
+        self.size = ti.field(dtype=ti.f32)
+        self.shape = ti.field(dtype=ti.i32)
+        self.spark_length = ti.field(dtype=ti.f32)
+        self.age = ti.field(dtype=ti.f32)
+        self.life = ti.field(dtype=ti.f32)
+        # Emission index of each particle; endless mode evicts the oldest births first.
+        self.birth = ti.field(dtype=ti.i32)
+        self.active = ti.field(dtype=ti.i32)
+
+        # Live particles are kept packed in [0, active_count); dead ones are
+        # squeezed out through the scratch buffers after every update.
+        self.active_count = ti.field(dtype=ti.i32)
+        self.compact_count = ti.field(dtype=ti.i32)
+        self.scratch_pos = ti.Vector.field(2, dtype=ti.f32)
+        self.scratch_vel = ti.Vector.field(2, dtype=ti.f32)
+        self.scratch_color = ti.Vector.field(3, dtype=ti.f32)
+        self.scratch_size = ti.field(dtype=ti.f32)
+        self.scratch_shape = ti.field(dtype=ti.i32)
+        self.scratch_spark_length = ti.field(dtype=ti.f32)
+        self.scratch_age = ti.field(dtype=ti.f32)
+        self.scratch_life = ti.field(dtype=ti.f32)
+        self.scratch_birth = ti.field(dtype=ti.i32)
+
+        self.image = ti.Vector.field(4, dtype=ti.f32)
+
+        # Fields live in their own SNode tree so an evicted system can hand its
+        # memory back to Taichi instead of leaking it in the root tree.
+        builder = ti.FieldsBuilder()
+        builder.dense(ti.i, self.max_particles).place(
+            self.pos,
+            self.vel,
+            self.color,
+            self.size,
+            self.shape,
+            self.spark_length,
+            self.age,
+            self.life,
+            self.birth,
+            self.active,
+        )
+        builder.dense(ti.i, self.max_particles).place(
+            self.scratch_pos,
+            self.scratch_vel,
+            self.scratch_color,
+            self.scratch_size,
+            self.scratch_shape,
+            self.scratch_spark_length,
+            self.scratch_age,
+            self.scratch_life,
+            self.scratch_birth,
+        )
+        builder.place(self.active_count, self.compact_count)
+        builder.dense(ti.ij, (self.height, self.width)).place(self.image)
+        self._snode_tree = builder.finalize()
+
+    @property
+    def memory_bytes(self) -> int:
+        return estimate_system_bytes(self.width, self.height, self.max_particles)
+
+    def set_particle_limit(self, limit: int) -> None:
+        self.particle_limit = max(1, min(int(limit), self.max_particles))
+
+    def set_seed(self, seed: int) -> None:
+        self.seed = int(seed) & 0x7FFFFFFF
+
+    def snapshot(self) -> Dict[str, np.ndarray]:
+        """Capture the live particles and RNG counter as plain numpy arrays."""
+        count = self.particle_count
+        snapshot = {name: getattr(self, name).to_numpy()[:count] for name in SNAPSHOT_FIELDS}
+        snapshot["emit_cursor"] = np.array(self.emitted_count, dtype=np.int64)
+        snapshot["active_count"] = np.array(count, dtype=np.int64)
+        snapshot["seed"] = np.array(self.seed, dtype=np.int64)
+        return snapshot
+
+    def restore(self, snapshot: Dict[str, np.ndarray]) -> None:
+        count = int(snapshot["active_count"])
+        if count > self.max_particles:
+            raise ValueError(f"Checkpoint holds {count} particles but the system capacity is {self.max_particles}")
+        for name in SNAPSHOT_FIELDS:
+            field = getattr(self, name)
+            full = field.to_numpy()
+            full[:count] = snapshot[name]
+            field.from_numpy(full)
+        self.emit_cursor = int(snapshot["emit_cursor"])
+        self.active_count[None] = count
+        self.compact_count[None] = count
+        self.seed = int(snapshot["seed"])
+
+    def release(self) -> None:
+        if self._snode_tree is not None:
+            self._snode_tree.destroy()
+            self._snode_tree = None
+
+    def warm_up(self) -> None:
+        self.reset()
+        self.emit_batch(np.ones(1, dtype=np.int32), np.zeros((1, EMIT_PARAM_COUNT), dtype=np.float32))
+        self._evict_particles(0)
+        self.update(0.0, 0.0, 0.0)
+        self.rasterize()
+        self.reset()
 
     def reset(self) -> None:
         self._reset_particles()
+        self.emit_cursor = 0
         self.clear_image()
 
     def clear_image(self) -> None:
         self._clear_image()
 
     def emit(self, count: int, settings: EmitterSettings) -> None:
+        self.emit_batch(np.array([count], dtype=np.int32), settings.as_params()[None, :])
+
+    def emit_batch(self, counts: np.ndarray, params: np.ndarray) -> None:
+        """Emit particles for several emitters in one kernel launch.
+
+        ``counts`` holds the particle count per emitter and ``params`` one row per
+        emitter laid out as ``EMIT_PARAM_FIELDS``.
+        """
+        counts = np.asarray(counts)
+        firing = np.nonzero(counts > 0)[0]
+        if firing.size == 0:
+            return
+        params = np.ascontiguousarray(params[firing], dtype=np.float32)
+        offsets = np.zeros(firing.size + 1, dtype=np.int64)
+        np.cumsum(counts[firing], out=offsets[1:])
+
+        base = self.emit_cursor
+        end = base + int(offsets[-1])
+        limit = int(self.particle_limit)
+        endless = params[:, EMIT_PARAM_FIELDS.index("endless")] >= 0.5
+
+        # Without endless mode the limit caps the total emitted over the run. With it,
+        # the buffer behaves as a ring over emission order: anything emitted more than
+        # `limit` emissions ago is evicted, oldest first, before the new particles land.
+        floor = max(0, end - limit) if endless.any() else 0
+        if floor > 0:
+            self._evict_particles(floor)
+            self._compact_particles()
+
+        # Each emitter writes a contiguous run of its particles, so every particle's
+        # slot is fixed up front and no two threads can claim the same one.
+        first = np.maximum(offsets[:-1], floor - base)
+        last = np.where(endless, offsets[1:], np.minimum(offsets[1:], limit - base))
+        last = np.maximum(last, first)
+        slots = np.zeros(firing.size + 1, dtype=np.int64)
+        np.cumsum(last - first, out=slots[1:])
+
+        self.emit_cursor = end
+        if slots[-1] == 0:
+            return
         self._emit_particles(
-            int(count),
-            float(settings.x),
-            float(settings.y),
-            float(settings.direction),
-            float(settings.spread),
-            float(settings.speed),
-            float(settings.size),
-            float(settings.emission_radius),
-            float(settings.color[0]),
-            float(settings.color[1]),
-            float(settings.color[2]),
-            float(settings.particle_life),
-            int(settings.shape),
-            float(settings.spark_length),
-            int(settings.endless),
+            offsets.astype(np.int32),
+            first.astype(np.int32),
+            last.astype(np.int32),
+            slots.astype(np.int32),
+            params,
+            int(firing.size),
+            int(offsets[-1]),
+            int(slots[-1]),
+            int(base),
+            int(self.seed),
             float(self.width),
             float(self.height),
         )
@@ -101,6 +476,7 @@ class TaichiParticleSystem:
             float(self.width),
             float(self.height),
         )
+        self._compact_particles()
 
     def rasterize(self) -> None:
         self._rasterize_particles(float(self.width), float(self.height))
@@ -114,25 +490,23 @@ class TaichiParticleSystem:
 
     @property
     def particle_capacity(self) -> int:
-        return self.max_particles
+        return self.particle_limit
 
     @property
     def particle_count(self) -> int:
-        return int(self.emit_cursor.to_numpy())
+        return int(self.active_count[None])
+
+    @property
+    def emitted_count(self) -> int:
+        return self.emit_cursor
 
     @ti.kernel
     def _reset_particles(self):
-        for i in range(self.max_particles):
-            self.pos[i] = ti.Vector([0.0, 0.0])
-            self.vel[i] = ti.Vector([0.0, 0.0])
-            self.color[i] = ti.Vector([0.0, 0.0, 0.0])
-            self.size[i] = 0.0
-            self.shape[i] = 0
-            self.spark_length[i] = 0.0
-            self.age[i] = 0.0
-            self.life[i] = 0.0
+        # Slots past active_count are never read, so only the packed range needs clearing.
+        for i in range(self.active_count[None]):
             self.active[i] = 0
-        self.emit_cursor[None] = 0
+        self.active_count[None] = 0
+        self.compact_count[None] = 0
 
     @ti.kernel
     def _clear_image(self):
@@ -142,47 +516,56 @@ class TaichiParticleSystem:
     @ti.kernel
     def _emit_particles(
         self,
-        count: ti.i32,
-        emitter_x: ti.f32,
-        emitter_y: ti.f32,
-        direction: ti.f32,
-        spread: ti.f32,
-        speed: ti.f32,
-        size: ti.f32,
-        emission_radius: ti.f32,
-        color_r: ti.f32,
-        color_g: ti.f32,
-        color_b: ti.f32,
-        particle_life: ti.f32,
-        shape: ti.i32,
-        spark_length: ti.f32,
-        endless: ti.i32,
+        offsets: ti.types.ndarray(),
+        first: ti.types.ndarray(),
+        last: ti.types.ndarray(),
+        slots: ti.types.ndarray(),
+        params: ti.types.ndarray(),
+        emitter_count: ti.i32,
+        total: ti.i32,
+        emitted: ti.i32,
+        base: ti.i32,
+        seed: ti.i32,
         width: ti.f32,
         height: ti.f32,
     ):
-        for _ in range(count):
-            raw_idx = ti.atomic_add(self.emit_cursor[None], 1)
-            idx = raw_idx
-            if endless == 1:
-                idx = raw_idx % self.max_particles
-            if idx < self.max_particles:
-                angle = direction + (ti.random() - 0.5) * spread
-                velocity = ti.Vector([ti.cos(angle), ti.sin(angle)]) * speed
-
-                radius = emission_radius * ti.sqrt(ti.random())
-                theta = ti.random() * ti.math.pi * 2.0
+        count = self.active_count[None]
+        for k in range(total):
+            # offsets holds exclusive prefix sums of the per-emitter counts;
+            # find the emitter that owns particle k.
+            lo = 0
+            hi = emitter_count - 1
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                if offsets[mid] <= k:
+                    lo = mid
+                else:
+                    hi = mid - 1
+            e = lo
+
+            # Only [first, last) of each emitter's run survives the limit; those
+            # particles land in the free slots right after the live ones.
+            if first[e] <= k and k < last[e]:
+                idx = count + slots[e] + (k - first[e])
+                raw_idx = base + k
+                angle = params[e, 2] + (_random01(seed, raw_idx, 0) - 0.5) * params[e, 3]
+                velocity = ti.Vector([ti.cos(angle), ti.sin(angle)]) * params[e, 4]
+
+                radius = params[e, 6] * ti.sqrt(_random01(seed, raw_idx, 1))
+                theta = _random01(seed, raw_idx, 2) * ti.math.pi * 2.0
                 offset = ti.Vector([ti.cos(theta), ti.sin(theta)]) * radius
 
-                position = ti.Vector([emitter_x, emitter_y]) + offset
+                position = ti.Vector([params[e, 0], params[e, 1]]) + offset
 
                 self.pos[idx] = position
                 self.vel[idx] = velocity
-                self.color[idx] = ti.Vector([color_r, color_g, color_b])
-                self.size[idx] = size
-                self.shape[idx] = shape
-                self.spark_length[idx] = spark_length
+                self.color[idx] = ti.Vector([params[e, 7], params[e, 8], params[e, 9]])
+                self.size[idx] = params[e, 5]
+                self.shape[idx] = ti.cast(params[e, 11], ti.i32)
+                self.spark_length[idx] = params[e, 12]
                 self.age[idx] = 0.0
-                self.life[idx] = particle_life
+                self.life[idx] = params[e, 10]
+                self.birth[idx] = raw_idx
                 self.active[idx] = 1
 
                 if (
@@ -193,6 +576,14 @@ class TaichiParticleSystem:
                 ):
                     self.active[idx] = 0
 
+        self.active_count[None] = count + emitted
+
+    @ti.kernel
+    def _evict_particles(self, floor: ti.i32):
+        for i in range(self.active_count[None]):
+            if self.birth[i] < floor:
+                self.active[i] = 0
+
     @ti.kernel
     def _update_particles(
         self,
@@ -203,7 +594,7 @@ class TaichiParticleSystem:
         height: ti.f32,
     ):
         gravity = ti.Vector([gravity_x, gravity_y])
-        for i in range(self.max_particles):
+        for i in range(self.active_count[None]):
             if self.active[i] == 1:
                 self.age[i] += dt
                 if self.age[i] >= self.life[i]:
@@ -220,9 +611,41 @@ class TaichiParticleSystem:
                     ):
                         self.active[i] = 0
 
+    @ti.kernel
+    def _compact_particles(self):
+        count = self.active_count[None]
+        self.compact_count[None] = 0
+        for i in range(count):
+            if self.active[i] == 1:
+                j = ti.atomic_add(self.compact_count[None], 1)
+                self.scratch_pos[j] = self.pos[i]
+                self.scratch_vel[j] = self.vel[i]
+                self.scratch_color[j] = self.color[i]
+                self.scratch_size[j] = self.size[i]
+                self.scratch_shape[j] = self.shape[i]
+                self.scratch_spark_length[j] = self.spark_length[i]
+                self.scratch_age[j] = self.age[i]
+                self.scratch_life[j] = self.life[i]
+                self.scratch_birth[j] = self.birth[i]
+        for i in range(count):
+            if i < self.compact_count[None]:
+                self.pos[i] = self.scratch_pos[i]
+                self.vel[i] = self.scratch_vel[i]
+                self.color[i] = self.scratch_color[i]
+                self.size[i] = self.scratch_size[i]
+                self.shape[i] = self.scratch_shape[i]
+                self.spark_length[i] = self.scratch_spark_length[i]
+                self.age[i] = self.scratch_age[i]
+                self.life[i] = self.scratch_life[i]
+                self.birth[i] = self.scratch_birth[i]
+                self.active[i] = 1
+            else:
+                self.active[i] = 0
+        self.active_count[None] = self.compact_count[None]
+
     @ti.kernel
     def _rasterize_particles(self, width: ti.f32, height: ti.f32):
-        for i in range(self.max_particles):
+        for i in range(self.active_count[None]):
             if self.active[i] == 1:
                 x = int(self.pos[i].x)
                 y = int(self.pos[i].y)
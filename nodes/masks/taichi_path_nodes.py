@@ -8,6 +8,7 @@ import torch
 
 from ... import RyanOnTheInside
 from ...tooltips import apply_tooltips
+from .taichi_particle_nodes import _prepare_path, _sample_path
 
 
 def _parse_color(color_value: str) -> Tuple[float, float, float]:
@@ -35,6 +36,16 @@ def _render_path(points: List[Tuple[float, float]], width: int, height: int, thi
     return np.clip(mask, 0.0, 1.0), np.clip(image, 0.0, 1.0)
 
 
+def _chaikin_smooth(points: np.ndarray, iterations: int) -> np.ndarray:
+    """Corner-cut a closed polygon; each pass replaces every edge with its 1/4 and 3/4 points."""
+    for _ in range(iterations):
+        following = np.roll(points, -1, axis=0)
+        q = 0.75 * points + 0.25 * following
+        r = 0.25 * points + 0.75 * following
+        points = np.stack([q, r], axis=1).reshape(-1, 2)
+    return points
+
+
 def _generate_shape_points(shape_type: str, **kwargs) -> List[Tuple[float, float]]:
     center_x = kwargs["center_x"]
     center_y = kwargs["center_y"]
@@ -44,67 +55,47 @@ def _generate_shape_points(shape_type: str, **kwargs) -> List[Tuple[float, float
     cos_r = np.cos(rotation)
     sin_r = np.sin(rotation)
 
-    def _transform_point(px: float, py: float) -> Tuple[float, float]:
+    def _transform_points(px, py) -> np.ndarray:
+        px = np.asarray(px, dtype=np.float64)
+        py = np.asarray(py, dtype=np.float64)
         rx = px * cos_r - py * sin_r
         ry = px * sin_r + py * cos_r
-        return (center_x + rx, center_y + ry)
+        return np.stack([center_x + rx, center_y + ry], axis=-1)
+
+    def _as_list(points: np.ndarray) -> List[Tuple[float, float]]:
+        return [(float(x), float(y)) for x, y in points]
 
     if shape_type == "line":
-        return [
-            _transform_point(-size_x * 0.5, -size_y * 0.5),
-            _transform_point(size_x * 0.5, size_y * 0.5),
-        ]
+        return _as_list(_transform_points([-size_x * 0.5, size_x * 0.5], [-size_y * 0.5, size_y * 0.5]))
     if shape_type == "circle":
         radius = size_x * 0.5
         segments = kwargs["segments"]
-        points = []
-        for i in range(segments + 1):
-            t = 2 * np.pi * i / segments
-            points.append(_transform_point(np.cos(t) * radius, np.sin(t) * radius))
-        return points
+        t = 2 * np.pi * np.arange(segments + 1) / segments
+        return _as_list(_transform_points(np.cos(t) * radius, np.sin(t) * radius))
     if shape_type == "arc":
         radius = size_x * 0.5
         start_angle = np.deg2rad(kwargs["start_angle"])
         end_angle = np.deg2rad(kwargs["end_angle"])
         segments = kwargs["segments"]
-        points = []
-        for i in range(segments + 1):
-            t = start_angle + (end_angle - start_angle) * (i / segments)
-            points.append(_transform_point(np.cos(t) * radius, np.sin(t) * radius))
-        return points
+        t = start_angle + (end_angle - start_angle) * (np.arange(segments + 1) / segments)
+        return _as_list(_transform_points(np.cos(t) * radius, np.sin(t) * radius))
     if shape_type in ("polygon", "rounded_rect"):
         sides = max(3, int(kwargs["sides"]))
         corner_radius = max(0.0, float(kwargs["corner_radius"]))
-        segments = max(4, int(kwargs["segments"]))
 
-        vertices = []
-        for i in range(sides):
-            angle = (2 * np.pi * i / sides)
-            vertices.append(_transform_point(np.cos(angle) * size_x * 0.5, np.sin(angle) * size_y * 0.5))
+        angles = 2 * np.pi * np.arange(sides) / sides
+        vertices = _transform_points(np.cos(angles) * size_x * 0.5, np.sin(angles) * size_y * 0.5)
 
-        vertices.append(vertices[0])
         if corner_radius <= 0.0:
-            return vertices
+            return _as_list(np.concatenate([vertices, vertices[:1]]))
 
         cr = corner_radius
         if corner_radius <= 1.0:
             cr = corner_radius * min(size_x, size_y) * 0.5
 
         iterations = max(1, min(6, int(cr * 10)))
-        points = vertices[:-1]
-        for _ in range(iterations):
-            new_points = []
-            for i in range(len(points)):
-                p0 = np.array(points[i])
-                p1 = np.array(points[(i + 1) % len(points)])
-                q = 0.75 * p0 + 0.25 * p1
-                r = 0.25 * p0 + 0.75 * p1
-                new_points.append(tuple(q))
-                new_points.append(tuple(r))
-            points = new_points
-
-        points.append(points[0])
-        return points
+        points = _chaikin_smooth(vertices, iterations)
+        return _as_list(np.concatenate([points, points[:1]]))
     if shape_type == "polyline":
         return kwargs["polyline_points"]
     return []
@@ -1,4 +1,5 @@
 import numpy as np
+from scipy.optimize import linear_sum_assignment
 from ... import RyanOnTheInside
 from comfy.utils import ProgressBar
 from ...tooltips import apply_tooltips
@@ -58,100 +59,92 @@ class PoseInterpolator(ProgressMixin):
 
 
     def match_poses(self, start_poses, end_poses):
-        pose_count = min(len(start_poses), len(end_poses))
-        pose_matches_final = []
-        pose_match_candidates = []
-
-        for start_idx, start_pose in enumerate(start_poses):
-            for end_idx, end_pose in enumerate(end_poses):
-                start_keypoints = np.array(start_pose['pose_keypoints_2d']).reshape(-1, 3)
-                end_keypoints = np.array(end_pose['pose_keypoints_2d']).reshape(-1, 3)
-                
-                # Calculate distance between poses
-                valid_points = (start_keypoints[:, 2] > 0) & (end_keypoints[:, 2] > 0)
-                if np.sum(valid_points) > 0:
-                    distance = np.mean(np.linalg.norm(start_keypoints[valid_points, :2] - end_keypoints[valid_points, :2], axis=1))
-                    pose_match_candidates.append((distance, start_idx, end_idx))
-
-        pose_match_candidates.sort(key=lambda x: x[0])
-        for _, start_idx, end_idx in pose_match_candidates:
-            if start_idx not in [x[0] for x in pose_matches_final] and end_idx not in [x[1] for x in pose_matches_final]:
-                pose_matches_final.append((start_idx, end_idx))
-                if len(pose_matches_final) == pose_count:
-                    break
-
-        return pose_matches_final
+        """Pair start and end people by minimum total keypoint distance, closest pairs first."""
+        if len(start_poses) == 0 or len(end_poses) == 0:
+            return []
+
+        start_keypoints = np.array([pose['pose_keypoints_2d'] for pose in start_poses], dtype=np.float64).reshape(len(start_poses), -1, 3)
+        end_keypoints = np.array([pose['pose_keypoints_2d'] for pose in end_poses], dtype=np.float64).reshape(len(end_poses), -1, 3)
+
+        # Mean distance over keypoints visible in both poses, for every (start, end) pair
+        valid_points = (start_keypoints[:, None, :, 2] > 0) & (end_keypoints[None, :, :, 2] > 0)
+        point_distances = np.linalg.norm(start_keypoints[:, None, :, :2] - end_keypoints[None, :, :, :2], axis=-1)
+        valid_counts = valid_points.sum(axis=-1)
+        comparable = valid_counts > 0
+        distances = np.where(valid_points, point_distances, 0).sum(axis=-1) / np.maximum(valid_counts, 1)
+
+        # Pairs without shared keypoints can never be matched
+        unmatchable_cost = distances[comparable].max(initial=0) * distances.size + 1
+        start_indices, end_indices = linear_sum_assignment(np.where(comparable, distances, unmatchable_cost))
+
+        keep = comparable[start_indices, end_indices]
+        start_indices, end_indices = start_indices[keep], end_indices[keep]
+        order = np.argsort(distances[start_indices, end_indices], kind='stable')
+        return [(int(start_indices[i]), int(end_indices[i])) for i in order]
 
     def interpolate_person_keypoints(self, person1, person2, t, interpolation_mode, omit_missing_points):
         """Interpolate keypoints for a single person."""
         interpolated_person = {}  # Initialize the dictionary here
 
-        keypoints1 = np.array(person1['pose_keypoints_2d']).reshape(-1, 3)
-        keypoints2 = np.array(person2['pose_keypoints_2d']).reshape(-1, 3)
-
-        interpolated_keypoints = []
-        for start_keyp, end_keyp in zip(keypoints1, keypoints2):
-            if np.all(start_keyp == 0) and np.all(end_keyp == 0):
-                interpolated_keypoints.extend([0, 0, 0])
-            elif np.all(start_keyp == 0) or np.all(end_keyp == 0):
-                if omit_missing_points:
-                    interpolated_keypoints.extend([0, 0, 0])
-                else:
-                    interpolated_keypoints.extend(end_keyp if np.all(start_keyp == 0) else start_keyp)
-            else:
-                if interpolation_mode == 'Linear':
-                    interp_keyp = (1 - t) * start_keyp + t * end_keyp
-                else:
-                    interp_keyp = self.slerp_keypoints(start_keyp[:2], end_keyp[:2], t)
-                    interp_keyp = np.append(interp_keyp, (1 - t) * start_keyp[2] + t * end_keyp[2])
-                interpolated_keypoints.extend(interp_keyp)
-
-        interpolated_person['pose_keypoints_2d'] = interpolated_keypoints
+        interpolated_person['pose_keypoints_2d'] = self.interpolate_keypoints(
+            person1['pose_keypoints_2d'], person2['pose_keypoints_2d'], t, interpolation_mode, omit_missing_points
+        )
 
         # Add interpolation for face and hand keypoints
         for keypoint_type in ['face_keypoints_2d', 'hand_left_keypoints_2d', 'hand_right_keypoints_2d']:
-            keypoints1 = np.array(person1.get(keypoint_type, [])).reshape(-1, 3)
-            keypoints2 = np.array(person2.get(keypoint_type, [])).reshape(-1, 3)
-            
+            keypoints1 = person1.get(keypoint_type, [])
+            keypoints2 = person2.get(keypoint_type, [])
+
             if len(keypoints1) == 0 or len(keypoints2) == 0:
-                interpolated_person[keypoint_type] = person1.get(keypoint_type, [])
+                interpolated_person[keypoint_type] = keypoints1
                 continue
 
-            interpolated_keypoints = []
-            for start_keyp, end_keyp in zip(keypoints1, keypoints2):
-                if np.all(start_keyp == 0) and np.all(end_keyp == 0):
-                    interpolated_keypoints.extend([0, 0, 0])
-                elif np.all(start_keyp == 0) or np.all(end_keyp == 0):
-                    if omit_missing_points:
-                        interpolated_keypoints.extend([0, 0, 0])
-                    else:
-                        interpolated_keypoints.extend(end_keyp if np.all(start_keyp == 0) else start_keyp)
-                else:
-                    if interpolation_mode == 'Linear':
-                        interp_keyp = (1 - t) * start_keyp + t * end_keyp
-                    else:
-                        interp_keyp = self.slerp_keypoints(start_keyp[:2], end_keyp[:2], t)
-                        interp_keyp = np.append(interp_keyp, (1 - t) * start_keyp[2] + t * end_keyp[2])
-                    interpolated_keypoints.extend(interp_keyp)
-            
-            interpolated_person[keypoint_type] = interpolated_keypoints
+            interpolated_person[keypoint_type] = self.interpolate_keypoints(
+                keypoints1, keypoints2, t, interpolation_mode, omit_missing_points
+            )
 
         return interpolated_person
 
+    def interpolate_keypoints(self, keypoints1, keypoints2, t, interpolation_mode, omit_missing_points):
+        """Interpolate two flat [x, y, confidence, ...] keypoint lists in one masked operation."""
+        keypoints1 = np.array(keypoints1, dtype=np.float64).reshape(-1, 3)
+        keypoints2 = np.array(keypoints2, dtype=np.float64).reshape(-1, 3)
+        count = min(len(keypoints1), len(keypoints2))
+        keypoints1, keypoints2 = keypoints1[:count], keypoints2[:count]
+
+        missing1 = np.all(keypoints1 == 0, axis=1)
+        missing2 = np.all(keypoints2 == 0, axis=1)
+
+        if interpolation_mode == 'Linear':
+            interpolated = (1 - t) * keypoints1 + t * keypoints2
+        else:
+            interpolated = np.empty_like(keypoints1)
+            interpolated[:, :2] = self.slerp_keypoints(keypoints1[:, :2], keypoints2[:, :2], t)
+            interpolated[:, 2] = (1 - t) * keypoints1[:, 2] + t * keypoints2[:, 2]
+
+        # A point present in only one pose is kept as-is, or dropped when omitting missing points
+        if omit_missing_points:
+            fallback = np.zeros_like(keypoints1)
+        else:
+            fallback = np.where(missing1[:, None], keypoints2, keypoints1)
+        result = np.where((missing1 | missing2)[:, None], fallback, interpolated)
+
+        return result.reshape(-1).tolist()
+
     def slerp_keypoints(self, kp1, kp2, t):
-        """Spherical interpolation for keypoints."""
+        """Spherical interpolation for keypoints, row-wise over (..., 2) arrays."""
         # Avoid division by zero
-        norm1 = np.linalg.norm(kp1) + 1e-8
-        norm2 = np.linalg.norm(kp2) + 1e-8
+        norm1 = np.linalg.norm(kp1, axis=-1, keepdims=True) + 1e-8
+        norm2 = np.linalg.norm(kp2, axis=-1, keepdims=True) + 1e-8
 
         # Compute the cosine of the angle between the vectors
-        cos_omega = np.clip(np.dot(kp1, kp2) / (norm1 * norm2), -1.0, 1.0)
+        cos_omega = np.clip(np.sum(kp1 * kp2, axis=-1, keepdims=True) / (norm1 * norm2), -1.0, 1.0)
         omega = np.arccos(cos_omega)
 
-        if omega == 0:
-            return kp1
-        else:
-            sin_omega = np.sin(omega)
-            coef1 = np.sin((1 - t) * omega) / sin_omega
-            coef2 = np.sin(t * omega) / sin_omega
-            return coef1 * kp1 + coef2 * kp2
+        # Rows with no angle between them stay at kp1
+        sin_omega = np.sin(omega)
+        aligned = omega == 0
+        safe_sin = np.where(aligned, 1.0, sin_omega)
+        coef1 = np.where(aligned, 1.0, np.sin((1 - t) * omega) / safe_sin)
+        coef2 = np.where(aligned, 0.0, np.sin(t * omega) / safe_sin)
+        return coef1 * kp1 + coef2 * kp2
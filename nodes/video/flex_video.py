@@ -31,9 +31,16 @@ class FlexVideoDirection(FlexVideoBase):
         video: np.ndarray,
         feature_values: np.ndarray,
         **kwargs,
+    ) -> np.ndarray:
+        return video[self.compute_frame_indices(video.shape[0], feature_values=feature_values, **kwargs)]
+
+    def compute_frame_indices(
+        self,
+        num_input_frames: int,
+        feature_values: np.ndarray,
+        **kwargs,
     ) -> np.ndarray:
         num_output_frames = len(feature_values)
-        num_input_frames = video.shape[0]
         
         # Ensure strength and threshold arrays match feature length
         strength = kwargs.get('strength')
@@ -62,9 +69,6 @@ class FlexVideoDirection(FlexVideoBase):
             normalized_features = np.full_like(feature_values, 0.5)
             normalized_threshold = feature_threshold
 
-        # Create output video array matching feature length
-        processed_video = np.empty((num_output_frames, *video.shape[1:]), dtype=video.dtype)
-        
         # Handle thresholding
         above_threshold = normalized_features >= normalized_threshold
         
@@ -76,12 +80,7 @@ class FlexVideoDirection(FlexVideoBase):
         )
         
         # Convert to integer indices with clipping
-        frame_indices = np.clip(frame_positions.astype(int), 0, num_input_frames - 1)
-        
-        # Create the output video by sampling from input video
-        processed_video = video[frame_indices]
-
-        return processed_video
+        return np.clip(frame_positions.astype(int), 0, num_input_frames - 1)
 
 @apply_tooltips
 class FlexVideoSeek(FlexVideoBase):
@@ -112,16 +111,20 @@ class FlexVideoSeek(FlexVideoBase):
         reverse: bool,
         **kwargs,
     ) -> np.ndarray:
-        num_frames = video.shape[0]
-        processed_video = np.empty_like(video)
+        return video[self.compute_frame_indices(video.shape[0], feature_values=feature_values, reverse=reverse, **kwargs)]
+
+    def compute_frame_indices(
+        self,
+        num_input_frames: int,
+        feature_values: np.ndarray,
+        reverse: bool,
+        **kwargs,
+    ) -> np.ndarray:
+        num_frames = num_input_frames
         strength = kwargs.get('strength', np.ones(num_frames))
         feature_threshold = kwargs.get('feature_threshold', np.zeros(num_frames))
         seek_speed = 1.0
 
-        # Reverse the video if the reverse parameter is True
-        if reverse:
-            video = video[::-1]
-
         # Create a mask for values above threshold (element-wise comparison)
         above_threshold = feature_values >= feature_threshold
         
@@ -143,28 +146,24 @@ class FlexVideoSeek(FlexVideoBase):
 
         # Calculate cumulative positions
         cumulative_positions = np.cumsum(adjusted_speeds)
-        
-        # For frames where feature is below threshold, maintain previous frame
-        frame_indices = np.zeros(num_frames, dtype=int)
-        last_valid_idx = 0
-        
-        for i in range(num_frames):
-            if above_threshold[i]:
-                frame_idx = int(np.clip(cumulative_positions[i], 0, num_frames - 1))
-                last_valid_idx = frame_idx
-            else:
-                frame_idx = last_valid_idx
-            frame_indices[i] = frame_idx
+        seek_indices = np.clip(cumulative_positions, 0, num_frames - 1).astype(int)
 
-        # Create the processed video by selecting frames based on the mapped indices
-        for idx in range(num_frames):
-            processed_video[idx] = video[frame_indices[idx]]
+        # For frames where feature is below threshold, hold the last frame reached
+        # above it (the first frame until then)
+        above_threshold = above_threshold[:num_frames]
+        last_valid = np.maximum.accumulate(np.where(above_threshold, np.arange(num_frames), -1))
+        frame_indices = np.where(last_valid >= 0, seek_indices[np.maximum(last_valid, 0)], 0)
 
-        return processed_video
+        # Reading the reversed video at index i is reading the original at n - 1 - i
+        if reverse:
+            frame_indices = num_frames - 1 - frame_indices
+
+        return frame_indices
 
 
 @apply_tooltips
 class FlexVideoFrameBlend(FlexVideoBase):
+    SUPPORTS_PIPELINE = True
 
     @classmethod
     def get_modifiable_params(cls):
@@ -179,14 +178,20 @@ class FlexVideoFrameBlend(FlexVideoBase):
             "direction_bias": ("FLOAT", {"default": 0.5, "min": 0.0, "max": 1.0, "step": 0.01}),
             "blend_mode": (["normal", "additive", "multiply", "screen"],),
             "motion_blur_strength": ("FLOAT", {"default": 0.0, "min": 0.0, "max": 1.0, "step": 0.01}),
+            "chunk_size": ("INT", {"default": 16, "min": 1, "max": 1024, "step": 1}),
         })
         return inputs
 
     FUNCTION = "apply_effect"
 
-    def apply_effect_internal(
+    def apply_effect_internal(self, video: np.ndarray, **kwargs) -> np.ndarray:
+        return self.apply_effect_chunk(torch.from_numpy(video), 0, len(kwargs["feature_values"]), **kwargs).numpy()
+
+    def apply_effect_chunk(
         self,
-        video: np.ndarray,
+        video: torch.Tensor,
+        start: int,
+        end: int,
         feature_values: np.ndarray,
         blend_strength: float,
         frame_offset_ratio: float,
@@ -194,11 +199,10 @@ class FlexVideoFrameBlend(FlexVideoBase):
         blend_mode: str,
         motion_blur_strength: float,
         **kwargs,
-    ) -> np.ndarray:
+    ) -> torch.Tensor:
         num_frames = video.shape[0]
         strength = kwargs.get('strength', 1.0)
         feature_mode = kwargs.get('feature_mode', 'relative')
-        processed_video = np.empty_like(video)
 
         # Adjust parameters based on feature values
         if feature_mode == "relative":
@@ -220,40 +224,76 @@ class FlexVideoFrameBlend(FlexVideoBase):
         max_offset = num_frames // 2
         frame_offsets = (adjusted_offset_ratio * max_offset).astype(int)
 
-        self.start_progress(num_frames)
-        for idx in range(num_frames):
-            current_frame = video[idx]
-            
-            forward_idx = min(idx + frame_offsets[idx], num_frames - 1)
-            backward_idx = max(idx - frame_offsets[idx], 0)
-            
-            forward_frame = video[forward_idx]
-            backward_frame = video[backward_idx]
+        # Output frames follow the feature length; input frames wrap when the video is shorter
+        frame_range = np.arange(start, end) % num_frames
+        forward_indices = np.minimum(frame_range + frame_offsets, num_frames - 1)
+        backward_indices = np.maximum(frame_range - frame_offsets, 0)
+        # Odd Gaussian kernel size per frame, 1 means no blur
+        blur_sizes = np.where(adjusted_motion_blur > 0, (adjusted_motion_blur * 10).astype(int) * 2 + 1, 1)
+
+        device = mm.get_torch_device()
+
+        def per_frame(values):
+            return torch.as_tensor(values, dtype=torch.float32, device=device).view(-1, 1, 1, 1)
+
+        current_frames = video[torch.from_numpy(frame_range)].to(device)
+        forward_frames = video[torch.from_numpy(forward_indices)].to(device)
+        backward_frames = video[torch.from_numpy(backward_indices)].to(device)
+
+        # Blend based on direction bias
+        bias = per_frame(adjusted_direction_bias)
+        blend_frames = bias * forward_frames + (1 - bias) * backward_frames
+        blend_amount = per_frame(adjusted_blend)
+
+        # Apply blend mode
+        if blend_mode == "additive":
+            blended = torch.clamp(current_frames + blend_frames * blend_amount, 0.0, 1.0)
+        elif blend_mode == "multiply":
+            blended = current_frames * (1 + (blend_frames - 0.5) * 2 * blend_amount)
+        elif blend_mode == "screen":
+            blended = 1 - (1 - current_frames) * (1 - blend_frames * blend_amount)
+        else:  # normal blend
+            blended = (1 - blend_amount) * current_frames + blend_amount * blend_frames
+
+        # Apply motion blur, one separable convolution per distinct kernel size in the chunk
+        for ksize in np.unique(blur_sizes):
+            if ksize <= 1:
+                continue
+            selected = torch.from_numpy(np.nonzero(blur_sizes == ksize)[0]).to(device)
+            blended[selected] = _gaussian_blur_nhwc(blended[selected], int(ksize))
+
+        return torch.clamp(blended, 0.0, 1.0).to(video.device)
+
+
+# cv2.getGaussianKernel uses these fixed kernels for small sizes when sigma <= 0
+_SMALL_GAUSSIAN_KERNELS = {
+    3: [0.25, 0.5, 0.25],
+    5: [0.0625, 0.25, 0.375, 0.25, 0.0625],
+    7: [0.03125, 0.109375, 0.21875, 0.28125, 0.21875, 0.109375, 0.03125],
+}
 
-            # Blend based on direction bias
-            blend_frame = adjusted_direction_bias[idx] * forward_frame + (1 - adjusted_direction_bias[idx]) * backward_frame
-            
-            # Apply blend mode
-            if blend_mode == "additive":
-                blended_frame = np.clip(current_frame + blend_frame * adjusted_blend[idx], 0.0, 1.0)
-            elif blend_mode == "multiply":
-                blended_frame = current_frame * (1 + (blend_frame - 0.5) * 2 * adjusted_blend[idx])
-            elif blend_mode == "screen":
-                blended_frame = 1 - (1 - current_frame) * (1 - blend_frame * adjusted_blend[idx])
-            else:  # normal blend
-                blended_frame = (1 - adjusted_blend[idx]) * current_frame + adjusted_blend[idx] * blend_frame
-
-            # Apply motion blur
-            if adjusted_motion_blur[idx] > 0:
-                blur_strength = int(adjusted_motion_blur[idx] * 10) * 2 + 1  # Ensure odd number
-                blended_frame = cv2.GaussianBlur(blended_frame, (blur_strength, blur_strength), 0)
-
-            processed_video[idx] = np.clip(blended_frame, 0.0, 1.0)
-            
-            self.update_progress()
-        self.end_progress()
 
-        return processed_video
+def _gaussian_blur_nhwc(frames: torch.Tensor, ksize: int) -> torch.Tensor:
+    """Batched equivalent of cv2.GaussianBlur(frame, (ksize, ksize), 0) for (N, H, W, C) tensors."""
+    if ksize in _SMALL_GAUSSIAN_KERNELS:
+        kernel = torch.tensor(_SMALL_GAUSSIAN_KERNELS[ksize], dtype=frames.dtype, device=frames.device)
+    else:
+        sigma = 0.3 * ((ksize - 1) * 0.5 - 1) + 0.8
+        x = torch.arange(ksize, dtype=frames.dtype, device=frames.device) - (ksize - 1) / 2
+        kernel = torch.exp(-(x ** 2) / (2 * sigma ** 2))
+        kernel = kernel / kernel.sum()
+
+    channels = frames.shape[-1]
+    pad = ksize // 2
+    x = frames.permute(0, 3, 1, 2)
+    # cv2's default border (BORDER_REFLECT_101) is torch's "reflect" padding, which needs the
+    # pad to be smaller than the frame; tiny frames fall back to edge replication
+    height, width = x.shape[-2:]
+    mode = "reflect" if pad < min(height, width) else "replicate"
+    x = torch.nn.functional.pad(x, (pad, pad, pad, pad), mode=mode)
+    x = torch.nn.functional.conv2d(x, kernel.view(1, 1, 1, -1).repeat(channels, 1, 1, 1), groups=channels)
+    x = torch.nn.functional.conv2d(x, kernel.view(1, 1, -1, 1).repeat(channels, 1, 1, 1), groups=channels)
+    return x.permute(0, 2, 3, 1)
 
 NODE_CLASS_MAPPINGS = {
     "FlexVideoSpeed": FlexVideoSpeed,
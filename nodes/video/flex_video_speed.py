@@ -1,14 +1,15 @@
 import os
 import torch
+from collections import OrderedDict
 from urllib.parse import urlparse
 from torch.hub import download_url_to_file, get_dir
 import folder_paths
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 import torch
 from .vfi_utils import preprocess_frames, postprocess_frames
 from .video_base import FlexVideoBase
 import numpy as np
-from scipy.interpolate import interp1d
 from ..masks.mask_utils import calculate_optical_flow
 import cv2
 import comfy.model_management as mm
@@ -25,6 +26,37 @@ RIFE_CKPT_NAME_VER_DICT = {
     "rife49.pth": "4.7",
 }
 
+# Maximum number of interpolated frames sent through RIFE in one forward pass
+RIFE_BATCH_SIZE = 8
+
+# Output frames computed per step by linear interpolation
+LINEAR_INTERPOLATION_CHUNK = 32
+
+# Worker threads computing optical flow for distinct source frame pairs
+OPTICAL_FLOW_WORKERS = min(4, os.cpu_count() or 1)
+
+# Loaded RIFE models kept on the CPU by checkpoint path, least recently used first.
+# They are moved to the torch device only for the duration of an interpolation.
+RIFE_MODEL_CACHE_SIZE = 2
+_RIFE_MODEL_CACHE = OrderedDict()
+
+
+def get_rife_model(model_path, arch_ver):
+    model = _RIFE_MODEL_CACHE.get(model_path)
+    if model is not None:
+        _RIFE_MODEL_CACHE.move_to_end(model_path)
+        return model
+
+    from .rife_arch import IFNet
+    model = IFNet(arch_ver=arch_ver)
+    model.load_state_dict(torch.load(model_path, map_location="cpu"))
+    model.eval()
+    _RIFE_MODEL_CACHE[model_path] = model
+    while len(_RIFE_MODEL_CACHE) > RIFE_MODEL_CACHE_SIZE:
+        _RIFE_MODEL_CACHE.popitem(last=False)
+    return model
+
+
 @apply_tooltips
 class FlexVideoSpeed(FlexVideoBase):
     @classmethod
@@ -41,6 +73,7 @@ class FlexVideoSpeed(FlexVideoBase):
                 "fast_mode": ("BOOLEAN", {"default": True}),
                 "ensemble": ("BOOLEAN", {"default": True}),
                 "scale_factor": ([0.25, 0.5, 1.0, 2.0, 4.0], {"default": 1.0}),
+                "bidirectional_flow": ("BOOLEAN", {"default": False}),
             }
         }
     
@@ -50,7 +83,7 @@ class FlexVideoSpeed(FlexVideoBase):
 
     def apply_effect_internal(self, video: np.ndarray, feature_values: np.ndarray, 
                               speed_factor: np.ndarray, interpolation_mode: str, fast_mode: bool, ensemble: bool, 
-                              scale_factor: float, opt_feature=None, **kwargs):
+                              scale_factor: float, bidirectional_flow: bool = False, opt_feature=None, **kwargs):
         num_frames = video.shape[0]
         frame_rate = opt_feature.frame_rate
         total_duration = num_frames / frame_rate
@@ -90,7 +123,7 @@ class FlexVideoSpeed(FlexVideoBase):
         elif interpolation_mode in ["rife47", "rife49"]:
             adjusted_video = self.rife_interpolation(video, frame_indices, interpolation_mode, fast_mode, ensemble, scale_factor)
         elif interpolation_mode in ["Farneback", "LucasKanade", "PyramidalLK"]:
-            adjusted_video = self.calculate_optical_flow(video, frame_indices, interpolation_mode)
+            adjusted_video = self.calculate_optical_flow(video, frame_indices, interpolation_mode, bidirectional_flow)
         else:  # "none"
             adjusted_video = self.no_interpolation(video, frame_indices)
 
@@ -100,102 +133,167 @@ class FlexVideoSpeed(FlexVideoBase):
         return video[np.round(frame_indices).astype(int)]
 
     def linear_interpolation(self, video, frame_indices):
-        num_frames, height, width, channels = video.shape
-        
-        # Create interpolation functions for each channel
-        interp_funcs = []
-        self.start_progress(channels)
-        for c in range(channels):
-            interp_func = interp1d(np.arange(num_frames), video[:, :, :, c], axis=0, kind='linear')
-            interp_funcs.append(interp_func)
-            self.update_progress()
+        num_frames = video.shape[0]
+
+        # Gather the two neighbouring source frames and lerp, writing chunk by chunk
+        # into a float32 output so peak memory stays close to the output size.
+        lower = np.clip(np.floor(frame_indices).astype(int), 0, num_frames - 1)
+        upper = np.minimum(lower + 1, num_frames - 1)
+        weights = (frame_indices - lower).astype(np.float32)
+
+        output = np.empty((len(frame_indices),) + video.shape[1:], dtype=np.float32)
+
+        self.start_progress(len(frame_indices))
+        for start in range(0, len(frame_indices), LINEAR_INTERPOLATION_CHUNK):
+            end = min(start + LINEAR_INTERPOLATION_CHUNK, len(frame_indices))
+            out = output[start:end]
+            base = video[lower[start:end]]
+            np.subtract(video[upper[start:end]], base, out=out)
+            out *= weights[start:end, None, None, None]
+            out += base
+            np.clip(out, 0, 1, out=out)
+            self.update_progress(end - start)
         self.end_progress()
-        
-        # Apply interpolation
-        interpolated_frames = np.stack([func(frame_indices) for func in interp_funcs], axis=-1)
-        
-        return np.clip(interpolated_frames, 0, 1)
 
-    def calculate_optical_flow(self, video, frame_indices, interpolation_mode):
+        return output
+
+    def calculate_optical_flow(self, video, frame_indices, interpolation_mode, bidirectional_flow=False):
         num_frames, height, width, channels = video.shape
-        interpolated_frames = []
-
-        self.start_progress(len(frame_indices) - 1)
-        for i in range(len(frame_indices) - 1):
-            idx1, idx2 = int(frame_indices[i]), int(frame_indices[i + 1])
-            frame1, frame2 = video[idx1], video[idx2]
-            
-            if idx1 == idx2:
-                interpolated_frames.append(frame1)
-            else:
-                # Convert frames to 8-bit unsigned integer format
-
-
-                flow = calculate_optical_flow(frame1, frame2, interpolation_mode)
-                
-                # Calculate the fractional part for interpolation
-                frac = frame_indices[i] - idx1
-                
-                # Perform the interpolation
-                h, w = flow.shape[:2]
-                flow_x, flow_y = flow[:,:,0], flow[:,:,1]
-                x, y = np.meshgrid(np.arange(w), np.arange(h))
-                
-                interp_x = np.clip(x + frac * flow_x, 0, w - 1).astype(np.float32)
-                interp_y = np.clip(y + frac * flow_y, 0, h - 1).astype(np.float32)
-                
-                interpolated_frame = cv2.remap(frame1, interp_x, interp_y, cv2.INTER_LINEAR)
-                interpolated_frames.append(interpolated_frame)
-            
-            self.update_progress()
-        
+        num_out = len(frame_indices) - 1
+        interpolated_frames = np.empty((num_out,) + video.shape[1:], dtype=np.float32)
+
+        idx1 = frame_indices[:-1].astype(int)
+        idx2 = frame_indices[1:].astype(int)
+        fracs = (frame_indices[:-1] - idx1).astype(np.float32)
+
+        self.start_progress(num_out)
+
+        same = idx1 == idx2
+        interpolated_frames[same] = video[idx1[same]]
+        self.update_progress(int(same.sum()))
+
+        # Shared pixel grid, normalized to grid_sample's [-1, 1] range (align_corners=True
+        # matches cv2.remap pixel centers); flows are scaled into the same units.
+        ys, xs = torch.meshgrid(torch.arange(height, dtype=torch.float32), torch.arange(width, dtype=torch.float32), indexing="ij")
+        base_grid = torch.stack([xs, ys], dim=-1)
+        pixel_scale = torch.tensor([max(width - 1, 1), max(height - 1, 1)], dtype=torch.float32)
+        video_tensor = torch.from_numpy(video).float()
+
+        def warp(source_index, flow, frac_values):
+            # Sample the source frame at x + frac * flow for every frac in one pass
+            frac_tensor = torch.from_numpy(frac_values).view(-1, 1, 1, 1)
+            coords = base_grid.unsqueeze(0) + frac_tensor * torch.from_numpy(flow).float().unsqueeze(0)
+            coords = torch.minimum(torch.clamp(coords, min=0), pixel_scale)
+            grid = coords / pixel_scale * 2.0 - 1.0
+            source = video_tensor[source_index].permute(2, 0, 1).unsqueeze(0).expand(len(frac_values), -1, -1, -1)
+            warped = torch.nn.functional.grid_sample(source, grid, mode="bilinear", padding_mode="border", align_corners=True)
+            return warped.permute(0, 2, 3, 1).numpy()
+
+        def compute_flows(pair):
+            first, second = video[pair[0]], video[pair[1]]
+            forward = calculate_optical_flow(first, second, interpolation_mode)
+            backward = calculate_optical_flow(second, first, interpolation_mode) if bidirectional_flow else None
+            return forward, backward
+
+        # Flow is computed once per unique source pair; pairs are processed in
+        # windows across worker threads so only a few flow fields are alive at once.
+        moving = np.nonzero(~same)[0]
+        pairs = np.stack([idx1[moving], idx2[moving]], axis=1)
+        unique_pairs, pair_ids = np.unique(pairs, axis=0, return_inverse=True)
+        pair_ids = pair_ids.reshape(-1)
+
+        workers = max(1, min(OPTICAL_FLOW_WORKERS, len(unique_pairs)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for window_start in range(0, len(unique_pairs), workers):
+                window = unique_pairs[window_start:window_start + workers]
+                for offset, (forward, backward) in enumerate(executor.map(compute_flows, window)):
+                    pair_id = window_start + offset
+                    first, second = window[offset]
+                    outputs = moving[pair_ids == pair_id]
+                    frac_values = fracs[outputs]
+
+                    warped = warp(first, forward, frac_values)
+                    if backward is not None:
+                        warped_back = warp(second, backward, 1.0 - frac_values)
+                        weight = frac_values[:, None, None, None]
+                        warped = warped * (1.0 - weight) + warped_back * weight
+
+                    interpolated_frames[outputs] = warped
+                    self.update_progress(len(outputs))
+
         self.end_progress()
-        
-        return np.array(interpolated_frames)
 
-    def rife_interpolation(self, video, frame_indices, interpolation_mode, fast_mode, ensemble, scale_factor):
-        from .rife_arch import IFNet
-        import comfy.model_management as mm
+        return interpolated_frames
 
+    def rife_interpolation(self, video, frame_indices, interpolation_mode, fast_mode, ensemble, scale_factor):
         ckpt_name = f"{interpolation_mode}.pth"
         model_path = self.load_file_from_github_release("rife", ckpt_name)
         arch_ver = RIFE_CKPT_NAME_VER_DICT[ckpt_name]
-        
+
         device = mm.get_torch_device()
-        interpolation_model = IFNet(arch_ver=arch_ver)
-        interpolation_model.load_state_dict(torch.load(model_path))
-        interpolation_model.eval().to(device)
-        
-        # Input video is already in BHWC format, so we don't need to permute
-        video_tensor = torch.from_numpy(video).float() / 255.0
-        video_tensor = preprocess_frames(video_tensor).to(device)
-        
+        interpolation_model = get_rife_model(model_path, arch_ver)
+        # Let ComfyUI offload other models if the device is short on memory, and give the VRAM back afterwards
+        model_bytes = sum(p.numel() * p.element_size() for p in interpolation_model.parameters())
+        mm.free_memory(model_bytes, device)
+        interpolation_model.to(device)
+        try:
+            return self._rife_interpolate_frames(interpolation_model, device, video, frame_indices, fast_mode, ensemble, scale_factor)
+        finally:
+            interpolation_model.to("cpu")
+            mm.soft_empty_cache()
+
+    def _rife_interpolate_frames(self, interpolation_model, device, video, frame_indices, fast_mode, ensemble, scale_factor):
+        """Run RIFE for every fractional frame index with a model already on `device`."""
+        # Input video is already in BHWC format, so we don't need to permute.
+        # Frames stay on the CPU and only the pair being interpolated is moved to the device.
+        video_tensor = preprocess_frames(torch.from_numpy(video).float() / 255.0)
+        num_out = len(frame_indices)
+        _, channels, height, width = video_tensor.shape
+        interpolated_video = torch.empty((num_out, channels, height, width), dtype=video_tensor.dtype)
+
         scale_list = [8 / scale_factor, 4 / scale_factor, 2 / scale_factor, 1 / scale_factor]
-        
-        interpolated_frames = []
-        self.start_progress(len(frame_indices))
-        
-        for i in range(len(frame_indices)):
-            current_idx = frame_indices[i]
-            lower_idx = int(np.floor(current_idx))
-            upper_idx = int(np.ceil(current_idx))
-            
-            if lower_idx == upper_idx:
-                interpolated_frames.append(video_tensor[lower_idx:lower_idx+1])
-            else:
-                frame1 = video_tensor[lower_idx:lower_idx+1]
-                frame2 = video_tensor[upper_idx:upper_idx+1]
-                timestep = current_idx - lower_idx
-                middle_frame = interpolation_model(frame1, frame2, timestep, scale_list, fast_mode, ensemble)
-                interpolated_frames.append(middle_frame)
-            
-            self.update_progress()
-        
+
+        lower_indices = np.floor(frame_indices).astype(int)
+        upper_indices = np.ceil(frame_indices).astype(int)
+        timesteps = frame_indices - lower_indices
+
+        self.start_progress(num_out)
+
+        exact = lower_indices == upper_indices
+        interpolated_video[torch.from_numpy(np.nonzero(exact)[0])] = video_tensor[torch.from_numpy(lower_indices[exact])]
+        self.update_progress(int(exact.sum()))
+
+        # Output frames that share a source pair differ only by timestep, so each
+        # pair is uploaded once and its timesteps are run as one batch.
+        pairs = np.stack([lower_indices, upper_indices], axis=1)[~exact]
+        positions = np.nonzero(~exact)[0]
+        unique_pairs, pair_ids = np.unique(pairs, axis=0, return_inverse=True)
+        pair_ids = pair_ids.reshape(-1)
+
+        with torch.no_grad():
+            for pair_id, (lower_idx, upper_idx) in enumerate(unique_pairs):
+                pair_positions = positions[pair_ids == pair_id]
+                frame1 = video_tensor[lower_idx:lower_idx + 1].to(device)
+                frame2 = video_tensor[upper_idx:upper_idx + 1].to(device)
+                for start in range(0, len(pair_positions), RIFE_BATCH_SIZE):
+                    chunk = pair_positions[start:start + RIFE_BATCH_SIZE]
+                    batch = len(chunk)
+                    timestep = torch.from_numpy(timesteps[chunk]).float().to(device).view(batch, 1, 1, 1)
+                    middle_frames = interpolation_model(
+                        frame1.expand(batch, -1, -1, -1),
+                        frame2.expand(batch, -1, -1, -1),
+                        timestep,
+                        scale_list,
+                        fast_mode,
+                        ensemble,
+                    )
+                    interpolated_video[torch.from_numpy(chunk)] = middle_frames.float().cpu()
+                    self.update_progress(batch)
+
         self.end_progress()
-        
-        interpolated_video = torch.cat(interpolated_frames, dim=0)
+
         # Ensure output is in BHWC format and convert back to numpy array
-        return (postprocess_frames(interpolated_video).cpu() * 255.0).numpy()
+        return (postprocess_frames(interpolated_video) * 255.0).numpy()
 
     @staticmethod
     def get_ckpt_container_path(model_type):
@@ -1,3 +1,5 @@
+import queue
+import threading
 import torch
 import numpy as np
 from abc import ABC, abstractmethod
@@ -22,24 +24,73 @@ class FlexVideoBase(FlexBase, ABC):
     RETURN_TYPES = ("IMAGE",)
     FUNCTION = "apply_effect"
 
+    # Effects that set this implement apply_effect_chunk(video, start, end, **kwargs), returning
+    # output frames [start, end) given the full input video and per-frame kwargs (feature_values,
+    # strength, modulated params) covering only that chunk
+    SUPPORTS_PIPELINE = False
+    PIPELINE_CHUNK_SIZE = 16
+
     def apply_effect(self, images, strength, feature_mode, feature_threshold, feature_param, opt_feature=None, **kwargs):
-        images_np = images.cpu().numpy()
-        
         # Get feature length first
         if opt_feature is not None:
             num_frames = opt_feature.frame_count
         else:
-            num_frames = images_np.shape[0]  # Fallback to video length if no feature
+            num_frames = images.shape[0]  # Fallback to video length if no feature
 
         self.start_progress(num_frames, desc=f"Applying {self.__class__.__name__}")
 
+        # Effects that process frame chunks independently overlap parameter resolution with compute
+        if self.SUPPORTS_PIPELINE:
+            result_tensor = self._apply_effect_pipelined(
+                images, num_frames, strength, feature_mode, feature_threshold, feature_param, opt_feature, **kwargs
+            )
+            self.end_progress()
+            return (result_tensor,)
+
+        feature_values, processed_kwargs = self._resolve_parameters(
+            0, num_frames, strength, feature_mode, feature_threshold, feature_param, opt_feature, **kwargs
+        )
+
+        # Effects that only reorder frames gather straight from the input tensor
+        frame_indices = self.compute_frame_indices(
+            images.shape[0],
+            feature_values=feature_values,
+            opt_feature=opt_feature,
+            **processed_kwargs
+        )
+        if frame_indices is not None:
+            self.end_progress()
+            index = torch.from_numpy(np.asarray(frame_indices, dtype=np.int64)).to(images.device)
+            return (torch.index_select(images, 0, index),)
+
+        # Let child classes handle the video processing and threshold checks
+        processed_video = self.apply_effect_internal(
+            images.cpu().numpy(),
+            feature_values=feature_values,
+            opt_feature=opt_feature,
+            **processed_kwargs
+        )
+
+        self.end_progress()
+
+        # Convert to tensor and ensure BHWC format
+        result_tensor = torch.from_numpy(processed_video).float()
+        if result_tensor.shape[1] == 3:  # If in BCHW format, convert to BHWC
+            result_tensor = result_tensor.permute(0, 2, 3, 1)
+
+        return (result_tensor,)
+
+    def _resolve_parameters(self, start, end, strength, feature_mode, feature_threshold, feature_param, opt_feature=None, **kwargs):
+        """Resolve feature values and per-frame parameters for frames [start, end)."""
+        num_frames = end - start
+
         # Handle non-array parameters directly
         processed_kwargs = {k: v for k, v in kwargs.items() 
                           if not isinstance(v, (list, tuple, np.ndarray))}
         
         # Process parameters frame by frame and collect feature values
         feature_values = []
-        for i in range(num_frames):  # Now using feature length!
+        for i in range(start, end):  # Now using feature length!
             feature_value = self.get_feature_value(i, opt_feature)
             feature_value = 0.5 if feature_value is None else feature_value
             feature_values.append(feature_value)
@@ -72,27 +123,84 @@ class FlexVideoBase(FlexBase, ABC):
         feature_threshold = np.asarray(feature_threshold)
         if strength.ndim == 0:
             strength = np.full(num_frames, strength)
+        else:
+            strength = strength[start:end]
         if feature_threshold.ndim == 0:
             feature_threshold = np.full(num_frames, feature_threshold)
+        else:
+            feature_threshold = feature_threshold[start:end]
         processed_kwargs['strength'] = strength
         processed_kwargs['feature_threshold'] = feature_threshold
 
-        # Let child classes handle the video processing and threshold checks
-        processed_video = self.apply_effect_internal(
-            images_np,
-            feature_values=feature_values,
-            opt_feature=opt_feature,
-            **processed_kwargs
-        )
+        return feature_values, processed_kwargs
 
-        self.end_progress()
+    def _apply_effect_pipelined(self, images, num_frames, strength, feature_mode, feature_threshold, feature_param, opt_feature=None, **kwargs):
+        """Run apply_effect_chunk over num_frames output frames while a producer thread resolves the next chunks' parameters.
 
-        # Convert to tensor and ensure BHWC format
-        result_tensor = torch.from_numpy(processed_video).float()
-        if result_tensor.shape[1] == 3:  # If in BCHW format, convert to BHWC
-            result_tensor = result_tensor.permute(0, 2, 3, 1)
+        get_feature_value and process_parameters run on the producer thread concurrently with
+        apply_effect_chunk, so effects that set SUPPORTS_PIPELINE must not mutate state in one
+        that the other reads. The first chunk is resolved on the calling thread, so lazy setup
+        in process_parameters (the parameter scheduler) happens before the producer starts.
+        """
+        chunk_size = max(1, int(kwargs.get("chunk_size", self.PIPELINE_CHUNK_SIZE)))
+        output = images.new_empty((num_frames, *images.shape[1:]))
 
-        return (result_tensor,)
+        # A small bound keeps the producer a couple of chunks ahead without resolving the whole clip up front
+        chunks = queue.Queue(maxsize=2)
+        stop = threading.Event()
+
+        first_end = min(chunk_size, num_frames)
+        chunks.put((0, first_end, *self._resolve_parameters(
+            0, first_end, strength, feature_mode, feature_threshold, feature_param, opt_feature, **kwargs
+        )))
+
+        def produce():
+            try:
+                for start in range(first_end, num_frames, chunk_size):
+                    if stop.is_set():
+                        return
+                    end = min(start + chunk_size, num_frames)
+                    feature_values, chunk_kwargs = self._resolve_parameters(
+                        start, end, strength, feature_mode, feature_threshold, feature_param, opt_feature, **kwargs
+                    )
+                    chunks.put((start, end, feature_values, chunk_kwargs))
+                chunks.put(None)
+            except Exception as e:
+                chunks.put(e)
+
+        producer = threading.Thread(target=produce, name=f"{self.__class__.__name__}-params", daemon=True)
+        producer.start()
+        try:
+            while True:
+                item = chunks.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                start, end, feature_values, chunk_kwargs = item
+                result = self.apply_effect_chunk(
+                    images, start, end,
+                    feature_values=feature_values,
+                    opt_feature=opt_feature,
+                    **chunk_kwargs
+                )
+                output[start:end].copy_(result)
+                self.update_progress(end - start)
+        finally:
+            # Unblock the producer if the consumer stopped early
+            stop.set()
+            while producer.is_alive():
+                try:
+                    chunks.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            producer.join()
+
+        return output
+
+    def compute_frame_indices(self, num_input_frames: int, **kwargs):
+        """Return source frame indices for effects that only remap frames, or None to use apply_effect_internal."""
+        return None
 
     @abstractmethod
     def apply_effect_internal(self, video: np.ndarray, **kwargs) -> np.ndarray:
@@ -68,7 +68,7 @@ Each node type has different parameters that can be modulated:
     TooltipManager.register_tooltips("FlexImageColorGrade", {
         "intensity": "Strength of the color grading effect (0.0 to 1.0)",
         "mix": "Blend factor between original and graded image (0.0 to 1.0)",
-        "lut_file": "Path to the LUT file",
+        "lut_file": "Path to a .cube 3D/1D LUT, a HALD CLUT image, or a 256 entry LUT image",
         "feature_param": """Choose which parameter to modulate:
         
 - intensity: Dynamically adjust grading strength
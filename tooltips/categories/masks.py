@@ -121,7 +121,11 @@ Each node type has different parameters that can be modulated:
         "gravity": "Vertical gravity in pixels/sec² (-2000.0 to 2000.0)",
         "frame_rate": "Simulation frame rate for time step (1.0 to 120.0)",
         "start_frame": "Frame to start emission (0 to 10000)",
-        "end_frame": "Frame to end emission (0 to 10000, 0 means until end)"
+        "end_frame": "Frame to end emission (0 to 10000, 0 means until end)",
+        "random_seed": "Seed for particle spread and emission offsets; the same seed reproduces the same simulation. 0 picks a new random seed every run and disables checkpoints",
+        "frame_offset": "Timeline frame of the first input mask. Earlier frames are simulated (or resumed from a checkpoint) but not rendered, for chunked renders of long clips",
+        "checkpoint_interval": "Save a simulation checkpoint every N frames (0 disables). Later runs with the same emitters and settings resume from the nearest one",
+        "checkpoint_dir": "Optional directory for on-disk .npz checkpoints; empty keeps checkpoints in memory only. The directory is capped at 2 GB, dropping the least recently used checkpoints first"
     }, inherits_from='MaskBase', description="Taichi-accelerated particle emission mask with audio-reactive emission support. Tips: raise particle_count for density, adjust frame_rate for speed, and use emitter-level particle_lifetime to override the global lifetime.")
 
     # TaichiParticleEmitter tooltips
@@ -337,7 +341,13 @@ Each node type has different parameters that can be modulated:
 
     # TaichiResetCache tooltips
     TooltipManager.register_tooltips("TaichiResetCache", {
-    }, description="Reset cached Taichi particle buffers to free GPU/CPU memory. Tip: use after changing resolution or particle_count.")
+        "action": "What to do with the Taichi system pool ('reset' frees all systems, 'stats' only reports, 'warm_up' pre-allocates and compiles a system)",
+        "max_pool_entries": "Maximum number of (resolution, capacity) systems kept in the pool (1 to 32)",
+        "memory_budget_mb": "Memory budget for pooled particle buffers in MB; least recently used systems are evicted above it",
+        "warm_up_width": "Width of the system to pre-allocate when action is 'warm_up'",
+        "warm_up_height": "Height of the system to pre-allocate when action is 'warm_up'",
+        "warm_up_particle_count": "Particle count of the system to pre-allocate when action is 'warm_up'"
+    }, description="Manage the pool of cached Taichi particle systems. Outputs pool statistics as JSON. Tips: warm up preview and final resolutions before rendering, and reset after large renders to free GPU/CPU memory.")
 
     # ParticleSystemModulatorBase tooltips (inherits from: RyanOnTheInside)
     TooltipManager.register_tooltips("ParticleSystemModulatorBase", {
@@ -535,7 +545,8 @@ Each node type has different parameters that can be modulated:
         "red": "Red component of target color (0 to 255)",
         "green": "Green component of target color (0 to 255)",
         "blue": "Blue component of target color (0 to 255)",
-        "threshold": "Color matching tolerance (0 to 127)"
+        "threshold": "Color matching tolerance (0 to 127). In rgb mode this is the per-channel difference in 8-bit levels, in hsv mode the distance on the HSV cone in 8-bit levels, and in lab mode the CIE76 delta E",
+        "tolerance_mode": "How color distance is measured: 'rgb' (per-channel box), 'hsv' (hue-aware, wraps around the color wheel), or 'lab' (perceptual delta E)"
     })
 
     # MaskCompositePlus tooltips
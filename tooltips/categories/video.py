@@ -35,7 +35,8 @@ def register_tooltips():
         "frame_offset_ratio": "Ratio of frame offset for blending (0.0 to 1.0)",
         "direction_bias": "Bias for blending direction (0.0 to 1.0)",
         "blend_mode": "Mode for frame blending ('normal', 'additive', 'multiply', 'screen')",
-        "motion_blur_strength": "Strength of motion blur effect (0.0 to 1.0)"
+        "motion_blur_strength": "Strength of motion blur effect (0.0 to 1.0)",
+        "chunk_size": "Number of frames blended together on the device at once; lower it to reduce peak memory"
     }, inherits_from='FlexVideoBase')
 
     # FlexVideoSpeed tooltips (inherits from: FlexVideoBase)
@@ -44,5 +45,6 @@ def register_tooltips():
         "interpolation_mode": "Method for frame interpolation ('none', 'linear', 'Farneback', 'rife47', 'rife49')",
         "fast_mode": "Enable fast processing mode for RIFE interpolation",
         "ensemble": "Enable ensemble mode for better quality in RIFE interpolation",
-        "scale_factor": "Scale factor for processing (0.25, 0.5, 1.0, 2.0, 4.0)"
+        "scale_factor": "Scale factor for processing (0.25, 0.5, 1.0, 2.0, 4.0)",
+        "bidirectional_flow": "For optical flow modes, also warp the next frame backwards and blend both warps by the fractional position"
     }, inherits_from='FlexVideoBase')